@@ -4,7 +4,7 @@ import asyncio
 import logging
 import time
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 import invidious_proxy
 from converters import resolve_invidious_url
@@ -126,6 +126,36 @@ class AvatarCache:
         except Exception as e:
             logger.error(f"[AvatarCache] Unexpected error scheduling fetch for {channel_id}: {e}", exc_info=True)
 
+    def schedule_background_fetch_many(self, channel_ids: Iterable[str]) -> int:
+        """Schedule background fetches for several channel avatars.
+
+        Same skips as schedule_background_fetch, but the Invidious check and logging happen once
+        for the whole batch. Returns the number of fetches scheduled.
+        """
+        if not invidious_proxy.is_enabled():
+            logger.warning("[AvatarCache] Invidious proxy not enabled, skipping avatar fetches")
+            return 0
+
+        to_fetch = []
+        for channel_id in dict.fromkeys(channel_ids):
+            if channel_id in self._pending:
+                continue
+            cached = self._cache.get(channel_id)
+            if cached and not cached.is_expired():
+                continue
+            to_fetch.append(channel_id)
+
+        try:
+            for channel_id in to_fetch:
+                asyncio.create_task(self._background_fetch(channel_id))
+        except RuntimeError as e:
+            logger.error(f"[AvatarCache] Failed to create background tasks: {e}")
+            return 0
+
+        if to_fetch:
+            logger.info(f"[AvatarCache] Scheduled {len(to_fetch)} background avatar fetches")
+        return len(to_fetch)
+
     async def _background_fetch(self, channel_id: str):
         """Background task to fetch and cache avatar with rate limiting."""
         async with self._fetch_semaphore:
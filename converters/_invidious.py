@@ -77,7 +77,7 @@ def invidious_to_video_response(
         if s.invidious_proxy_thumbnails and base_url:
             url = _convert_invidious_thumbnail_to_proxy(url, base_url, token=thumbnail_token or "")
         video_thumbnails.append(
-            Thumbnail(
+            Thumbnail.model_construct(
                 quality=thumb.get("quality", "default"), url=url, width=thumb.get("width"), height=thumb.get("height")
             )
         )
@@ -88,7 +88,7 @@ def invidious_to_video_response(
         if s.invidious_proxy_thumbnails and base_url:
             url = _convert_invidious_thumbnail_to_proxy(url, base_url, token=thumbnail_token or "")
         author_thumbnails.append(
-            Thumbnail(
+            Thumbnail.model_construct(
                 quality=thumb.get("quality", "default"), url=url, width=thumb.get("width"), height=thumb.get("height")
             )
         )
@@ -279,7 +279,7 @@ def invidious_to_video_list_item(info: dict, invidious_base_url: str = "") -> Vi
     thumbnails = []
     for thumb in info.get("videoThumbnails", []):
         thumbnails.append(
-            Thumbnail(
+            Thumbnail.model_construct(
                 quality=thumb.get("quality", "default"),
                 url=resolve_invidious_url(thumb.get("url", ""), invidious_base_url),
                 width=thumb.get("width"),
@@ -341,7 +341,7 @@ def invidious_to_channel_list_item(info: dict, invidious_base_url: str = "") ->
     thumbnails = []
     for thumb in info.get("authorThumbnails", []):
         thumbnails.append(
-            Thumbnail(
+            Thumbnail.model_construct(
                 quality=thumb.get("quality", "default"),
                 url=resolve_invidious_url(thumb.get("url", ""), invidious_base_url),
                 width=thumb.get("width"),
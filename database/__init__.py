@@ -1,15 +1,18 @@
 """Database package."""
 
-from database.connection import DB_PATH, get_connection, get_db_path
+from database.connection import DB_PATH, get_connection, get_db_path, optimize_db, transaction
 
 __all__ = [
     # connection
     "DB_PATH",
     "get_connection",
     "get_db_path",
+    "optimize_db",
+    "transaction",
     # schema
     "init_db",
     # feed
+    "CachedVideo",
     "cleanup_old_cached_videos",
     "cleanup_orphaned_cached_videos",
     "cleanup_stale_watched_channels",
@@ -26,9 +29,11 @@ __all__ = [
     "upsert_cached_videos",
     "upsert_watched_channels",
     # settings
+    "get_provisioning_fingerprint",
     "get_settings_row",
     "is_basic_auth_enabled",
     "set_basic_auth_enabled",
+    "set_provisioning_fingerprint",
     "update_settings",
     # sites
     "add_credential",
@@ -47,6 +52,7 @@ __all__ = [
     "count_users",
     "create_admin",
     "create_user",
+    "create_user_row",
     "delete_admin",
     "delete_user",
     "get_admin_by_id",
@@ -57,6 +63,7 @@ __all__ = [
     "get_user_by_username",
     "has_any_admin",
     "has_any_user",
+    "has_multiple_admins",
     "update_admin_last_login",
     "update_admin_password",
     "update_user",
@@ -64,6 +71,7 @@ __all__ = [
     "update_user_password",
 ]
 from database.repositories.feed import (
+    CachedVideo,
     cleanup_old_cached_videos,
     cleanup_orphaned_cached_videos,
     cleanup_stale_watched_channels,
@@ -81,9 +89,11 @@ from database.repositories.feed import (
     upsert_watched_channels,
 )
 from database.repositories.settings import (
+    get_provisioning_fingerprint,
     get_settings_row,
     is_basic_auth_enabled,
     set_basic_auth_enabled,
+    set_provisioning_fingerprint,
     update_settings,
 )
 from database.repositories.sites import (
@@ -104,6 +114,7 @@ from database.repositories.users import (
     count_users,
     create_admin,
     create_user,
+    create_user_row,
     delete_admin,
     delete_user,
     get_admin_by_id,
@@ -114,6 +125,7 @@ from database.repositories.users import (
     get_user_by_username,
     has_any_admin,
     has_any_user,
+    has_multiple_admins,
     update_admin_last_login,
     update_admin_password,
     update_user,
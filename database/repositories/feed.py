@@ -1,18 +1,66 @@
 """Feed and cached videos repository."""
 
-import json
 import logging
+import sqlite3
+from dataclasses import dataclass
 from datetime import UTC, datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
+
+import orjson
 
 from database.connection import get_connection
 
 logger = logging.getLogger(__name__)
 
 
-def upsert_cached_videos(channel_id: str, site: str, videos: List[Dict[str, Any]]):
-    """Insert or update cached videos for a channel. Replaces old videos to keep feed fresh."""
-    with get_connection() as conn:
+@dataclass(slots=True)
+class CachedVideo:
+    """A channel video as produced by the feed fetcher and stored in cached_videos."""
+
+    video_id: str
+    title: str = ""
+    author: str = ""
+    author_id: str = ""
+    length_seconds: int = 0
+    view_count: Optional[int] = None
+    published: Optional[int] = None
+    published_text: str = ""
+    thumbnail_url: str = ""
+    thumbnails: Optional[List[dict]] = None
+    video_url: str = ""
+
+    @classmethod
+    def from_dict(cls, video: Dict[str, Any]) -> "CachedVideo":
+        """Build from a video dict, using the same defaults as the dataclass."""
+        return cls(
+            video_id=video.get("video_id", ""),
+            title=video.get("title", ""),
+            author=video.get("author", ""),
+            author_id=video.get("author_id", ""),
+            length_seconds=video.get("length_seconds", 0),
+            view_count=video.get("view_count"),
+            published=video.get("published"),
+            published_text=video.get("published_text", ""),
+            thumbnail_url=video.get("thumbnail_url", ""),
+            thumbnails=video.get("thumbnails"),
+            video_url=video.get("video_url", ""),
+        )
+
+
+def upsert_cached_videos(
+    channel_id: str,
+    site: str,
+    videos: List[Union[CachedVideo, Dict[str, Any]]],
+    conn: Optional[sqlite3.Connection] = None,
+):
+    """Insert or update cached videos for a channel. Replaces old videos to keep feed fresh.
+
+    Videos may be CachedVideo instances or plain dicts with the same keys.
+    When conn is given, the caller owns the transaction and must commit it.
+    """
+    videos = [v if isinstance(v, CachedVideo) else CachedVideo.from_dict(v) for v in videos]
+    own_conn = conn is None
+    with get_connection(conn) as conn:
         cursor = conn.cursor()
 
         # Check how many old videos exist before deletion
@@ -43,7 +91,7 @@ def upsert_cached_videos(channel_id: str, site: str, videos: List[Dict[str, Any]
         unique_videos = []
         duplicate_count = 0
         for video in videos:
-            video_id = video.get("video_id", "")
+            video_id = video.video_id
             if video_id and video_id not in seen_video_ids:
                 seen_video_ids.add(video_id)
                 unique_videos.append(video)
@@ -54,38 +102,39 @@ def upsert_cached_videos(channel_id: str, site: str, videos: List[Dict[str, Any]
             logger.warning(f"Filtered {duplicate_count} duplicate video(s) for {channel_id} ({site})")
 
         # Insert all unique videos
-        new_count = 0
-        for video in unique_videos:
-            # Serialize thumbnail_data as JSON if present
-            thumbnail_data_json = json.dumps(video.get("thumbnails", [])) if video.get("thumbnails") else None
-
-            cursor.execute(
-                """
-                INSERT OR IGNORE INTO cached_videos (channel_id, site, video_id, title, author, author_id,
-                                           length_seconds, view_count, published, published_text,
-                                           thumbnail_url, thumbnail_data, video_url, fetched_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+        fetched_at = datetime.now(UTC).isoformat()
+        cursor.executemany(
+            """
+            INSERT OR IGNORE INTO cached_videos (channel_id, site, video_id, title, author, author_id,
+                                       length_seconds, view_count, published, published_text,
+                                       thumbnail_url, thumbnail_data, video_url, fetched_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+            [
                 (
                     channel_id,
                     site,
-                    video.get("video_id", ""),
-                    video.get("title", ""),
-                    video.get("author", ""),
-                    video.get("author_id", ""),
-                    video.get("length_seconds", 0),
-                    video.get("view_count"),
-                    video.get("published"),
-                    video.get("published_text", ""),
-                    video.get("thumbnail_url", ""),
-                    thumbnail_data_json,
-                    video.get("video_url", ""),
-                    datetime.now(UTC).isoformat(),
-                ),
-            )
-            new_count += 1
+                    video.video_id,
+                    video.title,
+                    video.author,
+                    video.author_id,
+                    video.length_seconds,
+                    video.view_count,
+                    video.published,
+                    video.published_text,
+                    video.thumbnail_url,
+                    # Serialize thumbnail_data as JSON if present
+                    orjson.dumps(video.thumbnails).decode() if video.thumbnails else None,
+                    video.video_url,
+                    fetched_at,
+                )
+                for video in unique_videos
+            ],
+        )
+        new_count = len(unique_videos)
 
-        conn.commit()
+        if own_conn:
+            conn.commit()
 
         # Log the cache refresh
         if old_count > 0:
@@ -124,9 +173,14 @@ def update_fetch_status(
     max_videos_fetched: int = None,
     pagination_limited: bool = False,
     pagination_limit_reason: str = None,
+    conn: Optional[sqlite3.Connection] = None,
 ):
-    """Update the fetch status for a channel."""
-    with get_connection() as conn:
+    """Update the fetch status for a channel.
+
+    When conn is given, the caller owns the transaction and must commit it.
+    """
+    own_conn = conn is None
+    with get_connection(conn) as conn:
         cursor = conn.cursor()
         cursor.execute(
             """
@@ -152,7 +206,8 @@ def update_fetch_status(
                 pagination_limit_reason,
             ),
         )
-        conn.commit()
+        if own_conn:
+            conn.commit()
 
 
 def upsert_watched_channels(channels: List[Dict[str, Any]]):
@@ -208,17 +263,14 @@ def get_watched_channels_with_status() -> List[Dict[str, Any]]:
             FROM watched_channels w
             LEFT JOIN feed_fetch_status f ON w.channel_id = f.channel_id AND w.site = f.site
             LEFT JOIN (
+                -- With MAX() in the select list, SQLite takes the bare title column from the row holding
+                -- that maximum, so the latest title comes out of the same grouped scan
                 SELECT channel_id,
                        site,
                        COUNT(*) as video_count,
                        MAX(published) as last_video_published,
-                       (SELECT title
-                        FROM cached_videos cv2
-                        WHERE cv2.channel_id = cv.channel_id
-                          AND cv2.site = cv.site
-                        ORDER BY cv2.published DESC
-                        LIMIT 1) as last_video_title
-                FROM cached_videos cv
+                       title as last_video_title
+                FROM cached_videos
                 GROUP BY channel_id, site
             ) video_stats ON w.channel_id = video_stats.channel_id AND w.site = video_stats.site
             ORDER BY w.last_requested DESC
@@ -226,9 +278,19 @@ def get_watched_channels_with_status() -> List[Dict[str, Any]]:
         return [dict(row) for row in cursor.fetchall()]
 
 
-def update_channel_metadata(channel_id: str, site: str, subscriber_count: int = None, is_verified: bool = None):
-    """Update cached metadata for a watched channel."""
-    with get_connection() as conn:
+def update_channel_metadata(
+    channel_id: str,
+    site: str,
+    subscriber_count: int = None,
+    is_verified: bool = None,
+    conn: Optional[sqlite3.Connection] = None,
+):
+    """Update cached metadata for a watched channel.
+
+    When conn is given, the caller owns the transaction and must commit it.
+    """
+    own_conn = conn is None
+    with get_connection(conn) as conn:
         cursor = conn.cursor()
         updates = ["metadata_updated_at = ?"]
         params = [datetime.now(UTC).isoformat()]
@@ -249,7 +311,8 @@ def update_channel_metadata(channel_id: str, site: str, subscriber_count: int =
         """,
             params,
         )
-        conn.commit()
+        if own_conn:
+            conn.commit()
 
 
 def get_channels_metadata(channel_ids: List[str], site: str = "youtube") -> List[Dict[str, Any]]:
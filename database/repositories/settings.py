@@ -55,6 +55,23 @@ def set_basic_auth_enabled(enabled: bool) -> None:
         conn.commit()
 
 
+def get_provisioning_fingerprint() -> Optional[str]:
+    """Get the fingerprint of the env vars applied by the last auto-provisioning run."""
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT provisioning_fingerprint FROM settings WHERE id = 1")
+        row = cursor.fetchone()
+        return row[0] if row else None
+
+
+def set_provisioning_fingerprint(fingerprint: str) -> None:
+    """Store the fingerprint of the env vars applied by auto-provisioning."""
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("UPDATE settings SET provisioning_fingerprint = ? WHERE id = 1", (fingerprint,))
+        conn.commit()
+
+
 def update_settings(values: Dict[str, Any]) -> None:
     """Update settings."""
     with get_connection() as conn:
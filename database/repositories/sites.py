@@ -1,15 +1,25 @@
 """Sites and credentials repository."""
 
+import sqlite3
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from database.connection import get_connection
+from database.connection import build_update_sql, get_connection
 
 
 def create_site(
-    name: str, extractor_pattern: str, enabled: bool = True, priority: int = 0, proxy_streaming: bool = True
+    name: str,
+    extractor_pattern: str,
+    enabled: bool = True,
+    priority: int = 0,
+    proxy_streaming: bool = True,
+    credentials: Optional[List[Tuple[str, Optional[str], str, bool]]] = None,
 ) -> int:
-    """Create a new site configuration. Returns the site ID."""
+    """Create a new site configuration. Returns the site ID.
+
+    credentials are (credential_type, key, value, is_encrypted) tuples inserted
+    in the same transaction as the site.
+    """
     with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute(
@@ -17,8 +27,11 @@ def create_site(
                VALUES (?, ?, ?, ?, ?)""",
             (name, extractor_pattern, enabled, priority, proxy_streaming),
         )
+        site_id = cursor.lastrowid
+        if credentials:
+            _insert_credentials(cursor, site_id, credentials)
         conn.commit()
-        return cursor.lastrowid
+        return site_id
 
 
 def get_site(site_id: int) -> Optional[Dict[str, Any]]:
@@ -42,8 +55,11 @@ def get_site(site_id: int) -> Optional[Dict[str, Any]]:
         return site
 
 
-def get_all_sites() -> List[Dict[str, Any]]:
-    """Get all sites with credential counts."""
+def get_all_sites() -> List[sqlite3.Row]:
+    """Get all sites with credential counts.
+
+    Rows are returned as-is (sqlite3.Row supports key access) to avoid a dict copy per row.
+    """
     with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute("""
@@ -53,7 +69,7 @@ def get_all_sites() -> List[Dict[str, Any]]:
             GROUP BY s.id
             ORDER BY s.priority DESC, s.name
         """)
-        return [dict(row) for row in cursor.fetchall()]
+        return cursor.fetchall()
 
 
 def get_enabled_sites() -> List[Dict[str, Any]]:
@@ -81,35 +97,24 @@ def update_site(
     proxy_streaming: bool = None,
 ) -> bool:
     """Update a site's configuration. Returns True if updated."""
-    updates = []
-    params = []
-
-    if name is not None:
-        updates.append("name = ?")
-        params.append(name)
-    if extractor_pattern is not None:
-        updates.append("extractor_pattern = ?")
-        params.append(extractor_pattern)
-    if enabled is not None:
-        updates.append("enabled = ?")
-        params.append(enabled)
-    if priority is not None:
-        updates.append("priority = ?")
-        params.append(priority)
-    if proxy_streaming is not None:
-        updates.append("proxy_streaming = ?")
-        params.append(proxy_streaming)
-
-    if not updates:
+    values = {
+        "name": name,
+        "extractor_pattern": extractor_pattern,
+        "enabled": enabled,
+        "priority": priority,
+        "proxy_streaming": proxy_streaming,
+    }
+    fields = tuple(k for k, v in values.items() if v is not None)
+    if not fields:
         return False
 
-    updates.append("updated_at = ?")
+    params = [values[k] for k in fields]
     params.append(datetime.utcnow().isoformat())
     params.append(site_id)
 
     with get_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute(f"UPDATE sites SET {', '.join(updates)} WHERE id = ?", params)
+        cursor.execute(build_update_sql("sites", fields, has_updated_at=True), params)
         conn.commit()
         return cursor.rowcount > 0
 
@@ -138,17 +143,29 @@ def get_site_by_extractor(extractor: str) -> Optional[Dict[str, Any]]:
         return None
 
 
-def add_credential(site_id: int, credential_type: str, value: str, key: str = None, is_encrypted: bool = False) -> int:
-    """Add a credential to a site. Returns the credential ID."""
+def add_credential(
+    site_id: int, credential_type: str, value: str, key: str = None, is_encrypted: bool = False
+) -> Optional[int]:
+    """Add a credential to a site. Returns the credential ID, or None if the site does not exist."""
     with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute(
             """INSERT INTO credentials (site_id, credential_type, key, value, is_encrypted)
-               VALUES (?, ?, ?, ?, ?)""",
-            (site_id, credential_type, key, value, is_encrypted),
+               SELECT ?, ?, ?, ?, ? WHERE EXISTS (SELECT 1 FROM sites WHERE id = ?)""",
+            (site_id, credential_type, key, value, is_encrypted, site_id),
         )
         conn.commit()
-        return cursor.lastrowid
+        return cursor.lastrowid if cursor.rowcount else None
+
+
+def _insert_credentials(
+    cursor: sqlite3.Cursor, site_id: int, credentials: List[Tuple[str, Optional[str], str, bool]]
+) -> None:
+    cursor.executemany(
+        """INSERT INTO credentials (site_id, credential_type, key, value, is_encrypted)
+           VALUES (?, ?, ?, ?, ?)""",
+        [(site_id, *credential) for credential in credentials],
+    )
 
 
 def get_credential(credential_id: int) -> Optional[Dict[str, Any]]:
@@ -160,11 +177,14 @@ def get_credential(credential_id: int) -> Optional[Dict[str, Any]]:
         return dict(row) if row else None
 
 
-def delete_credential(credential_id: int) -> bool:
-    """Delete a credential. Returns True if deleted."""
+def delete_credential(credential_id: int, site_id: Optional[int] = None) -> bool:
+    """Delete a credential, optionally only if it belongs to site_id. Returns True if deleted."""
     with get_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute("DELETE FROM credentials WHERE id = ?", (credential_id,))
+        if site_id is None:
+            cursor.execute("DELETE FROM credentials WHERE id = ?", (credential_id,))
+        else:
+            cursor.execute("DELETE FROM credentials WHERE id = ? AND site_id = ?", (credential_id, site_id))
         conn.commit()
         return cursor.rowcount > 0
 
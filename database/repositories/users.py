@@ -1,23 +1,34 @@
 """User repository."""
 
+import functools
+import sqlite3
 from datetime import UTC, datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
-from database.connection import get_connection
+from database import connection
+from database.connection import build_update_sql, get_connection
+
+# Database files known to have at least one user. Only deleting users can make that false again,
+# so page loads and token checks after setup don't need to query the users table.
+_paths_with_users: Set[str] = set()
 
 
 def has_any_user() -> bool:
     """Check if any user account exists (for setup flow)."""
+    db_path = connection.get_db_path()
+    if db_path in _paths_with_users:
+        return True
     with get_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM users")
-        return cursor.fetchone()[0] > 0
+        cursor.execute("SELECT EXISTS (SELECT 1 FROM users)")
+        exists = bool(cursor.fetchone()[0])
+    if exists:
+        _paths_with_users.add(db_path)
+    return exists
 
 
 # Backwards compatibility alias
-def has_any_admin() -> bool:
-    """Check if any admin account exists (for setup flow). Alias for has_any_user."""
-    return has_any_user()
+has_any_admin = has_any_user
 
 
 def create_user(username: str, password_hash: str, is_admin: bool = False) -> int:
@@ -32,10 +43,25 @@ def create_user(username: str, password_hash: str, is_admin: bool = False) -> in
         return cursor.lastrowid
 
 
-# Backwards compatibility alias
-def create_admin(username: str, password_hash: str) -> int:
-    """Create a new admin user. Returns the user ID. Alias for create_user with is_admin=True."""
-    return create_user(username, password_hash, is_admin=True)
+def create_user_row(username: str, password_hash: str, is_admin: bool = False) -> Dict[str, Any]:
+    """Create a new user and return its row (without the password hash).
+
+    Uses RETURNING so the database defaults (id, created_at) come back without a second query.
+    """
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            """INSERT INTO users (username, password_hash, is_admin) VALUES (?, ?, ?)
+               RETURNING id, username, is_admin, created_at, last_login""",
+            (username, password_hash, is_admin),
+        )
+        row = dict(cursor.fetchone())
+        conn.commit()
+        return row
+
+
+# Backwards compatibility alias (create_user with is_admin=True)
+create_admin = functools.partial(create_user, is_admin=True)
 
 
 def get_user_by_username(username: str) -> Optional[Dict[str, Any]]:
@@ -48,9 +74,7 @@ def get_user_by_username(username: str) -> Optional[Dict[str, Any]]:
 
 
 # Backwards compatibility alias
-def get_admin_by_username(username: str) -> Optional[Dict[str, Any]]:
-    """Get admin by username. Alias for get_user_by_username."""
-    return get_user_by_username(username)
+get_admin_by_username = get_user_by_username
 
 
 def get_user_by_id(user_id: int) -> Optional[Dict[str, Any]]:
@@ -63,13 +87,14 @@ def get_user_by_id(user_id: int) -> Optional[Dict[str, Any]]:
 
 
 # Backwards compatibility alias
-def get_admin_by_id(admin_id: int) -> Optional[Dict[str, Any]]:
-    """Get admin by ID. Alias for get_user_by_id."""
-    return get_user_by_id(admin_id)
+get_admin_by_id = get_user_by_id
+
 
+def get_all_users() -> List[sqlite3.Row]:
+    """Get all users (without password hashes).
 
-def get_all_users() -> List[Dict[str, Any]]:
-    """Get all users (without password hashes)."""
+    Rows are returned as-is (sqlite3.Row supports key access) to avoid a dict copy per row.
+    """
     with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute("""
@@ -77,13 +102,11 @@ def get_all_users() -> List[Dict[str, Any]]:
             FROM users
             ORDER BY created_at
         """)
-        return [dict(row) for row in cursor.fetchall()]
+        return cursor.fetchall()
 
 
-# Backwards compatibility alias
-def get_all_admins() -> List[Dict[str, Any]]:
-    """Get all admin users. Alias that returns all users."""
-    return get_all_users()
+# Backwards compatibility alias (returns all users)
+get_all_admins = get_all_users
 
 
 def update_user_last_login(user_id: int):
@@ -95,9 +118,7 @@ def update_user_last_login(user_id: int):
 
 
 # Backwards compatibility alias
-def update_admin_last_login(admin_id: int):
-    """Update admin's last login timestamp. Alias for update_user_last_login."""
-    update_user_last_login(admin_id)
+update_admin_last_login = update_user_last_login
 
 
 def update_user_password(user_id: int, password_hash: str):
@@ -109,28 +130,22 @@ def update_user_password(user_id: int, password_hash: str):
 
 
 # Backwards compatibility alias
-def update_admin_password(admin_id: int, password_hash: str):
-    """Update admin's password. Alias for update_user_password."""
-    update_user_password(admin_id, password_hash)
+update_admin_password = update_user_password
 
 
-def update_user(user_id: int, is_admin: bool = None) -> bool:
+def update_user(user_id: int, is_admin: bool = None, password_hash: str = None) -> bool:
     """Update user's properties. Returns True if updated."""
-    updates = []
-    params = []
-
-    if is_admin is not None:
-        updates.append("is_admin = ?")
-        params.append(is_admin)
-
-    if not updates:
+    values = {"password_hash": password_hash, "is_admin": is_admin}
+    fields = tuple(k for k, v in values.items() if v is not None)
+    if not fields:
         return False
 
+    params = [values[k] for k in fields]
     params.append(user_id)
 
     with get_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute(f"UPDATE users SET {', '.join(updates)} WHERE id = ?", params)
+        cursor.execute(build_update_sql("users", fields), params)
         conn.commit()
         return cursor.rowcount > 0
 
@@ -141,13 +156,13 @@ def delete_user(user_id: int) -> bool:
         cursor = conn.cursor()
         cursor.execute("DELETE FROM users WHERE id = ?", (user_id,))
         conn.commit()
-        return cursor.rowcount > 0
+    # Might have been the last user; check the table again next time
+    _paths_with_users.discard(connection.get_db_path())
+    return cursor.rowcount > 0
 
 
 # Backwards compatibility alias
-def delete_admin(admin_id: int) -> bool:
-    """Delete an admin user. Alias for delete_user."""
-    return delete_user(admin_id)
+delete_admin = delete_user
 
 
 def count_users() -> int:
@@ -167,6 +182,15 @@ def count_admin_users() -> int:
 
 
 # Backwards compatibility alias
-def count_admins() -> int:
-    """Get the total number of admin users. Alias for count_admin_users."""
-    return count_admin_users()
+count_admins = count_admin_users
+
+
+def has_multiple_admins() -> bool:
+    """Check if more than one admin user exists (for last-admin guards).
+
+    Stops after the second admin row instead of counting them all.
+    """
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM (SELECT 1 FROM users WHERE is_admin = 1 LIMIT 2)")
+        return cursor.fetchone()[0] > 1
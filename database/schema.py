@@ -1,12 +1,15 @@
 """Database schema initialization using Alembic migrations."""
 
+import functools
 import logging
 import os
+from logging.config import fileConfig
 
 from alembic import command
 from alembic.config import Config
 from alembic.runtime.migration import MigrationContext
-from sqlalchemy import create_engine, text
+from alembic.script import ScriptDirectory
+from sqlalchemy import create_engine, event, pool, text
 
 import config
 
@@ -16,8 +19,9 @@ logger = logging.getLogger(__name__)
 ALEMBIC_INI_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "alembic.ini")
 
 
+@functools.cache
 def _get_alembic_config():
-    """Get Alembic configuration."""
+    """Get Alembic configuration (parsed once per process)."""
     return Config(ALEMBIC_INI_PATH)
 
 
@@ -27,18 +31,58 @@ def _get_database_url():
     return f"sqlite:///{db_path}"
 
 
-def _get_current_revision(engine):
+def _on_connect(dbapi_connection, connection_record):
+    """Apply the same pragmas as database.connection, so migrations switch the file to WAL.
+
+    Also turns off pysqlite's own transaction handling, which only opens a
+    transaction before DML and so commits every DDL statement on its own.
+    """
+    dbapi_connection.isolation_level = None
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+
+def _on_begin(conn):
+    """Emit BEGIN ourselves so DDL runs inside the SQLAlchemy transaction."""
+    conn.exec_driver_sql("BEGIN")
+
+
+def create_migration_engine(database_url: str):
+    """Create an engine for running migrations.
+
+    Uses NullPool so no connections are held open between init_db calls.
+    Statements run in real transactions, so a migration's DDL is committed
+    (and synced to disk) once rather than once per statement.
+    """
+    engine = create_engine(database_url, poolclass=pool.NullPool)
+    event.listen(engine, "connect", _on_connect)
+    event.listen(engine, "begin", _on_begin)
+    return engine
+
+
+@functools.lru_cache(maxsize=8)
+def _get_engine(database_url: str):
+    """Get the migration engine for a database URL, built once per URL."""
+    return create_migration_engine(database_url)
+
+
+def _get_current_revision(conn):
     """Get the current database revision."""
-    with engine.connect() as conn:
-        context = MigrationContext.configure(conn)
-        return context.get_current_revision()
+    context = MigrationContext.configure(conn)
+    return context.get_current_revision()
+
+
+def _get_head_revision(alembic_cfg):
+    """Get the head revision from the migration scripts."""
+    return ScriptDirectory.from_config(alembic_cfg).get_current_head()
 
 
-def _is_fresh_database(engine):
+def _is_fresh_database(conn):
     """Check if this is a fresh database (no tables exist)."""
-    with engine.connect() as conn:
-        result = conn.execute(text("SELECT name FROM sqlite_master WHERE type='table' AND name='users'"))
-        return result.fetchone() is None
+    result = conn.execute(text("SELECT name FROM sqlite_master WHERE type='table' AND name='users'"))
+    return result.fetchone() is None
 
 
 def init_db():
@@ -50,29 +94,52 @@ def init_db():
 
     For fresh databases:
         - Runs all migrations from scratch
+
+    For databases already at head:
+        - Skips the upgrade entirely (no env.py load or migration walk)
     """
     # Ensure data directory exists
     os.makedirs(config.DATA_DIR, exist_ok=True)
 
-    engine = create_engine(_get_database_url())
+    engine = _get_engine(_get_database_url())
     alembic_cfg = _get_alembic_config()
-    current_rev = _get_current_revision(engine)
-
-    if current_rev is None:
-        # No Alembic version table - either fresh DB or pre-Alembic DB
-        if _is_fresh_database(engine):
-            # Fresh database - run all migrations from scratch
-            logger.info("Fresh database detected - running all migrations")
-            command.upgrade(alembic_cfg, "head")
-        else:
-            # Existing database without Alembic tracking
-            # Stamp with baseline, then run any pending migrations
-            logger.info("Existing database detected - stamping with baseline revision")
-            command.stamp(alembic_cfg, "001")
-            command.upgrade(alembic_cfg, "head")
-    else:
-        # Alembic is already tracking - just run pending migrations
-        logger.info(f"Database at revision {current_rev} - checking for pending migrations")
-        command.upgrade(alembic_cfg, "head")
+
+    # One connection for the revision checks, stamp and upgrade; env.py picks it up from attributes.
+    # Its transaction spans all of them, so the whole upgrade is committed once at the end.
+    with engine.connect() as conn:
+        current_rev = _get_current_revision(conn)
+        migrated = True
+        alembic_cfg.attributes["connection"] = conn
+        try:
+            if current_rev is None:
+                # No Alembic version table - either fresh DB or pre-Alembic DB
+                if _is_fresh_database(conn):
+                    # Fresh database - run all migrations from scratch. Durability pragmas are left alone:
+                    # SQLite refuses to change them inside the transaction, and WAL with synchronous=NORMAL
+                    # already skips the fsync on the single commit at the end.
+                    logger.info("Fresh database detected - running all migrations")
+                    command.upgrade(alembic_cfg, "head")
+                else:
+                    # Existing database without Alembic tracking
+                    # Stamp with baseline, then run any pending migrations
+                    logger.info("Existing database detected - stamping with baseline revision")
+                    command.stamp(alembic_cfg, "001")
+                    command.upgrade(alembic_cfg, "head")
+            elif current_rev == _get_head_revision(alembic_cfg):
+                # Already at head - skip loading env.py and walking the migration graph.
+                # env.py is what applies alembic.ini's logging config, so apply it here instead.
+                fileConfig(alembic_cfg.config_file_name, disable_existing_loggers=False)
+                logger.info(f"Database at revision {current_rev} - up to date")
+                migrated = False
+            else:
+                # Alembic is already tracking - just run pending migrations
+                logger.info(f"Database at revision {current_rev} - checking for pending migrations")
+                command.upgrade(alembic_cfg, "head")
+        finally:
+            alembic_cfg.attributes.pop("connection", None)
+        if migrated:
+            # Gather planner statistics for the tables and indexes the migrations created or changed
+            conn.execute(text("ANALYZE"))
+        conn.commit()
 
     logger.info("Database initialization complete")
@@ -1,11 +1,14 @@
 """Auto-provisioning from environment variables for automated deployments."""
 
+import hashlib
+import hmac
 import logging
 
 import auth
 import config
 import database
 import settings as settings_module
+import tokens
 
 logger = logging.getLogger(__name__)
 
@@ -15,9 +18,44 @@ def apply_env_provisioning():
 
     - ADMIN_USERNAME + ADMIN_PASSWORD: creates or updates admin user
     - INVIDIOUS_INSTANCE_URL: configures Invidious instance and enables proxy
+
+    A fingerprint of the env vars is stored after each run; if they are unchanged
+    on the next startup and the admin user is still in place, provisioning is skipped.
     """
+    inputs = (config.ADMIN_USERNAME or "", config.ADMIN_PASSWORD or "", config.INVIDIOUS_INSTANCE_URL or "")
+    if not any(inputs):
+        return
+
+    stored = database.get_provisioning_fingerprint()
+    if stored and _fingerprint_matches(stored, inputs) and _provisioned_admin_present():
+        logger.info("ENV provisioning: unchanged since last startup, skipping")
+        return
+
     _provision_admin_user()
     _provision_invidious()
+    database.set_provisioning_fingerprint(_make_fingerprint(inputs))
+
+
+def _make_fingerprint(inputs: tuple) -> str:
+    """Build an HMAC of the provisioning inputs keyed with the server secret.
+
+    The password is part of the inputs, so a plain hash stored in the database could be
+    brute-forced offline; without the secret file the digest reveals nothing.
+    """
+    return hmac.new(tokens._get_signing_key(), "\0".join(inputs).encode(), hashlib.sha256).hexdigest()
+
+
+def _fingerprint_matches(fingerprint: str, inputs: tuple) -> bool:
+    """Check whether a stored fingerprint was built from the given inputs."""
+    return hmac.compare_digest(fingerprint, _make_fingerprint(inputs))
+
+
+def _provisioned_admin_present() -> bool:
+    """Check that ADMIN_USERNAME (if set) still exists as an admin, without any bcrypt work."""
+    if not config.ADMIN_USERNAME or not config.ADMIN_PASSWORD:
+        return True
+    user = database.get_user_by_username(config.ADMIN_USERNAME)
+    return bool(user and user["is_admin"])
 
 
 def _provision_admin_user():
@@ -28,13 +66,15 @@ def _provision_admin_user():
     if not username or not password:
         return
 
+    # Hash before touching the database so no connection is held during bcrypt
+    password_hash = auth.hash_password(password)
+
     existing = database.get_user_by_username(username)
     if existing:
-        database.update_user_password(existing["id"], auth.hash_password(password))
-        database.update_user(existing["id"], is_admin=True)
+        database.update_user(existing["id"], is_admin=True, password_hash=password_hash)
         logger.info("ENV provisioning: updated admin user '%s'", username)
     else:
-        database.create_admin(username, auth.hash_password(password))
+        database.create_admin(username, password_hash)
         logger.info("ENV provisioning: created admin user '%s'", username)
 
 
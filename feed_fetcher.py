@@ -1,6 +1,9 @@
 """Background feed fetcher for subscribed channels."""
 
 import asyncio
+import bisect
+import calendar
+import functools
 import json
 import logging
 import sqlite3
@@ -8,19 +11,25 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 import httpx
+import orjson
+from cachetools import TTLCache
 
 import avatar_cache
 import database
 import invidious_proxy
 from converters import resolve_invidious_url
+from database import CachedVideo
 from security import is_safe_url_strict
-from settings import get_settings
-from ytdlp_wrapper import YtDlpError, get_channel_info, is_valid_url, run_ytdlp
+from settings import Settings, get_settings
+from ytdlp_wrapper import YtDlpError, get_channel_info, is_valid_url, run_ytdlp_stream
 
 logger = logging.getLogger(__name__)
 
 _fetch_task: Optional[asyncio.Task] = None
 
+# Number of channel results written per transaction in fetch_all_channels
+_FEED_WRITE_BATCH_SIZE = 50
+
 _FEED_FETCH_ERRORS = (
     YtDlpError,
     invidious_proxy.InvidiousProxyError,
@@ -32,6 +41,35 @@ _FEED_FETCH_ERRORS = (
     KeyError,
 )
 
+# Errors a malformed fetch result can raise while its videos are written
+_FEED_STORE_ERRORS = (*_FEED_FETCH_ERRORS, TypeError)
+
+# Channel URLs that passed the SSRF check, so each feed cycle doesn't re-resolve the same hosts.
+# Failures (including transient DNS errors) are not cached and are checked again next time.
+_channel_url_safety_cache: TTLCache = TTLCache(maxsize=1000, ttl=3600)
+
+
+def clear_channel_url_cache():
+    """Clear cached channel URL safety checks. Useful for testing."""
+    _channel_url_safety_cache.clear()
+
+
+def _build_youtube_url(channel_id: str) -> Optional[str]:
+    """Build the videos URL for a YouTube handle or UC channel ID.
+
+    Returns:
+        URL string, or None if the ID needs the stored channel_url instead
+    """
+    if channel_id.startswith("@"):
+        return f"https://www.youtube.com/{channel_id}/videos"
+    if channel_id.startswith("UC"):
+        return f"https://www.youtube.com/channel/{channel_id}/videos"
+    return None
+
+
+# Site-specific builders that derive a fetch URL from the channel ID alone (no validation needed)
+_URL_BUILDERS = {"youtube": _build_youtube_url}
+
 
 def _build_channel_url(channel_id: str, site: str, channel_url: str) -> str:
     """Build the URL for fetching channel videos.
@@ -47,13 +85,13 @@ def _build_channel_url(channel_id: str, site: str, channel_url: str) -> str:
     Raises:
         ValueError: If channel_url is required but not provided, or if URL is invalid
     """
-    if site.lower() == "youtube":
-        if channel_id.startswith("@"):
-            return f"https://www.youtube.com/{channel_id}/videos"
-        elif channel_id.startswith("UC"):
-            return f"https://www.youtube.com/channel/{channel_id}/videos"
+    builder = _URL_BUILDERS.get(site.lower())
+    if builder:
+        url = builder(channel_id)
+        if url:
+            return url
 
-    # For non-YouTube sites, channel_url is required
+    # For other sites and IDs, channel_url is required
     if not channel_url:
         raise ValueError(f"channel_url is required for {site} channels (channel_id: {channel_id})")
 
@@ -63,14 +101,16 @@ def _build_channel_url(channel_id: str, site: str, channel_url: str) -> str:
 
     # SSRF prevention - validate URL doesn't target internal resources
     # DNS resolution enabled to prevent DNS rebinding attacks
-    is_safe, reason = is_safe_url_strict(channel_url, resolve_dns=True)
-    if not is_safe:
-        raise ValueError(f"Channel URL blocked ({reason}): {channel_url}")
+    if channel_url not in _channel_url_safety_cache:
+        is_safe, reason = is_safe_url_strict(channel_url, resolve_dns=True)
+        if not is_safe:
+            raise ValueError(f"Channel URL blocked ({reason}): {channel_url}")
+        _channel_url_safety_cache[channel_url] = True
 
     return channel_url
 
 
-def _process_invidious_video(v: dict, channel_id: str, invidious_base: str) -> dict:
+def _process_invidious_video(v: dict, channel_id: str, invidious_base: str) -> CachedVideo:
     """Convert a single Invidious video to our cached format.
 
     Args:
@@ -79,35 +119,33 @@ def _process_invidious_video(v: dict, channel_id: str, invidious_base: str) -> d
         invidious_base: Invidious instance base URL for resolving thumbnails
 
     Returns:
-        Video dict in our format
+        CachedVideo in our format
     """
     # Resolve relative thumbnail URLs before processing
-    raw_thumbnails = v.get("videoThumbnails", [])
-    resolved_thumbnails = []
-    for thumb in raw_thumbnails:
-        resolved_thumb = thumb.copy()
-        resolved_thumb["url"] = resolve_invidious_url(thumb.get("url", ""), invidious_base)
-        resolved_thumbnails.append(resolved_thumb)
+    resolved_thumbnails = [
+        {**thumb, "url": resolve_invidious_url(thumb.get("url", ""), invidious_base)}
+        for thumb in v.get("videoThumbnails", [])
+    ]
 
     # Extract all thumbnails and best URL
     best_thumb_url, all_thumbnails = _get_all_thumbnails(resolved_thumbnails)
 
-    return {
-        "video_id": v.get("videoId", ""),
-        "title": v.get("title", ""),
-        "author": v.get("author", ""),
-        "author_id": v.get("authorId", channel_id),
-        "length_seconds": v.get("lengthSeconds", 0),
-        "view_count": v.get("viewCount"),
-        "published": v.get("published"),
-        "published_text": v.get("publishedText", ""),
-        "thumbnail_url": best_thumb_url,
-        "thumbnails": all_thumbnails,
-        "video_url": f"https://www.youtube.com/watch?v={v.get('videoId', '')}",
-    }
-
-
-def _process_ytdlp_video(info: dict, channel_id: str) -> dict:
+    return CachedVideo(
+        video_id=v.get("videoId", ""),
+        title=v.get("title", ""),
+        author=v.get("author", ""),
+        author_id=v.get("authorId", channel_id),
+        length_seconds=v.get("lengthSeconds", 0),
+        view_count=v.get("viewCount"),
+        published=v.get("published"),
+        published_text=v.get("publishedText", ""),
+        thumbnail_url=best_thumb_url,
+        thumbnails=all_thumbnails,
+        video_url=f"https://www.youtube.com/watch?v={v.get('videoId', '')}",
+    )
+
+
+def _process_ytdlp_video(info: dict, channel_id: str) -> CachedVideo:
     """Convert a single yt-dlp video to our cached format.
 
     Args:
@@ -115,23 +153,23 @@ def _process_ytdlp_video(info: dict, channel_id: str) -> dict:
         channel_id: The channel ID
 
     Returns:
-        Video dict in our format
+        CachedVideo in our format
     """
     best_thumb_url, all_thumbnails = _get_all_ytdlp_thumbnails(info)
 
-    return {
-        "video_id": info.get("id", ""),
-        "title": info.get("title", ""),
-        "author": info.get("channel") or info.get("uploader") or "",
-        "author_id": info.get("channel_id") or info.get("uploader_id") or channel_id,
-        "length_seconds": info.get("duration") or 0,
-        "view_count": info.get("view_count"),
-        "published": _parse_timestamp(info.get("timestamp") or info.get("upload_date")),
-        "published_text": info.get("upload_date") or "",
-        "thumbnail_url": best_thumb_url,
-        "thumbnails": all_thumbnails,
-        "video_url": info.get("url") or info.get("webpage_url") or "",
-    }
+    return CachedVideo(
+        video_id=info.get("id", ""),
+        title=info.get("title", ""),
+        author=info.get("channel") or info.get("uploader") or "",
+        author_id=info.get("channel_id") or info.get("uploader_id") or channel_id,
+        length_seconds=info.get("duration") or 0,
+        view_count=info.get("view_count"),
+        published=_parse_timestamp(info.get("timestamp") or info.get("upload_date")),
+        published_text=info.get("upload_date") or "",
+        thumbnail_url=best_thumb_url,
+        thumbnails=all_thumbnails,
+        video_url=info.get("url") or info.get("webpage_url") or "",
+    )
 
 
 async def _fetch_channel_metadata_invidious(channel_id: str) -> Optional[Dict[str, Any]]:
@@ -150,8 +188,8 @@ async def _fetch_channel_metadata_invidious(channel_id: str) -> Optional[Dict[st
                 "subscriber_count": channel_info.get("subCount"),
                 "is_verified": channel_info.get("authorVerified", False),
             }
-    except (KeyError, TypeError, ValueError) as e:
-        logger.debug(f"Failed to fetch channel info for {channel_id}: {e}")
+    except (invidious_proxy.InvidiousProxyError, httpx.RequestError, KeyError, TypeError, ValueError) as e:
+        logger.debug("Failed to fetch channel info for %s: %s", channel_id, e)
     return None
 
 
@@ -171,13 +209,13 @@ async def _fetch_channel_metadata_ytdlp(channel_id: str) -> Optional[Dict[str, A
             "is_verified": info.get("channel_is_verified", False),
         }
     except (YtDlpError, KeyError, TypeError, ValueError) as e:
-        logger.debug(f"Failed to fetch channel info for {channel_id}: {e}")
+        logger.debug("Failed to fetch channel info for %s: %s", channel_id, e)
     return None
 
 
 async def _fetch_from_invidious(
     channel_id: str, max_videos: int
-) -> tuple[Optional[List[dict]], Optional[Dict[str, Any]], bool, Optional[str]]:
+) -> tuple[Optional[List[CachedVideo]], Optional[Dict[str, Any]], bool, Optional[str]]:
     """Fetch videos from Invidious API.
 
     Args:
@@ -200,8 +238,9 @@ async def _fetch_from_invidious(
             and s.feed_fallback_ytdlp_on_414
         ):
             logger.info(
-                f"[Feed] {channel_id}: 414 error with {result.get('total_fetched')} videos, "
-                f"falling back to yt-dlp for full fetch"
+                "[Feed] %s: 414 error with %s videos, falling back to yt-dlp for full fetch",
+                channel_id,
+                result.get("total_fetched"),
             )
             return None, None, True, "invidious_error_414"
 
@@ -228,24 +267,21 @@ async def _fetch_from_invidious(
 
         # If retryable error occurred (after all retries exhausted) and fallback is enabled
         if e.is_retryable and s.feed_fallback_ytdlp_on_error:
-            logger.info(
-                f"[Feed] {channel_id}: Invidious failed after retries ({e}), "
-                f"falling back to yt-dlp"
-            )
+            logger.info("[Feed] %s: Invidious failed after retries (%s), falling back to yt-dlp", channel_id, e)
             return None, None, True, fallback_reason
 
         # Non-retryable error or fallback disabled - re-raise
-        logger.warning(f"Invidious failed for {channel_id}: {e}")
+        logger.warning("Invidious failed for %s: %s", channel_id, e)
         raise
 
     except (KeyError, TypeError, ValueError, OSError) as e:
-        logger.warning(f"Invidious failed for {channel_id}, falling back to yt-dlp: {type(e).__name__}: {e}")
+        logger.warning("Invidious failed for %s, falling back to yt-dlp: %s: %s", channel_id, type(e).__name__, e)
         return None, None, True, "invidious_error_other"
 
 
 async def _fetch_from_ytdlp(
     channel_id: str, site: str, channel_url: str, max_videos: int, use_flat_playlist: bool
-) -> tuple[List[dict], Optional[Dict[str, Any]]]:
+) -> tuple[List[CachedVideo], Optional[Dict[str, Any]]]:
     """Fetch videos from yt-dlp.
 
     Args:
@@ -264,34 +300,86 @@ async def _fetch_from_ytdlp(
     if use_flat_playlist:
         ytdlp_args.insert(1, "--flat-playlist")
 
-    stdout = await run_ytdlp(*ytdlp_args, url)
-
     videos = []
     channel_metadata = None
 
-    for line in stdout.strip().split("\n"):
-        if not line:
+    # Parse each line as yt-dlp emits it rather than buffering the whole output
+    async for line in run_ytdlp_stream(*ytdlp_args, url):
+        info = _parse_ytdlp_line(line)
+        if info is None:
             continue
-        try:
-            info = json.loads(line)
 
-            # Extract channel metadata from first video only
-            if channel_metadata is None:
-                channel_metadata = {
-                    "subscriber_count": info.get("channel_follower_count"),
-                    "is_verified": info.get("channel_is_verified", False),
-                }
+        # Extract channel metadata from first video only
+        if channel_metadata is None:
+            channel_metadata = {
+                "subscriber_count": info.get("channel_follower_count"),
+                "is_verified": info.get("channel_is_verified", False),
+            }
 
-            videos.append(_process_ytdlp_video(info, channel_id))
-        except json.JSONDecodeError:
-            continue
+        videos.append(_process_ytdlp_video(info, channel_id))
 
     return videos, channel_metadata
 
 
-async def fetch_channel_feed(
-    channel_id: str, site: str, channel_url: str
-) -> tuple[List[Dict[str, Any]], Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+def _parse_ytdlp_line(line: bytes) -> Optional[dict]:
+    """Decode one yt-dlp JSON output line, returning None for blank or malformed lines."""
+    # orjson accepts bytes and surrounding whitespace, and rejects blank lines
+    try:
+        return orjson.loads(line)
+    except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses this
+        return None
+
+
+_FeedResult = tuple[List[CachedVideo], Optional[Dict[str, Any]], Optional[Dict[str, Any]]]
+
+
+async def _fetch_generic_ytdlp(channel_id: str, site: str, channel_url: str, s: Settings) -> _FeedResult:
+    """Fetch a channel with yt-dlp only. yt-dlp doesn't provide pagination metadata."""
+    logger.debug("Using yt-dlp for %s (%s) - flat_playlist=%s", channel_id, site, s.feed_ytdlp_use_flat_playlist)
+    videos, channel_metadata = await _fetch_from_ytdlp(
+        channel_id, site, channel_url, s.feed_max_videos, s.feed_ytdlp_use_flat_playlist
+    )
+    if videos:
+        logger.debug("Fetched %s videos from yt-dlp for %s (%s)", len(videos), channel_id, site)
+    return videos, None, channel_metadata
+
+
+async def _fetch_youtube(channel_id: str, site: str, channel_url: str, s: Settings) -> _FeedResult:
+    """Fetch a YouTube channel from Invidious (faster and includes publish dates), falling back to yt-dlp."""
+    pagination_info: Optional[Dict[str, Any]] = None
+    channel_metadata: Optional[Dict[str, Any]] = None
+
+    if invidious_proxy.is_enabled():
+        logger.debug("Attempting Invidious fetch for %s (%s) - max_videos=%s", channel_id, site, s.feed_max_videos)
+        # Videos and channel metadata are independent requests, so overlap them
+        (videos, pagination_info, should_fallback, fallback_reason), channel_metadata = await asyncio.gather(
+            _fetch_from_invidious(channel_id, s.feed_max_videos),
+            _fetch_channel_metadata_invidious(channel_id),
+        )
+
+        if videos and not should_fallback:
+            logger.debug("Fetched %s videos from Invidious for %s (%s)", len(videos), channel_id, site)
+            return videos, pagination_info, channel_metadata
+
+        if fallback_reason:
+            logger.info("[Feed] %s: Using yt-dlp fallback (reason: %s)", channel_id, fallback_reason)
+
+    videos, _, ytdlp_metadata = await _fetch_generic_ytdlp(channel_id, site, channel_url, s)
+    # Prefer Invidious metadata if it was fetched before falling back
+    channel_metadata = channel_metadata or ytdlp_metadata
+
+    # If flat-playlist was used, channel_metadata may be None - fetch it separately
+    if not channel_metadata:
+        channel_metadata = await _fetch_channel_metadata_ytdlp(channel_id)
+
+    return videos, pagination_info, channel_metadata
+
+
+# Per-site feed fetchers; sites not listed here are fetched with yt-dlp only
+_SITE_FETCHERS = {"youtube": _fetch_youtube}
+
+
+async def fetch_channel_feed(channel_id: str, site: str, channel_url: str) -> _FeedResult:
     """Fetch recent videos for a channel.
 
     Args:
@@ -304,50 +392,25 @@ async def fetch_channel_feed(
         pagination_info contains: total_fetched, pagination_limited, limit_reason
         channel_metadata contains: subscriber_count, is_verified
     """
-    s = get_settings()
-    videos: List[dict] = []
-    pagination_info: Optional[Dict[str, Any]] = None
-    channel_metadata: Optional[Dict[str, Any]] = None
-
-    fallback_reason: Optional[str] = None
+    fetcher = _SITE_FETCHERS.get(site.lower(), _fetch_generic_ytdlp)
 
     try:
-        # For YouTube, try Invidious first (faster and includes publish dates)
-        if site.lower() == "youtube" and invidious_proxy.is_enabled():
-            logger.debug(f"Attempting Invidious fetch for {channel_id} ({site}) - max_videos={s.feed_max_videos}")
-            videos, pagination_info, should_fallback, fallback_reason = await _fetch_from_invidious(
-                channel_id, s.feed_max_videos
-            )
-
-            if videos and not should_fallback:
-                logger.debug(f"Fetched {len(videos)} videos from Invidious for {channel_id} ({site})")
-                channel_metadata = await _fetch_channel_metadata_invidious(channel_id)
-                return videos, pagination_info, channel_metadata
-
-        # Fall back to yt-dlp for all sites (or if Invidious failed/not enabled)
-        if fallback_reason:
-            logger.info(f"[Feed] {channel_id}: Using yt-dlp fallback (reason: {fallback_reason})")
-        logger.debug(f"Using yt-dlp for {channel_id} ({site}) - flat_playlist={s.feed_ytdlp_use_flat_playlist}")
-        videos, channel_metadata = await _fetch_from_ytdlp(
-            channel_id, site, channel_url, s.feed_max_videos, s.feed_ytdlp_use_flat_playlist
-        )
-
-        if videos:
-            logger.debug(f"Fetched {len(videos)} videos from yt-dlp for {channel_id} ({site})")
-
+        return await fetcher(channel_id, site, channel_url, get_settings())
     except YtDlpError as e:
-        logger.error(f"Failed to fetch channel {channel_id} ({site}): {e}")
+        logger.error("Failed to fetch channel %s (%s): %s", channel_id, site, e)
         raise
     except (OSError, ValueError) as e:
-        logger.error(f"Error fetching channel {channel_id} ({site}): {e}")
+        logger.error("Error fetching channel %s (%s): %s", channel_id, site, e)
         raise
 
-    # If flat-playlist was used, channel_metadata may be None - fetch it separately
-    if not channel_metadata and site.lower() == "youtube":
-        channel_metadata = await _fetch_channel_metadata_ytdlp(channel_id)
 
-    # yt-dlp doesn't provide pagination metadata
-    return videos, pagination_info, channel_metadata
+# Invidious thumbnail quality names ranked from best to worst
+_INVIDIOUS_QUALITY_SCORES = {"maxres": 5, "maxresdefault": 5, "sddefault": 4, "high": 3, "medium": 2, "default": 1}
+
+
+# Minimum widths for each yt-dlp thumbnail quality above "default"
+_YTDLP_WIDTH_THRESHOLDS = (320, 480, 640, 1280)
+_YTDLP_QUALITY_LABELS = ("default", "medium", "high", "sddefault", "maxres")
 
 
 def _get_all_thumbnails(thumbnails: List[dict]) -> tuple[str, List[dict]]:
@@ -356,18 +419,11 @@ def _get_all_thumbnails(thumbnails: List[dict]) -> tuple[str, List[dict]]:
     Returns:
         Tuple of (best_url, all_thumbnails_list)
     """
-    if not thumbnails:
-        return "", []
-
-    # Sort thumbnails by quality score (best first)
-    quality_scores = {"maxres": 5, "maxresdefault": 5, "sddefault": 4, "high": 3, "medium": 2, "default": 1}
-
-    sorted_thumbs = sorted(thumbnails, key=lambda x: quality_scores.get(x.get("quality", ""), 0), reverse=True)
-
-    # Best URL for legacy thumbnail_url field
-    best_url = sorted_thumbs[0].get("url", "") if sorted_thumbs else ""
+    # Best URL for legacy thumbnail_url field (first of the highest quality on ties).
+    # The list keeps its source order: clients pick thumbnails by quality, not position.
+    best = max(thumbnails or (), key=lambda x: _INVIDIOUS_QUALITY_SCORES.get(x.get("quality", ""), 0), default=None)
 
-    return best_url, thumbnails
+    return (best.get("url", "") if best else ""), thumbnails or []
 
 
 def _get_all_ytdlp_thumbnails(info: dict) -> tuple[str, List[dict]]:
@@ -387,35 +443,23 @@ def _get_all_ytdlp_thumbnails(info: dict) -> tuple[str, List[dict]]:
     # Convert to Invidious-compatible format with quality mapping
     result = []
     for thumb in thumbnails:
-        width = thumb.get("width", 0)
+        width = thumb.get("width") or 0
         height = thumb.get("height", 0)
 
-        # Map dimensions to quality names (Invidious-compatible)
-        if width >= 1280:
-            quality = "maxres"
-        elif width >= 640:
-            quality = "sddefault"
-        elif width >= 480:
-            quality = "high"
-        elif width >= 320:
-            quality = "medium"
-        else:
-            quality = "default"
-
         result.append(
             {
-                "quality": quality,
+                # Map width to quality names (Invidious-compatible)
+                "quality": _YTDLP_QUALITY_LABELS[bisect.bisect_right(_YTDLP_WIDTH_THRESHOLDS, width)],
                 "url": thumb.get("url", ""),
                 "width": width if width else None,
                 "height": height if height else None,
             }
         )
 
-    # Sort by width (largest first) and get best URL
-    sorted_thumbs = sorted(result, key=lambda x: x.get("width") or 0, reverse=True)
-    best_url = sorted_thumbs[0].get("url", "") if sorted_thumbs else ""
+    # Best URL is the widest thumbnail
+    best = max(result, key=lambda x: x["width"] or 0)
 
-    return best_url, result
+    return best["url"], result
 
 
 def _parse_timestamp(value) -> Optional[int]:
@@ -427,23 +471,69 @@ def _parse_timestamp(value) -> Optional[int]:
         return value
 
     if isinstance(value, str):
-        # Try YYYYMMDD format
-        if len(value) == 8 and value.isdigit():
-            try:
-                dt = datetime.strptime(value, "%Y%m%d")
-                return int(dt.timestamp())
-            except ValueError:
-                pass
-        # Try ISO format
-        try:
-            dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
-            return int(dt.timestamp())
-        except ValueError:
-            pass
+        return _parse_timestamp_str(value)
 
     return None
 
 
+@functools.lru_cache(maxsize=4096)
+def _parse_timestamp_str(value: str) -> Optional[int]:
+    """Parse a YYYYMMDD or ISO date string (cached, feeds repeat the same dates every cycle)."""
+    # Try YYYYMMDD format (yt-dlp upload dates are UTC)
+    if len(value) == 8 and value.isdigit():
+        year, month, day = int(value[:4]), int(value[4:6]), int(value[6:8])
+        if 1 <= month <= 12 and 1 <= day <= calendar.monthrange(year, month)[1]:
+            return calendar.timegm((year, month, day, 0, 0, 0))
+        return None
+    # Try ISO format
+    try:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        return int(dt.timestamp())
+    except ValueError:
+        pass
+
+    return None
+
+
+def _commit_channel_results(
+    channel_id: str,
+    site: str,
+    videos: List[CachedVideo],
+    pagination_info: Optional[Dict[str, Any]],
+    channel_metadata: Optional[Dict[str, Any]],
+    conn: Optional[sqlite3.Connection] = None,
+) -> None:
+    """Write a successful fetch: cached videos, fetch status and channel metadata.
+
+    Joins conn's transaction when given, otherwise commits in a transaction of its own.
+    """
+    if conn is None:
+        with database.transaction() as conn:
+            _commit_channel_results(channel_id, site, videos, pagination_info, channel_metadata, conn=conn)
+        return
+
+    database.upsert_cached_videos(channel_id, site, videos, conn=conn)
+    database.update_fetch_status(
+        channel_id,
+        site,
+        success=True,
+        max_videos_fetched=pagination_info.get("total_fetched") if pagination_info else len(videos),
+        pagination_limited=pagination_info.get("pagination_limited", False) if pagination_info else False,
+        pagination_limit_reason=pagination_info.get("limit_reason") if pagination_info else None,
+        conn=conn,
+    )
+
+    # Save channel metadata if available (subscriber count, verified status)
+    if channel_metadata:
+        database.update_channel_metadata(
+            channel_id,
+            site,
+            subscriber_count=channel_metadata.get("subscriber_count"),
+            is_verified=channel_metadata.get("is_verified"),
+            conn=conn,
+        )
+
+
 async def fetch_single_channel(channel_id: str, site: str, channel_url: str):
     """Fetch and cache videos for a single channel.
 
@@ -454,45 +544,135 @@ async def fetch_single_channel(channel_id: str, site: str, channel_url: str):
         videos, pagination_info, channel_metadata = await fetch_channel_feed(channel_id, site, channel_url)
 
         if videos:
-            database.upsert_cached_videos(channel_id, site, videos)
-            database.update_fetch_status(
-                channel_id,
-                site,
-                success=True,
-                max_videos_fetched=pagination_info.get("total_fetched") if pagination_info else len(videos),
-                pagination_limited=pagination_info.get("pagination_limited", False) if pagination_info else False,
-                pagination_limit_reason=pagination_info.get("limit_reason") if pagination_info else None,
+            # Write off the event loop so API requests keep being served meanwhile
+            await asyncio.to_thread(
+                _commit_channel_results, channel_id, site, videos, pagination_info, channel_metadata
             )
 
-            # Save channel metadata if available (subscriber count, verified status)
-            if channel_metadata:
-                database.update_channel_metadata(
-                    channel_id,
-                    site,
-                    subscriber_count=channel_metadata.get("subscriber_count"),
-                    is_verified=channel_metadata.get("is_verified"),
-                )
-
             # Schedule avatar caching for YouTube channels
             if site.lower() == "youtube":
-                logger.debug(f"Scheduling avatar cache for {channel_id}")
+                logger.debug("Scheduling avatar cache for %s", channel_id)
                 avatar_cache.get_cache().schedule_background_fetch(channel_id)
 
             if pagination_info and pagination_info.get("pagination_limited"):
                 logger.warning(
-                    f"[Feed] {channel_id} ({site}): Pagination limited - "
-                    f"{pagination_info.get('total_fetched')} videos fetched "
-                    f"(reason: {pagination_info.get('limit_reason')})"
+                    "[Feed] %s (%s): Pagination limited - %s videos fetched (reason: %s)",
+                    channel_id,
+                    site,
+                    pagination_info.get("total_fetched"),
+                    pagination_info.get("limit_reason"),
                 )
-            logger.info(f"Fetched {len(videos)} videos for new subscription {channel_id} ({site})")
+            logger.info("Fetched %s videos for new subscription %s (%s)", len(videos), channel_id, site)
         else:
-            logger.warning(f"No videos found for new subscription {channel_id} ({site})")
-            database.update_fetch_status(channel_id, site, success=True)
+            logger.warning("No videos found for new subscription %s (%s)", channel_id, site)
+            await asyncio.to_thread(database.update_fetch_status, channel_id, site, success=True)
 
     except _FEED_FETCH_ERRORS as e:
         error_msg = str(e)[:200]
-        logger.error(f"Failed to fetch new subscription {channel_id} ({site}): {error_msg}")
-        database.update_fetch_status(channel_id, site, success=False, error=error_msg)
+        logger.error("Failed to fetch new subscription %s (%s): %s", channel_id, site, error_msg)
+        await asyncio.to_thread(database.update_fetch_status, channel_id, site, success=False, error=error_msg)
+
+
+async def _fetch_channel(
+    channel: Dict[str, Any],
+) -> tuple[Dict[str, Any], List[CachedVideo], Optional[Dict[str, Any]], Optional[Dict[str, Any]], Optional[str]]:
+    """Fetch one watched channel without writing to the database.
+
+    Args:
+        channel: Watched channel row with channel_id, site and channel_url
+
+    Returns:
+        Tuple of (channel, videos, pagination_info or None, channel_metadata or None, error or None)
+    """
+    channel_id = channel["channel_id"]
+    site = channel["site"]
+
+    try:
+        videos, pagination_info, channel_metadata = await fetch_channel_feed(channel_id, site, channel["channel_url"])
+    except _FEED_FETCH_ERRORS as e:
+        error_msg = str(e)[:200]  # Truncate long error messages
+        logger.error("Failed to fetch %s (%s): %s", channel_id, site, error_msg)
+        return channel, [], None, None, error_msg
+
+    return channel, videos, pagination_info, channel_metadata, None
+
+
+def _store_channel_result(
+    conn: sqlite3.Connection, result: tuple, prev_414: set[tuple[str, str]]
+) -> tuple[bool, bool, bool]:
+    """Persist one channel's fetch result on a shared connection.
+
+    Args:
+        conn: Connection owning the surrounding transaction
+        result: Tuple returned by _fetch_channel
+        prev_414: YouTube (channel_id, site) pairs whose last fetch hit a 414 error,
+            empty when yt-dlp fallback on 414 is disabled
+
+    Returns:
+        Tuple of (succeeded, pagination_limited, ytdlp_fallback_used)
+    """
+    channel, videos, pagination_info, channel_metadata, error = result
+    channel_id = channel["channel_id"]
+    site = channel["site"]
+
+    if error is not None:
+        database.update_fetch_status(channel_id, site, success=False, error=error, conn=conn)
+        return False, False, False
+
+    if not videos:
+        logger.warning("No videos found for %s (%s)", channel_id, site)
+        database.update_fetch_status(channel_id, site, success=True, conn=conn)
+        return True, False, False
+
+    _commit_channel_results(channel_id, site, videos, pagination_info, channel_metadata, conn=conn)
+
+    # Track if yt-dlp fallback was used (had 414 before, no pagination_info now means fallback used)
+    ytdlp_fallback_used = (channel_id, site) in prev_414 and not pagination_info
+
+    limited = bool(pagination_info and pagination_info.get("pagination_limited"))
+    if limited and pagination_info.get("limit_reason") == "414_error":
+        logger.warning(
+            "[Feed] %s (%s): 414 error - limited to %s videos", channel_id, site, pagination_info.get("total_fetched")
+        )
+
+    logger.debug("Cached %s videos for %s (%s)", len(videos), channel_id, site)
+    return True, limited, ytdlp_fallback_used
+
+
+def _store_channel_results(results: List[tuple], prev_414: set[tuple[str, str]]) -> List[tuple[bool, bool, bool]]:
+    """Persist a batch of fetch results in a single transaction.
+
+    Opens its own connection so it can run in a worker thread. If the batch fails,
+    each result is retried in its own transaction so one bad channel doesn't fail the rest.
+
+    Returns:
+        One (succeeded, pagination_limited, ytdlp_fallback_used) tuple per result
+    """
+    try:
+        with database.transaction() as conn:
+            return [_store_channel_result(conn, result, prev_414) for result in results]
+    except _FEED_STORE_ERRORS as e:
+        logger.warning("Failed to store feed results for %s channels, retrying one by one: %s", len(results), e)
+    return [_store_channel_result_alone(result, prev_414) for result in results]
+
+
+def _store_channel_result_alone(result: tuple, prev_414: set[tuple[str, str]]) -> tuple[bool, bool, bool]:
+    """Persist one fetch result in its own transaction, recording the error status if that fails."""
+    channel = result[0]
+    channel_id = channel["channel_id"]
+    site = channel["site"]
+    try:
+        with database.transaction() as conn:
+            return _store_channel_result(conn, result, prev_414)
+    except _FEED_STORE_ERRORS as e:
+        logger.error("Failed to store feed results for %s (%s): %s", channel_id, site, e)
+        error = f"Failed to store results: {e}"[:200]
+
+    try:
+        database.update_fetch_status(channel_id, site, success=False, error=error)
+    except sqlite3.Error as status_error:
+        logger.error("Failed to record fetch status for %s (%s): %s", channel_id, site, status_error)
+    return False, False, False
 
 
 async def fetch_all_channels():
@@ -503,124 +683,114 @@ async def fetch_all_channels():
         logger.info("No channels to fetch")
         return
 
-    logger.info(f"Starting feed fetch for {len(channels)} watched channels")
-
-    success_count = 0
-    error_count = 0
-    limited_count = 0
-    ytdlp_fallback_count = 0
+    logger.info("Starting feed fetch for %s watched channels", len(channels))
 
-    for channel in channels:
-        channel_id = channel["channel_id"]
-        site = channel["site"]
-        channel_url = channel["channel_url"]
+    s = get_settings()
+    semaphore = asyncio.Semaphore(s.feed_max_concurrent_channels)
 
-        try:
-            # Check if this channel had 414 error before (to detect fallback usage)
-            had_414_before = False
-            with database.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    "SELECT pagination_limit_reason FROM feed_fetch_status WHERE channel_id = ? AND site = ?",
-                    (channel_id, site),
+    async def fetch_with_limit(channel: Dict[str, Any]) -> tuple:
+        async with semaphore:
+            try:
+                return await _fetch_channel(channel)
+            except Exception as e:
+                logger.error("Unexpected error fetching %s (%s): %s", channel["channel_id"], channel["site"], e)
+                return channel, [], None, None, str(e)[:200]
+            finally:
+                # Delay before releasing the slot to avoid rate limiting
+                await asyncio.sleep(s.feed_channel_delay)
+
+    # YouTube channels whose last fetch hit a 414 error, used to detect yt-dlp fallback usage
+    prev_414: set[tuple[str, str]] = set()
+    if s.feed_fallback_ytdlp_on_414:
+        with database.get_connection() as conn:
+            prev_414 = {
+                (row[0], row[1])
+                for row in conn.execute(
+                    "SELECT channel_id, site FROM feed_fetch_status "
+                    "WHERE pagination_limit_reason = '414_error' AND LOWER(site) = 'youtube'"
                 )
-                row = cursor.fetchone()
-                if row and row[0] == "414_error":
-                    had_414_before = True
+            }
 
-            videos, pagination_info, channel_metadata = await fetch_channel_feed(channel_id, site, channel_url)
+    # Batches are written in a worker thread while the next channels are fetched.
+    # Each write waits for the previous one so batches commit in order.
+    write_tasks: List[asyncio.Task] = []
 
-            if videos:
-                database.upsert_cached_videos(channel_id, site, videos)
-                database.update_fetch_status(
-                    channel_id,
-                    site,
-                    success=True,
-                    max_videos_fetched=pagination_info.get("total_fetched") if pagination_info else len(videos),
-                    pagination_limited=pagination_info.get("pagination_limited", False) if pagination_info else False,
-                    pagination_limit_reason=pagination_info.get("limit_reason") if pagination_info else None,
-                )
+    async def write_batch(batch: List[tuple], previous: Optional[asyncio.Task]) -> List[tuple[bool, bool, bool]]:
+        if previous is not None:
+            await asyncio.wait([previous])
+        return await asyncio.to_thread(_store_channel_results, batch, prev_414)
 
-                # Save channel metadata if available (subscriber count, verified status)
-                if channel_metadata:
-                    database.update_channel_metadata(
-                        channel_id,
-                        site,
-                        subscriber_count=channel_metadata.get("subscriber_count"),
-                        is_verified=channel_metadata.get("is_verified"),
-                    )
-
-                # Schedule avatar caching for YouTube channels
-                if site.lower() == "youtube":
-                    avatar_cache.get_cache().schedule_background_fetch(channel_id)
-
-                # Track if yt-dlp fallback was used (had 414 before, no pagination_info now means fallback used)
-                s = get_settings()
-                ytdlp_fallback_used = (
-                    had_414_before
-                    and not pagination_info
-                    and s.feed_fallback_ytdlp_on_414
-                    and site.lower() == "youtube"
-                )
-                if ytdlp_fallback_used:
-                    ytdlp_fallback_count += 1
-
-                if pagination_info and pagination_info.get("pagination_limited"):
-                    limited_count += 1
-                    if pagination_info.get("limit_reason") == "414_error":
-                        logger.warning(
-                            f"[Feed] {channel_id} ({site}): 414 error - limited to "
-                            f"{pagination_info.get('total_fetched')} videos"
-                        )
-
-                logger.debug(f"Cached {len(videos)} videos for {channel_id} ({site})")
-                success_count += 1
-            else:
-                logger.warning(f"No videos found for {channel_id} ({site})")
-                database.update_fetch_status(channel_id, site, success=True)
-                success_count += 1
-
-        except _FEED_FETCH_ERRORS as e:
-            error_msg = str(e)[:200]  # Truncate long error messages
-            logger.error(f"Failed to fetch {channel_id} ({site}): {error_msg}")
-            database.update_fetch_status(channel_id, site, success=False, error=error_msg)
-            error_count += 1
-
-        # Delay between channel fetches to avoid rate limiting
-        s = get_settings()
-        await asyncio.sleep(s.feed_channel_delay)
+    def schedule_write(batch: List[tuple]) -> None:
+        previous = write_tasks[-1] if write_tasks else None
+        write_tasks.append(asyncio.create_task(write_batch(batch, previous)))
+
+    fetch_tasks = [asyncio.create_task(fetch_with_limit(c)) for c in channels]
+    try:
+        pending: List[tuple] = []
+        for next_result in asyncio.as_completed(fetch_tasks):
+            result = await next_result
+            channel, videos, _, _, error = result
+            # Avatar fetches are scheduled here, on the event loop, rather than in the writer thread
+            if error is None and videos and channel["site"].lower() == "youtube":
+                avatar_cache.get_cache().schedule_background_fetch(channel["channel_id"])
+            pending.append(result)
+            if len(pending) >= _FEED_WRITE_BATCH_SIZE:
+                schedule_write(pending)
+                pending = []
+        if pending:
+            schedule_write(pending)
+
+        outcomes: List[tuple[bool, bool, bool]] = []
+        for batch_outcomes in await asyncio.gather(*write_tasks):
+            outcomes.extend(batch_outcomes)
+    finally:
+        # as_completed() does not cancel its tasks, so a cancelled cycle (stop_feed_fetcher at shutdown)
+        # must stop the remaining fetches and writes itself
+        unfinished = [task for task in (*fetch_tasks, *write_tasks) if not task.done()]
+        for task in unfinished:
+            task.cancel()
+        if unfinished:
+            await asyncio.gather(*unfinished, return_exceptions=True)
 
     # Count 414 errors from database for final summary
-    limited_414_count = 0
     with database.get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM feed_fetch_status WHERE pagination_limit_reason = '414_error'")
-        row = cursor.fetchone()
-        if row:
-            limited_414_count = row[0]
+        limited_414_count = conn.execute(
+            "SELECT COUNT(*) FROM feed_fetch_status WHERE pagination_limit_reason = '414_error'"
+        ).fetchone()[0]
+
+    success_count = sum(1 for succeeded, _, _ in outcomes if succeeded)
+    error_count = len(outcomes) - success_count
+    limited_count = sum(1 for _, limited, _ in outcomes if limited)
+    ytdlp_fallback_count = sum(1 for _, _, fallback in outcomes if fallback)
 
-    s = get_settings()
     if ytdlp_fallback_count > 0 and s.feed_fallback_ytdlp_on_414:
         logger.info(
-            f"Feed fetch complete: {success_count} succeeded, {error_count} failed, "
-            f"{limited_count} pagination-limited this cycle ({limited_414_count} total with 414 errors), "
-            f"{ytdlp_fallback_count} used yt-dlp fallback"
+            "Feed fetch complete: %s succeeded, %s failed, %s pagination-limited this cycle "
+            "(%s total with 414 errors), %s used yt-dlp fallback",
+            success_count,
+            error_count,
+            limited_count,
+            limited_414_count,
+            ytdlp_fallback_count,
         )
     else:
         logger.info(
-            f"Feed fetch complete: {success_count} succeeded, {error_count} failed, "
-            f"{limited_count} pagination-limited this cycle ({limited_414_count} total with 414 errors)"
+            "Feed fetch complete: %s succeeded, %s failed, %s pagination-limited this cycle (%s total with 414 errors)",
+            success_count,
+            error_count,
+            limited_count,
+            limited_414_count,
         )
 
 
 async def feed_fetch_loop():
     """Main loop for periodic feed fetching."""
     while True:
+        s = get_settings()
         try:
             await fetch_all_channels()
 
             # Cleanup old cached videos
-            s = get_settings()
             database.cleanup_old_cached_videos(days=s.feed_video_max_age)
 
             # Cleanup stale watched channels (not requested in 14 days)
@@ -630,11 +800,10 @@ async def feed_fetch_loop():
             database.cleanup_orphaned_cached_videos()
 
         except Exception as e:
-            logger.error(f"Feed fetch loop error: {e}", exc_info=True)
+            logger.error("Feed fetch loop error: %s", e, exc_info=True)
 
-        # Wait for next fetch cycle
-        s = get_settings()
-        await asyncio.sleep(s.feed_fetch_interval)
+        # Wait for next fetch cycle; re-read settings so an interval changed during the cycle applies now
+        await asyncio.sleep(get_settings().feed_fetch_interval)
 
 
 def start_feed_fetcher():
@@ -643,7 +812,7 @@ def start_feed_fetcher():
     if _fetch_task is None or _fetch_task.done():
         _fetch_task = asyncio.create_task(feed_fetch_loop())
         s = get_settings()
-        logger.info(f"Started feed fetcher (interval: {s.feed_fetch_interval}s)")
+        logger.info("Started feed fetcher (interval: %ss)", s.feed_fetch_interval)
 
 
 def stop_feed_fetcher():
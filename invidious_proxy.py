@@ -1,15 +1,20 @@
 """Invidious proxy client for fallback endpoints."""
 
 import asyncio
+import functools
+import importlib.util
 import logging
+import random
+import time
 import urllib.parse
 from typing import Any, List, Optional
 
 import httpx
+import orjson
+from cachetools import TLRUCache, TTLCache
 from fastapi import APIRouter, HTTPException, Request
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
 
-from converters import resolve_invidious_url
 from models import Thumbnail
 from settings import get_settings
 from ytdlp_wrapper import YtDlpError
@@ -20,30 +25,79 @@ router = APIRouter(tags=["companion"])
 # Configure logging
 logger = logging.getLogger("invidious_proxy")
 
+# HTTP/2 needs the optional h2 package (httpx[http2]); without it the client stays on HTTP/1.1
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
 # Shared HTTP client for connection pooling
 _client: Optional[httpx.AsyncClient] = None
-_client_timeout: Optional[int] = None
+_client_config: Optional[tuple] = None
+_client_lock = asyncio.Lock()
 
 
 async def get_client() -> httpx.AsyncClient:
     """Get or create the shared HTTP client."""
-    global _client, _client_timeout
+    global _client, _client_config
     s = get_settings()
-    # Recreate client if timeout setting changed
-    if _client is None or _client.is_closed or _client_timeout != s.invidious_timeout:
+    config = (s.invidious_timeout, s.invidious_max_connections, s.invidious_max_keepalive, s.invidious_keepalive_expiry)
+    if _client is not None and not _client.is_closed and _client_config == config:
+        return _client
+
+    # Serialize (re)creation so concurrent first requests don't each build and leak a client
+    async with _client_lock:
+        # Recreate client if timeout or pool settings changed
+        if _client is None or _client.is_closed or _client_config != config:
+            if _client is not None and not _client.is_closed:
+                await _client.aclose()
+            _client = httpx.AsyncClient(
+                timeout=httpx.Timeout(s.invidious_timeout),
+                follow_redirects=True,
+                http2=_HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_connections=s.invidious_max_connections,
+                    max_keepalive_connections=s.invidious_max_keepalive,
+                    keepalive_expiry=s.invidious_keepalive_expiry,
+                ),
+            )
+            _client_config = config
+        return _client
+
+
+async def warm_up_client() -> None:
+    """Create the shared client and open a connection to the instance ahead of the first request.
+
+    Resolves DNS and completes the TLS handshake at startup. Failures are only logged.
+    """
+    client = await get_client()
+    if not is_enabled():
+        return
+    try:
+        await client.head(get_base_url(), timeout=2.0)
+    except httpx.HTTPError as e:
+        logger.info("[Invidious] Connection warm-up failed: %s", e)
+
+
+async def close_client() -> None:
+    """Close the shared HTTP client."""
+    global _client, _client_config
+    async with _client_lock:
         if _client is not None and not _client.is_closed:
             await _client.aclose()
-        _client = httpx.AsyncClient(timeout=httpx.Timeout(s.invidious_timeout), follow_redirects=True)
-        _client_timeout = s.invidious_timeout
-    return _client
+        _client = None
+        _client_config = None
 
 
 def is_enabled() -> bool:
     """Check if Invidious proxy is configured and enabled."""
     s = get_settings()
-    if not s.invidious_enabled:
+    return _is_instance_enabled(s.invidious_enabled, s.invidious_instance)
+
+
+@functools.lru_cache(maxsize=1)
+def _is_instance_enabled(enabled: bool, instance: Optional[str]) -> bool:
+    """Check the enabled flag and instance URL, cached on their values like _normalize_base_url."""
+    if not enabled:
         return False
-    return s.invidious_instance is not None and s.invidious_instance.strip() != ""
+    return instance is not None and instance.strip() != ""
 
 
 def get_base_url() -> str:
@@ -52,10 +106,163 @@ def get_base_url() -> str:
     The URL is admin-configured and trusted — SSRF checks are
     applied only to user-supplied URLs at their respective endpoints.
     """
-    s = get_settings()
-    if not s.invidious_instance:
+    return _normalize_base_url(get_settings().invidious_instance)
+
+
+@functools.lru_cache(maxsize=1)
+def _normalize_base_url(instance: Optional[str]) -> str:
+    """Strip the configured instance URL down to a base URL.
+
+    Keyed on the configured value, so a settings change is picked up without clearing the cache.
+    """
+    if not instance:
         return ""
-    return s.invidious_instance.rstrip("/")
+    return instance.rstrip("/")
+
+
+# Characters urllib.parse.quote leaves as-is with its default safe="/"
+_UNQUOTED_CHARS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_.~/")
+
+
+def _quote_id(value: str) -> str:
+    """Quote a video/channel/playlist ID for a URL path.
+
+    Same result as urllib.parse.quote, but IDs are almost always plain
+    [A-Za-z0-9_-] and are returned without going through the quoter.
+    """
+    if _UNQUOTED_CHARS.issuperset(value):
+        return value
+    return urllib.parse.quote(value)
+
+
+@functools.lru_cache(maxsize=2048)
+def _quote_query(query: str) -> str:
+    """Quote a search query for a URL, cached since the same searches repeat."""
+    return urllib.parse.quote(query)
+
+
+# Upper bound for a single fetch_json retry delay, in seconds
+_MAX_RETRY_DELAY = 30.0
+
+# In-flight fetch_json requests by (instance base URL, endpoint), shared by concurrent callers
+_inflight: dict[tuple[Optional[str], str], asyncio.Task] = {}
+
+# Seconds to cache successful JSON responses, by endpoint prefix (first match wins).
+# Endpoints not listed here (search, comments) are not cached.
+_RESPONSE_CACHE_TTLS = (
+    ("/api/v1/trending", 300),
+    ("/api/v1/popular", 600),
+    ("/api/v1/search/suggestions", 3600),
+    ("/api/v1/videos/", 900),
+    ("/api/v1/playlists/", 300),
+    ("/api/v1/channels/", 120),
+)
+
+# Seconds to cache proxied thumbnail and storyboard bodies, by upstream path prefix
+_MEDIA_CACHE_TTLS = (
+    ("/vi/", 3600),
+    ("/api/v1/storyboards/", 900),
+)
+_MEDIA_CACHE_MAX_BYTES = 128 * 1024 * 1024
+_MEDIA_CHUNK_SIZE = 64 * 1024
+
+
+def _cache_ttl(path: str, ttls: tuple) -> int:
+    """Get the cache TTL for a path from a prefix table, 0 if it isn't cached."""
+    for prefix, ttl in ttls:
+        if path.startswith(prefix):
+            return ttl
+    return 0
+
+
+# Keyed by (base URL, path) so a changed instance never serves responses from the old one
+_response_cache = TLRUCache(maxsize=4096, ttu=lambda key, value, now: now + _cache_ttl(key[1], _RESPONSE_CACHE_TTLS))
+# Values are (content, status_code, headers); sized by body length
+_media_cache = TLRUCache(
+    maxsize=_MEDIA_CACHE_MAX_BYTES,
+    ttu=lambda key, value, now: now + _cache_ttl(key[1], _MEDIA_CACHE_TTLS),
+    getsizeof=lambda value: len(value[0]),
+)
+# Serialized yt-dlp caption lists by (video_id, user_id, request base URL); caption URLs embed both.
+# Ten minutes is far inside the 24h lifetime of the caption tokens in those URLs.
+_captions_cache: TTLCache = TTLCache(maxsize=2048, ttl=600)
+
+
+def clear_response_caches() -> None:
+    """Clear cached Invidious JSON responses, proxied media and serialized captions."""
+    _response_cache.clear()
+    _media_cache.clear()
+    _captions_cache.clear()
+
+
+class _RateLimiter:
+    """Token bucket that spaces out requests to the Invidious instance.
+
+    Each acquire takes a token, letting the balance go negative so that
+    concurrent callers queue up in order without a lock.
+    """
+
+    def __init__(self):
+        self._tokens = 0.0
+        self._updated = 0.0
+
+    def reset(self) -> None:
+        self._tokens = 0.0
+        self._updated = 0.0
+
+    async def acquire(self, rate: float) -> None:
+        now = time.monotonic()
+        if self._updated:
+            # Refill, allowing bursts of up to one second's worth of requests
+            self._tokens = min(rate, self._tokens + (now - self._updated) * rate)
+        else:
+            self._tokens = rate
+        self._updated = now
+        self._tokens -= 1
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / rate)
+
+
+class _CircuitBreaker:
+    """Fail fast after repeated transient Invidious errors.
+
+    Once failures reach the threshold, requests are refused until the
+    cooldown has passed. The next request is then let through, and a
+    further failure reopens the breaker immediately.
+    """
+
+    def __init__(self):
+        self._failures = 0
+        self._open_until = 0.0
+
+    def reset(self) -> None:
+        self._failures = 0
+        self._open_until = 0.0
+
+    def is_open(self) -> bool:
+        return time.monotonic() < self._open_until
+
+    def record_success(self) -> None:
+        self._failures = 0
+
+    def record_failure(self, threshold: int, cooldown: float) -> None:
+        self._failures += 1
+        if self._failures >= threshold:
+            if not self.is_open():
+                logger.warning(
+                    "[Invidious] %s consecutive failures, pausing requests for %.0fs", self._failures, cooldown
+                )
+            self._open_until = time.monotonic() + cooldown
+
+
+_rate_limiter = _RateLimiter()
+_circuit_breaker = _CircuitBreaker()
+
+
+def reset_request_guards() -> None:
+    """Reset the Invidious rate limiter and circuit breaker."""
+    _rate_limiter.reset()
+    _circuit_breaker.reset()
 
 
 async def fetch_json(endpoint: str) -> Any:
@@ -64,17 +271,40 @@ async def fetch_json(endpoint: str) -> Any:
     Retries transient errors (500, 502, 503, 504, 408, 429, timeouts)
     with exponential backoff. Non-retryable errors (400, 401, 403, 404, 414)
     are raised immediately.
+
+    Concurrent calls for the same endpoint share one upstream request, so
+    callers must not mutate the returned data. Requests are rate limited,
+    and while the circuit breaker is open they fail immediately.
     """
     if not is_enabled():
         return None
 
+    # Keyed by instance too, so callers never join a request to an instance that was since replaced
+    key = (get_base_url(), endpoint)
+
+    # Serve cache hits directly, without creating a task
+    cached = _response_cache.get(key)
+    if cached is not None:
+        return cached
+
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(_fetch_json(endpoint))
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    # Shield so one cancelled caller doesn't cancel the request for the others
+    return await asyncio.shield(task)
+
+
+async def _fetch_json(endpoint: str) -> Any:
+    """Fetch JSON for fetch_json without request coalescing or the response cache lookup."""
+    s = get_settings()
     base = get_base_url()
     if not base:
         raise InvidiousProxyError("Invidious instance URL validation failed (DNS or SSRF check)")
 
-    client = await get_client()
     url = f"{base}{endpoint}"
-    s = get_settings()
+    client = await get_client()
 
     max_retries = s.invidious_max_retries
     base_delay = s.invidious_retry_delay
@@ -82,53 +312,94 @@ async def fetch_json(endpoint: str) -> Any:
 
     for attempt in range(max_retries + 1):  # +1 for initial attempt
         if attempt > 0:
-            delay = base_delay * (2 ** (attempt - 1))  # Exponential backoff
-            logger.info(f"[Invidious] Retry {attempt}/{max_retries} for {endpoint} after {delay:.1f}s")
+            # Exponential backoff with full jitter, so callers failing together don't retry in lockstep
+            delay = random.uniform(0, min(base_delay * (2 ** (attempt - 1)), _MAX_RETRY_DELAY))
+            logger.info("[Invidious] Retry %s/%s for %s after %.1fs", attempt, max_retries, endpoint, delay)
             await asyncio.sleep(delay)
 
-        logger.info(f"[Invidious] Proxy request: {endpoint}" + (f" (attempt {attempt + 1})" if attempt > 0 else ""))
+        # Checked on every attempt, so retries stop as soon as the breaker opens
+        if _circuit_breaker.is_open():
+            raise InvidiousProxyError("Invidious temporarily unavailable (circuit breaker open)", status_code=503)
+
+        if attempt > 0:
+            logger.info("[Invidious] Proxy request: %s (attempt %s)", endpoint, attempt + 1)
+        else:
+            logger.info("[Invidious] Proxy request: %s", endpoint)
 
         try:
+            await _rate_limiter.acquire(s.invidious_requests_per_second)
             response = await client.get(url)
             response.raise_for_status()
-            logger.info(f"[Invidious] Proxy success: {endpoint} ({response.status_code})")
-            return response.json()
+            _circuit_breaker.record_success()
+            logger.info("[Invidious] Proxy success: %s (%s)", endpoint, response.status_code)
+            # Parsed inline on purpose: orjson holds the GIL for the whole
+            # parse, so handing it to a worker thread would block the loop just as long plus dispatch
+            data = orjson.loads(response.content)
+            if data is not None and _cache_ttl(endpoint, _RESPONSE_CACHE_TTLS):
+                _response_cache[(base, endpoint)] = data
+            return data
         except httpx.HTTPStatusError as e:
             status_code = e.response.status_code
             error_msg = f"HTTP {status_code}: {e.response.text[:200]}"
-            logger.warning(f"[Invidious] Proxy error: {endpoint} - {error_msg}")
+            logger.warning("[Invidious] Proxy error: %s - %s", endpoint, error_msg)
             last_error = InvidiousProxyError.from_http_status(status_code, error_msg)
 
-            # Don't retry non-retryable errors
+            # Don't retry non-retryable errors; the instance did answer, so they don't trip the breaker
             if not last_error.is_retryable:
+                _circuit_breaker.record_success()
                 raise last_error
+            _circuit_breaker.record_failure(s.invidious_breaker_threshold, s.invidious_breaker_cooldown)
 
         except httpx.TimeoutException as e:
             error_msg = f"Timeout: {e}"
-            logger.warning(f"[Invidious] Proxy timeout: {endpoint} - {e}")
+            logger.warning("[Invidious] Proxy timeout: %s - %s", endpoint, e)
             last_error = InvidiousProxyError.from_connection_error(error_msg)
+            _circuit_breaker.record_failure(s.invidious_breaker_threshold, s.invidious_breaker_cooldown)
 
         except httpx.RequestError as e:
             error_msg = f"Request failed: {e}"
-            logger.warning(f"[Invidious] Proxy error: {endpoint} - {e}")
+            logger.warning("[Invidious] Proxy error: %s - %s", endpoint, e)
             last_error = InvidiousProxyError.from_connection_error(error_msg)
+            _circuit_breaker.record_failure(s.invidious_breaker_threshold, s.invidious_breaker_cooldown)
 
         except (ValueError, TypeError) as e:
             error_msg = f"Unexpected error: {e}"
-            logger.warning(f"[Invidious] Proxy error: {endpoint} - {e}")
+            logger.warning("[Invidious] Proxy error: %s - %s", endpoint, e)
             # Unexpected errors are not retryable
             raise InvidiousProxyError(error_msg, status_code=None, is_retryable=False)
 
     # All retries exhausted
-    logger.warning(f"[Invidious] All {max_retries} retries exhausted for {endpoint}")
+    logger.warning("[Invidious] All %s retries exhausted for %s", max_retries, endpoint)
     if last_error:
         raise last_error
     raise InvidiousProxyError(f"Failed after {max_retries} retries", is_retryable=True)
 
 
+# Fixed endpoint prefixes for the common search types and trending regions. Unlisted values are
+# quoted, and every caller builds the same endpoint string so response cache keys stay consistent.
+_SEARCH_ENDPOINTS = {t: f"/api/v1/search?type={t}" for t in ("video", "channel", "playlist", "all")}
+_TRENDING_ENDPOINTS = {r: f"/api/v1/trending?region={r}" for r in ("US", "GB", "DE", "FR", "CA", "JP", "IN", "BR")}
+
+
+def _search_endpoint(type: str) -> str:
+    """Get the search endpoint prefix for a result type."""
+    endpoint = _SEARCH_ENDPOINTS.get(type)
+    if endpoint is None:
+        endpoint = f"/api/v1/search?type={_quote_query(type)}"
+    return endpoint
+
+
+def _trending_endpoint(region: str) -> str:
+    """Get the trending endpoint for a region."""
+    endpoint = _TRENDING_ENDPOINTS.get(region)
+    if endpoint is None:
+        endpoint = f"/api/v1/trending?region={_quote_query(region)}"
+    return endpoint
+
+
 async def get_trending(region: str = "US") -> List[dict]:
     """Get trending videos from Invidious."""
-    data = await fetch_json(f"/api/v1/trending?region={region}")
+    data = await fetch_json(_trending_endpoint(region))
     return data if isinstance(data, list) else []
 
 
@@ -140,7 +411,7 @@ async def get_popular() -> List[dict]:
 
 async def get_search_suggestions(query: str) -> List[str]:
     """Get search suggestions from Invidious."""
-    encoded_query = urllib.parse.quote(query)
+    encoded_query = _quote_query(query)
     data = await fetch_json(f"/api/v1/search/suggestions?q={encoded_query}")
 
     if isinstance(data, dict) and "suggestions" in data:
@@ -159,22 +430,23 @@ async def search(query: str, type: str = "video", page: int = 1) -> List[dict]:
     Returns:
         List of search results matching the specified type
     """
-    encoded_query = urllib.parse.quote(query)
-    data = await fetch_json(f"/api/v1/search?q={encoded_query}&type={type}&page={page}")
+    encoded_query = _quote_query(query)
+    data = await fetch_json(f"{_search_endpoint(type)}&q={encoded_query}&page={page}")
     return data if isinstance(data, list) else []
 
 
 async def get_channel(channel_id: str) -> Optional[dict]:
     """Get channel info from Invidious."""
-    encoded_id = urllib.parse.quote(channel_id)
+    encoded_id = _quote_id(channel_id)
     return await fetch_json(f"/api/v1/channels/{encoded_id}")
 
 
-async def get_channel_thumbnails(channel_id: str) -> List[Thumbnail]:
+async def get_channel_thumbnails(channel_id: str, channel_data: Optional[dict] = None) -> List[Thumbnail]:
     """Get channel/author thumbnails from Invidious.
 
     Args:
         channel_id: The channel ID to fetch thumbnails for
+        channel_data: Channel info the caller already fetched, to skip the extra request
 
     Returns:
         List of Thumbnail objects, empty if not available or error occurs
@@ -183,15 +455,24 @@ async def get_channel_thumbnails(channel_id: str) -> List[Thumbnail]:
         return []
 
     try:
-        channel_data = await get_channel(channel_id)
+        if channel_data is None:
+            channel_data = await get_channel(channel_id)
         if channel_data and "authorThumbnails" in channel_data:
+            # get_base_url() is already normalized without a trailing slash, so relative
+            # paths resolve with a plain concatenation. The fields come straight from the
+            # Invidious response shape, so model_construct skips per-thumbnail validation.
             invidious_base = get_base_url()
             thumbnails = []
             for thumb in channel_data.get("authorThumbnails", []):
+                url = thumb.get("url", "")
+                if url.startswith("//"):
+                    url = "https:" + url
+                elif url.startswith("/"):
+                    url = invidious_base + url
                 thumbnails.append(
-                    Thumbnail(
+                    Thumbnail.model_construct(
                         quality=thumb.get("quality", "default"),
-                        url=resolve_invidious_url(thumb.get("url", ""), invidious_base),
+                        url=url,
                         width=thumb.get("width"),
                         height=thumb.get("height"),
                     )
@@ -205,13 +486,13 @@ async def get_channel_thumbnails(channel_id: str) -> List[Thumbnail]:
 
 async def get_video(video_id: str) -> Optional[dict]:
     """Get video info from Invidious."""
-    encoded_id = urllib.parse.quote(video_id)
+    encoded_id = _quote_id(video_id)
     return await fetch_json(f"/api/v1/videos/{encoded_id}")
 
 
 async def get_playlist(playlist_id: str) -> Optional[dict]:
     """Get playlist info from Invidious."""
-    encoded_id = urllib.parse.quote(playlist_id)
+    encoded_id = _quote_id(playlist_id)
     return await fetch_json(f"/api/v1/playlists/{encoded_id}")
 
 
@@ -226,7 +507,7 @@ async def _fetch_channel_tab(channel_id: str, tab: str, continuation: Optional[s
     Returns:
         Response dict from Invidious API
     """
-    encoded_id = urllib.parse.quote(channel_id)
+    encoded_id = _quote_id(channel_id)
     endpoint = f"/api/v1/channels/{encoded_id}/{tab}"
     if continuation:
         endpoint += f"?continuation={urllib.parse.quote(continuation)}"
@@ -238,6 +519,10 @@ async def get_channel_videos(channel_id: str, continuation: Optional[str] = None
     return await _fetch_channel_tab(channel_id, "videos", continuation)
 
 
+# Continuation tokens longer than this would push the request URI past common server limits (~8 KB)
+_MAX_CONTINUATION_LENGTH = 8000
+
+
 async def get_channel_videos_multi_page(channel_id: str, max_videos: int = 60) -> dict:
     """Get channel videos from Invidious with automatic pagination.
 
@@ -260,24 +545,41 @@ async def get_channel_videos_multi_page(channel_id: str, max_videos: int = 60) -
             - limit_reason: Reason pagination stopped ("414_error", "no_continuation", "max_reached")
     """
     all_videos = []
+    total_fetched = 0
     continuation = None
     page_count = 0
     pagination_limited = False
     limit_reason = None
 
     # Keep fetching pages until we have enough videos or no more pages
-    while len(all_videos) < max_videos:
+    while total_fetched < max_videos:
+        # A token this long would make the request URI too large, so skip the doomed request
+        if continuation and len(continuation) > _MAX_CONTINUATION_LENGTH:
+            logger.warning(
+                "[Invidious Multi-Page] %s: Continuation token too long (%s chars), stopping at %s videos",
+                channel_id,
+                len(continuation),
+                len(all_videos),
+            )
+            pagination_limited = True
+            limit_reason = "414_error"
+            break
+
         page_count += 1
 
         try:
             data = await get_channel_videos(channel_id, continuation)
         except InvidiousProxyError as e:
             # Handle 414 URI Too Large errors (continuation tokens can be extremely long)
-            if "414" in str(e):
+            if e.status_code == 414:
                 token_length = len(continuation) if continuation else 0
                 logger.warning(
-                    f"[Invidious Multi-Page] {channel_id}: 414 URI Too Large on page {page_count}, "
-                    f"stopping at {len(all_videos)} videos. Token length: ~{token_length} chars"
+                    "[Invidious Multi-Page] %s: 414 URI Too Large on page %s, "
+                    "stopping at %s videos. Token length: ~%s chars",
+                    channel_id,
+                    page_count,
+                    len(all_videos),
+                    token_length,
                 )
                 pagination_limited = True
                 limit_reason = "414_error"
@@ -286,20 +588,26 @@ async def get_channel_videos_multi_page(channel_id: str, max_videos: int = 60) -
             raise
 
         if not data or "videos" not in data:
-            logger.debug(f"[Invidious Multi-Page] {channel_id}: No data on page {page_count}, stopping")
+            logger.debug("[Invidious Multi-Page] %s: No data on page %s, stopping", channel_id, page_count)
             limit_reason = "no_data"
             break
 
         videos = data.get("videos", [])
         if not videos:
-            logger.debug(f"[Invidious Multi-Page] {channel_id}: No videos on page {page_count}, stopping")
+            logger.debug("[Invidious Multi-Page] %s: No videos on page %s, stopping", channel_id, page_count)
             limit_reason = "no_videos"
             break
 
-        all_videos.extend(videos)
+        # Keep only what's still needed, so surplus videos from the last page are released with it
+        total_fetched += len(videos)
+        all_videos.extend(videos[: max_videos - len(all_videos)])
         logger.debug(
-            f"[Invidious Multi-Page] {channel_id}: Page {page_count} fetched "
-            f"{len(videos)} videos, total: {len(all_videos)}/{max_videos}"
+            "[Invidious Multi-Page] %s: Page %s fetched %s videos, total: %s/%s",
+            channel_id,
+            page_count,
+            len(videos),
+            total_fetched,
+            max_videos,
         )
 
         # Check if there's a continuation token for next page
@@ -307,26 +615,30 @@ async def get_channel_videos_multi_page(channel_id: str, max_videos: int = 60) -
         if not continuation:
             # No more pages available
             logger.debug(
-                f"[Invidious Multi-Page] {channel_id}: No continuation token, "
-                f"channel has {len(all_videos)} videos total"
+                "[Invidious Multi-Page] %s: No continuation token, channel has %s videos total",
+                channel_id,
+                total_fetched,
             )
             limit_reason = "no_continuation"
             break
 
     # Determine final status
-    result_count = len(all_videos)
+    result_count = total_fetched
     if result_count >= max_videos:
         limit_reason = "max_reached"
 
     if result_count > 0:
         logger.info(
-            f"[Invidious Multi-Page] {channel_id}: Fetched {result_count} videos "
-            f"using {page_count} API call(s) [reason: {limit_reason}]"
+            "[Invidious Multi-Page] %s: Fetched %s videos using %s API call(s) [reason: %s]",
+            channel_id,
+            result_count,
+            page_count,
+            limit_reason,
         )
 
     # Return videos and metadata
     return {
-        "videos": all_videos[:max_videos],
+        "videos": all_videos,
         "total_fetched": result_count,
         "pages_fetched": page_count,
         "pagination_limited": pagination_limited,
@@ -336,7 +648,7 @@ async def get_channel_videos_multi_page(channel_id: str, max_videos: int = 60) -
 
 async def get_comments(video_id: str, continuation: Optional[str] = None) -> Optional[dict]:
     """Get video comments from Invidious."""
-    encoded_id = urllib.parse.quote(video_id)
+    encoded_id = _quote_id(video_id)
     endpoint = f"/api/v1/comments/{encoded_id}"
     if continuation:
         endpoint += f"?continuation={urllib.parse.quote(continuation)}"
@@ -369,8 +681,8 @@ async def search_channel(channel_id: str, query: str, page: int = 1) -> dict:
     Returns:
         Dict with 'videos' list and optional 'continuation' token
     """
-    encoded_id = urllib.parse.quote(channel_id)
-    encoded_query = urllib.parse.quote(query)
+    encoded_id = _quote_id(channel_id)
+    encoded_query = _quote_query(query)
     endpoint = f"/api/v1/channels/{encoded_id}/search?q={encoded_query}&page={page}"
     return await fetch_json(endpoint)
 
@@ -424,7 +736,7 @@ async def get_captions(video_id: str, request: Request, token: str = None):
         if query_string:
             url = f"{url}?{query_string}"
 
-        logger.info(f"[Captions] Invidious proxy request: {video_id}")
+        logger.info("[Captions] Invidious proxy request: %s", video_id)
 
         try:
             response = await client.get(url)
@@ -435,43 +747,49 @@ async def get_captions(video_id: str, request: Request, token: str = None):
 
             return Response(content=response.content, status_code=response.status_code, headers=headers)
         except httpx.HTTPStatusError as e:
-            logger.warning(f"[Captions] Invidious error: {video_id} - HTTP {e.response.status_code}")
+            logger.warning("[Captions] Invidious error: %s - HTTP %s", video_id, e.response.status_code)
             raise HTTPException(status_code=e.response.status_code, detail=str(e))
         except httpx.RequestError as e:
-            logger.warning(f"[Captions] Invidious error: {video_id} - {e}")
+            logger.warning("[Captions] Invidious error: %s - %s", video_id, e)
             raise HTTPException(status_code=502, detail=f"Upstream error: {e}")
         except (ValueError, KeyError, TypeError) as e:
-            logger.warning(f"[Captions] Invidious error: {video_id} - {e}", exc_info=True)
+            logger.warning("[Captions] Invidious error: %s - %s", video_id, e, exc_info=True)
             raise HTTPException(status_code=500, detail=str(e))
 
     # Use yt-dlp directly
-    logger.info(f"[Captions] yt-dlp request: {video_id}")
+    logger.info("[Captions] yt-dlp request: %s", video_id)
 
     try:
         import ytdlp_wrapper
         from converters import convert_captions
         from utils import get_base_url as get_request_base_url
 
-        info = await ytdlp_wrapper.get_video_info(video_id)
-
         # Get base URL for proxy endpoints
         base_url = get_request_base_url(request)
 
-        captions = convert_captions(
-            info.get("subtitles"), info.get("automatic_captions"), video_id, base_url, user_id=user_id
-        )
+        cache_key = (video_id, user_id, base_url)
+        content = _captions_cache.get(cache_key)
+        if content is None:
+            info = await ytdlp_wrapper.get_video_info(video_id)
+
+            captions = convert_captions(
+                info.get("subtitles"), info.get("automatic_captions"), video_id, base_url, user_id=user_id
+            )
 
-        # Return in Invidious-compatible format
-        return {"captions": [c.model_dump() for c in captions]}
+            # Serialize in Invidious-compatible format once per cache entry
+            content = orjson.dumps({"captions": captions}, default=lambda c: c.model_dump())
+            _captions_cache[cache_key] = content
+
+        return Response(content=content, media_type="application/json")
 
     except ValueError as e:
-        logger.warning(f"[Captions] Invalid video ID: {video_id} - {e}")
+        logger.warning("[Captions] Invalid video ID: %s - %s", video_id, e)
         raise HTTPException(status_code=400, detail=str(e))
     except YtDlpError as e:
-        logger.warning(f"[Captions] yt-dlp error: {video_id} - {e}")
+        logger.warning("[Captions] yt-dlp error: %s - %s", video_id, e)
         raise HTTPException(status_code=502, detail=str(e))
     except (KeyError, TypeError) as e:
-        logger.warning(f"[Captions] yt-dlp error: {video_id} - {e}", exc_info=True)
+        logger.warning("[Captions] yt-dlp error: %s - %s", video_id, e, exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -532,7 +850,7 @@ async def get_caption_content(
     # Validate token if basic auth is enabled
     _validate_resource_token(token, video_id)
 
-    logger.info(f"[Captions] Content request: {video_id} lang={lang} auto={auto} format={format}")
+    logger.info("[Captions] Content request: %s lang=%s auto=%s format=%s", video_id, lang, auto, format)
 
     try:
         import ytdlp_wrapper
@@ -542,7 +860,7 @@ async def get_caption_content(
         )
 
         if not content:
-            logger.warning(f"[Captions] 404 for {video_id} lang={lang} auto={auto} format={format}")
+            logger.warning("[Captions] 404 for %s lang=%s auto=%s format=%s", video_id, lang, auto, format)
             raise HTTPException(status_code=404, detail=f"Caption not found: lang={lang}, auto={auto}")
 
         return Response(
@@ -552,18 +870,68 @@ async def get_caption_content(
         )
 
     except ValueError as e:
-        logger.warning(f"[Captions] Invalid video ID: {video_id} - {e}")
+        logger.warning("[Captions] Invalid video ID: %s - %s", video_id, e)
         raise HTTPException(status_code=400, detail=str(e))
     except HTTPException:
         raise
     except YtDlpError as e:
-        logger.warning(f"[Captions] Content fetch error: {video_id} - {e}")
+        logger.warning("[Captions] Content fetch error: %s - %s", video_id, e)
         raise HTTPException(status_code=502, detail=str(e))
     except (KeyError, TypeError, OSError) as e:
-        logger.warning(f"[Captions] Content fetch error: {video_id} - {e}", exc_info=True)
+        logger.warning("[Captions] Content fetch error: %s - %s", video_id, e, exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _cached_media_response(base: str, path: str) -> Optional[Response]:
+    """Build a response from the media cache, or None on a miss."""
+    cached = _media_cache.get((base, path))
+    if cached is None:
+        return None
+    content, status_code, headers = cached
+    return Response(content=content, status_code=status_code, headers=headers)
+
+
+def _is_media_cacheable(path: str, response: httpx.Response) -> bool:
+    """Check if an upstream media response may be cached: a 200 that doesn't forbid storing."""
+    cache_control = response.headers.get("cache-control", "").lower()
+    if response.status_code != 200 or "no-store" in cache_control or "private" in cache_control:
+        return False
+    return _cache_ttl(path, _MEDIA_CACHE_TTLS) > 0
+
+
+async def _stream_media_response(
+    client: httpx.AsyncClient, base: str, path: str, copy_headers: tuple[str, ...]
+) -> StreamingResponse:
+    """Stream an upstream media response to the client without buffering it first.
+
+    Cacheable bodies are collected while streaming and cached once fully sent.
+    """
+    response = await client.send(client.build_request("GET", f"{base}{path}"), stream=True)
+
+    headers = {name: response.headers[name] for name in copy_headers if name in response.headers}
+    # Bodies are forwarded decoded, so the upstream length only holds when there is no content-encoding
+    if "content-length" in response.headers and "content-encoding" not in response.headers:
+        headers["content-length"] = response.headers["content-length"]
+    cacheable = _is_media_cacheable(path, response)
+
+    async def body():
+        chunks = []
+        try:
+            async for chunk in response.aiter_bytes(_MEDIA_CHUNK_SIZE):
+                if cacheable:
+                    chunks.append(chunk)
+                yield chunk
+        finally:
+            await response.aclose()
+        if cacheable:
+            try:
+                _media_cache[(base, path)] = (b"".join(chunks), response.status_code, headers)
+            except ValueError:
+                pass  # Larger than the whole cache budget
+
+    return StreamingResponse(body(), status_code=response.status_code, headers=headers)
+
+
 @router.get("/storyboards/{video_id}")
 async def proxy_storyboards(video_id: str, request: Request):
     """Proxy storyboard requests to Invidious.
@@ -577,28 +945,27 @@ async def proxy_storyboards(video_id: str, request: Request):
     client = await get_client()
 
     query_string = str(request.query_params)
-    url = f"{get_base_url()}/api/v1/storyboards/{video_id}"
+    base = get_base_url()
+    path = f"/api/v1/storyboards/{video_id}"
     if query_string:
-        url = f"{url}?{query_string}"
+        path = f"{path}?{query_string}"
 
-    logger.info(f"[Storyboards] Proxy request: {video_id}")
-
-    try:
-        response = await client.get(url)
+    logger.info("[Storyboards] Proxy request: %s", video_id)
 
-        headers = {}
-        if "content-type" in response.headers:
-            headers["content-type"] = response.headers["content-type"]
+    cached = _cached_media_response(base, path)
+    if cached is not None:
+        return cached
 
-        return Response(content=response.content, status_code=response.status_code, headers=headers)
+    try:
+        return await _stream_media_response(client, base, path, ("content-type",))
     except httpx.HTTPStatusError as e:
-        logger.warning(f"[Storyboards] Proxy error: {video_id} - HTTP {e.response.status_code}")
+        logger.warning("[Storyboards] Proxy error: %s - HTTP %s", video_id, e.response.status_code)
         raise HTTPException(status_code=e.response.status_code, detail=str(e))
     except httpx.RequestError as e:
-        logger.warning(f"[Storyboards] Proxy error: {video_id} - {e}")
+        logger.warning("[Storyboards] Proxy error: %s - %s", video_id, e)
         raise HTTPException(status_code=502, detail=f"Upstream error: {e}")
     except (ValueError, KeyError, TypeError) as e:
-        logger.warning(f"[Storyboards] Proxy error: {video_id} - {e}", exc_info=True)
+        logger.warning("[Storyboards] Proxy error: %s - %s", video_id, e, exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -624,26 +991,23 @@ async def proxy_thumbnail(video_id: str, filename: str, request: Request, token:
     client = await get_client()
 
     # Build URL: {invidious}/vi/{video_id}/{filename}
-    url = f"{get_base_url()}/vi/{video_id}/{filename}"
+    base = get_base_url()
+    path = f"/vi/{video_id}/{filename}"
 
-    logger.info(f"[Thumbnails] Proxy request: {video_id}/{filename}")
+    logger.info("[Thumbnails] Proxy request: %s/%s", video_id, filename)
 
-    try:
-        response = await client.get(url)
+    cached = _cached_media_response(base, path)
+    if cached is not None:
+        return cached
 
-        headers = {}
-        if "content-type" in response.headers:
-            headers["content-type"] = response.headers["content-type"]
-        if "cache-control" in response.headers:
-            headers["cache-control"] = response.headers["cache-control"]
-
-        return Response(content=response.content, status_code=response.status_code, headers=headers)
+    try:
+        return await _stream_media_response(client, base, path, ("content-type", "cache-control"))
     except httpx.HTTPStatusError as e:
-        logger.warning(f"[Thumbnails] Proxy error: {video_id}/{filename} - HTTP {e.response.status_code}")
+        logger.warning("[Thumbnails] Proxy error: %s/%s - HTTP %s", video_id, filename, e.response.status_code)
         raise HTTPException(status_code=e.response.status_code, detail=str(e))
     except httpx.RequestError as e:
-        logger.warning(f"[Thumbnails] Proxy error: {video_id}/{filename} - {e}")
+        logger.warning("[Thumbnails] Proxy error: %s/%s - %s", video_id, filename, e)
         raise HTTPException(status_code=502, detail=f"Upstream error: {e}")
     except (ValueError, KeyError, TypeError) as e:
-        logger.warning(f"[Thumbnails] Proxy error: {video_id}/{filename} - {e}", exc_info=True)
+        logger.warning("[Thumbnails] Proxy error: %s/%s - %s", video_id, filename, e, exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
@@ -5,12 +5,12 @@ import sys
 from logging.config import fileConfig
 
 from alembic import context
-from sqlalchemy import create_engine, pool
 
 # Add project root to path for importing config
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import config as app_config
+from database.schema import create_migration_engine
 
 # Alembic Config object
 alembic_config = context.config
@@ -43,21 +43,34 @@ def run_migrations_offline() -> None:
         context.run_migrations()
 
 
+def _run_migrations(connection) -> None:
+    """Run migrations on an open connection, each in a single transaction."""
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        transactional_ddl=True,
+        transaction_per_migration=True,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
 def run_migrations_online() -> None:
     """Run migrations in 'online' mode (executes against database)."""
+    # init_db passes its own connection, shared across stamp and upgrade
+    connection = alembic_config.attributes.get("connection")
+    if connection is not None:
+        _run_migrations(connection)
+        return
+
     # Ensure data directory exists
     os.makedirs(app_config.DATA_DIR, exist_ok=True)
 
-    connectable = create_engine(get_database_url(), poolclass=pool.NullPool)
+    connectable = create_migration_engine(get_database_url())
 
     with connectable.connect() as connection:
-        context.configure(
-            connection=connection,
-            target_metadata=target_metadata,
-        )
-
-        with context.begin_transaction():
-            context.run_migrations()
+        _run_migrations(connection)
 
 
 if context.is_offline_mode():
@@ -9,7 +9,7 @@ Revises: 002
 Create Date: 2026-02-06
 """
 
-from typing import Sequence, Union
+from typing import Sequence, Set, Union
 
 import sqlalchemy as sa
 from alembic import op
@@ -21,35 +21,38 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
-def _column_exists(table: str, column: str) -> bool:
-    """Check if a column exists in a SQLite table via PRAGMA table_info."""
+def _get_columns(table: str) -> Set[str]:
+    """Get a SQLite table's column names via one PRAGMA table_info query."""
     conn = op.get_bind()
     result = conn.execute(sa.text(f"PRAGMA table_info({table})"))
     # PRAGMA table_info returns rows: (cid, name, type, notnull, dflt_value, pk)
-    return any(row[1] == column for row in result)
+    return {row[1] for row in result}
 
 
-def _add_column_if_not_exists(table: str, column: str, coltype: str, default: str) -> None:
-    if not _column_exists(table, column):
+def _add_column_if_not_exists(columns: Set[str], table: str, column: str, coltype: str, default: str) -> None:
+    if column not in columns:
         op.execute(f"ALTER TABLE {table} ADD COLUMN {column} {coltype} DEFAULT {default}")
+        columns.add(column)
 
 
-def _drop_column_if_exists(table: str, column: str) -> None:
-    if _column_exists(table, column):
+def _drop_column_if_exists(columns: Set[str], table: str, column: str) -> None:
+    if column in columns:
         op.execute(f"ALTER TABLE {table} DROP COLUMN {column}")
+        columns.discard(column)
 
 
 def upgrade() -> None:
     """Add missing columns, fix defaults, remove dead columns."""
+    columns = _get_columns("settings")
     # Add missing columns that exist in Python model but not in DB
-    _add_column_if_not_exists("settings", "feed_fallback_ytdlp_on_error", "INTEGER", "1")
-    _add_column_if_not_exists("settings", "invidious_max_retries", "INTEGER", "3")
-    _add_column_if_not_exists("settings", "invidious_retry_delay", "REAL", "1.0")
+    _add_column_if_not_exists(columns, "settings", "feed_fallback_ytdlp_on_error", "INTEGER", "1")
+    _add_column_if_not_exists(columns, "settings", "invidious_max_retries", "INTEGER", "3")
+    _add_column_if_not_exists(columns, "settings", "invidious_retry_delay", "REAL", "1.0")
 
     # Ensure columns exist before updating defaults (may be missing in pre-Alembic DBs
     # where migration 002's CREATE TABLE IF NOT EXISTS was a no-op)
-    _add_column_if_not_exists("settings", "proxy_download_max_age", "INTEGER", "300")
-    _add_column_if_not_exists("settings", "feed_ytdlp_use_flat_playlist", "INTEGER", "0")
+    _add_column_if_not_exists(columns, "settings", "proxy_download_max_age", "INTEGER", "300")
+    _add_column_if_not_exists(columns, "settings", "feed_ytdlp_use_flat_playlist", "INTEGER", "0")
 
     # Fix default mismatches for existing installs that still have old defaults
     # proxy_download_max_age: DB default was 300 (5 min), should be 86400 (24h)
@@ -59,14 +62,15 @@ def upgrade() -> None:
 
     # Remove dead columns (not in Python model, not used anywhere)
     # SQLite 3.35.0+ (2021-03-12) supports ALTER TABLE DROP COLUMN:
-    _drop_column_if_exists("settings", "cache_stream_ttl")
-    _drop_column_if_exists("settings", "jwt_expiry_hours")
+    _drop_column_if_exists(columns, "settings", "cache_stream_ttl")
+    _drop_column_if_exists(columns, "settings", "jwt_expiry_hours")
 
 
 def downgrade() -> None:
     """Re-add removed columns, remove added columns."""
-    _add_column_if_not_exists("settings", "cache_stream_ttl", "INTEGER", "300")
-    _add_column_if_not_exists("settings", "jwt_expiry_hours", "INTEGER", "24")
-    _drop_column_if_exists("settings", "feed_fallback_ytdlp_on_error")
-    _drop_column_if_exists("settings", "invidious_max_retries")
-    _drop_column_if_exists("settings", "invidious_retry_delay")
+    columns = _get_columns("settings")
+    _add_column_if_not_exists(columns, "settings", "cache_stream_ttl", "INTEGER", "300")
+    _add_column_if_not_exists(columns, "settings", "jwt_expiry_hours", "INTEGER", "24")
+    _drop_column_if_exists(columns, "settings", "feed_fallback_ytdlp_on_error")
+    _drop_column_if_exists(columns, "settings", "invidious_max_retries")
+    _drop_column_if_exists(columns, "settings", "invidious_retry_delay")
@@ -5,7 +5,7 @@ Revises: 004
 Create Date: 2026-02-06
 """
 
-from typing import Sequence, Union
+from typing import Sequence, Set, Union
 
 import sqlalchemy as sa
 from alembic import op
@@ -17,27 +17,36 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
-def _column_exists(table: str, column: str) -> bool:
-    """Check if a column exists in a SQLite table via PRAGMA table_info."""
+def _get_columns(table: str) -> Set[str]:
+    """Get a SQLite table's column names via one PRAGMA table_info query."""
     conn = op.get_bind()
     result = conn.execute(sa.text(f"PRAGMA table_info({table})"))
-    return any(row[1] == column for row in result)
+    # PRAGMA table_info returns rows: (cid, name, type, notnull, dflt_value, pk)
+    return {row[1] for row in result}
 
 
-def _add_column_if_not_exists(table: str, column: str, coltype: str, default: str) -> None:
-    if not _column_exists(table, column):
+def _add_column_if_not_exists(columns: Set[str], table: str, column: str, coltype: str, default: str) -> None:
+    if column not in columns:
         op.execute(f"ALTER TABLE {table} ADD COLUMN {column} {coltype} DEFAULT {default}")
+        columns.add(column)
+
+
+def _drop_column_if_exists(columns: Set[str], table: str, column: str) -> None:
+    if column in columns:
+        op.execute(f"ALTER TABLE {table} DROP COLUMN {column}")
+        columns.discard(column)
 
 
 def upgrade() -> None:
     """Add tuning settings columns."""
-    _add_column_if_not_exists("settings", "dns_cache_ttl", "INTEGER", "30")
-    _add_column_if_not_exists("settings", "proxy_max_concurrent_downloads", "INTEGER", "3")
-    _add_column_if_not_exists("settings", "rate_limit_cleanup_interval", "INTEGER", "300")
+    columns = _get_columns("settings")
+    _add_column_if_not_exists(columns, "settings", "dns_cache_ttl", "INTEGER", "30")
+    _add_column_if_not_exists(columns, "settings", "proxy_max_concurrent_downloads", "INTEGER", "3")
+    _add_column_if_not_exists(columns, "settings", "rate_limit_cleanup_interval", "INTEGER", "300")
 
 
 def downgrade() -> None:
     """Remove tuning settings columns."""
+    columns = _get_columns("settings")
     for col in ("dns_cache_ttl", "proxy_max_concurrent_downloads", "rate_limit_cleanup_interval"):
-        if _column_exists("settings", col):
-            op.execute(f"ALTER TABLE settings DROP COLUMN {col}")
+        _drop_column_if_exists(columns, "settings", col)
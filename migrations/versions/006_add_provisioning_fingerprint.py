@@ -0,0 +1,39 @@
+"""Add provisioning_fingerprint to settings.
+
+Stores a salted hash of the auto-provisioning env vars so startup can skip
+re-applying them when they have not changed since the last boot.
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-16
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "006"
+down_revision: Union[str, Sequence[str], None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _column_exists(table: str, column: str) -> bool:
+    """Check if a column exists in a SQLite table via PRAGMA table_info."""
+    conn = op.get_bind()
+    result = conn.execute(sa.text(f"PRAGMA table_info({table})"))
+    return any(row[1] == column for row in result)
+
+
+def upgrade() -> None:
+    """Add provisioning_fingerprint column."""
+    if not _column_exists("settings", "provisioning_fingerprint"):
+        op.execute("ALTER TABLE settings ADD COLUMN provisioning_fingerprint TEXT DEFAULT NULL")
+
+
+def downgrade() -> None:
+    """Remove provisioning_fingerprint column."""
+    if _column_exists("settings", "provisioning_fingerprint"):
+        op.execute("ALTER TABLE settings DROP COLUMN provisioning_fingerprint")
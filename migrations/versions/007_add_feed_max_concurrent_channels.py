@@ -0,0 +1,36 @@
+"""Add feed_max_concurrent_channels to settings.
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-16
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "007"
+down_revision: Union[str, Sequence[str], None] = "006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _column_exists(table: str, column: str) -> bool:
+    """Check if a column exists in a SQLite table via PRAGMA table_info."""
+    conn = op.get_bind()
+    result = conn.execute(sa.text(f"PRAGMA table_info({table})"))
+    return any(row[1] == column for row in result)
+
+
+def upgrade() -> None:
+    """Add feed_max_concurrent_channels column."""
+    if not _column_exists("settings", "feed_max_concurrent_channels"):
+        op.execute("ALTER TABLE settings ADD COLUMN feed_max_concurrent_channels INTEGER DEFAULT 4")
+
+
+def downgrade() -> None:
+    """Remove feed_max_concurrent_channels column."""
+    if _column_exists("settings", "feed_max_concurrent_channels"):
+        op.execute("ALTER TABLE settings DROP COLUMN feed_max_concurrent_channels")
@@ -0,0 +1,52 @@
+"""Add Invidious connection pool settings: max connections, max keep-alive, keep-alive expiry.
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-16
+"""
+
+from typing import Sequence, Set, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "008"
+down_revision: Union[str, Sequence[str], None] = "007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _get_columns(table: str) -> Set[str]:
+    """Get a SQLite table's column names via one PRAGMA table_info query."""
+    conn = op.get_bind()
+    result = conn.execute(sa.text(f"PRAGMA table_info({table})"))
+    # PRAGMA table_info returns rows: (cid, name, type, notnull, dflt_value, pk)
+    return {row[1] for row in result}
+
+
+def _add_column_if_not_exists(columns: Set[str], table: str, column: str, coltype: str, default: str) -> None:
+    if column not in columns:
+        op.execute(f"ALTER TABLE {table} ADD COLUMN {column} {coltype} DEFAULT {default}")
+        columns.add(column)
+
+
+def _drop_column_if_exists(columns: Set[str], table: str, column: str) -> None:
+    if column in columns:
+        op.execute(f"ALTER TABLE {table} DROP COLUMN {column}")
+        columns.discard(column)
+
+
+def upgrade() -> None:
+    """Add Invidious connection pool columns."""
+    columns = _get_columns("settings")
+    _add_column_if_not_exists(columns, "settings", "invidious_max_connections", "INTEGER", "200")
+    _add_column_if_not_exists(columns, "settings", "invidious_max_keepalive", "INTEGER", "100")
+    _add_column_if_not_exists(columns, "settings", "invidious_keepalive_expiry", "REAL", "30.0")
+
+
+def downgrade() -> None:
+    """Remove Invidious connection pool columns."""
+    columns = _get_columns("settings")
+    for col in ("invidious_max_connections", "invidious_max_keepalive", "invidious_keepalive_expiry"):
+        _drop_column_if_exists(columns, "settings", col)
@@ -0,0 +1,52 @@
+"""Add Invidious request guard settings: requests per second, breaker threshold, breaker cooldown.
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-16
+"""
+
+from typing import Sequence, Set, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "009"
+down_revision: Union[str, Sequence[str], None] = "008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _get_columns(table: str) -> Set[str]:
+    """Get a SQLite table's column names via one PRAGMA table_info query."""
+    conn = op.get_bind()
+    result = conn.execute(sa.text(f"PRAGMA table_info({table})"))
+    # PRAGMA table_info returns rows: (cid, name, type, notnull, dflt_value, pk)
+    return {row[1] for row in result}
+
+
+def _add_column_if_not_exists(columns: Set[str], table: str, column: str, coltype: str, default: str) -> None:
+    if column not in columns:
+        op.execute(f"ALTER TABLE {table} ADD COLUMN {column} {coltype} DEFAULT {default}")
+        columns.add(column)
+
+
+def _drop_column_if_exists(columns: Set[str], table: str, column: str) -> None:
+    if column in columns:
+        op.execute(f"ALTER TABLE {table} DROP COLUMN {column}")
+        columns.discard(column)
+
+
+def upgrade() -> None:
+    """Add Invidious rate limit and circuit breaker columns."""
+    columns = _get_columns("settings")
+    _add_column_if_not_exists(columns, "settings", "invidious_requests_per_second", "REAL", "50.0")
+    _add_column_if_not_exists(columns, "settings", "invidious_breaker_threshold", "INTEGER", "10")
+    _add_column_if_not_exists(columns, "settings", "invidious_breaker_cooldown", "REAL", "30.0")
+
+
+def downgrade() -> None:
+    """Remove Invidious rate limit and circuit breaker columns."""
+    columns = _get_columns("settings")
+    for col in ("invidious_requests_per_second", "invidious_breaker_threshold", "invidious_breaker_cooldown"):
+        _drop_column_if_exists(columns, "settings", col)
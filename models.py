@@ -1,6 +1,6 @@
 """Invidious-compatible response models."""
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -36,7 +36,7 @@ class FormatStream(BaseModel):
     encoding: Optional[str] = None
     size: Optional[str] = None
     fps: Optional[int] = None
-    httpHeaders: Optional[dict] = None
+    httpHeaders: Optional[Dict[str, str]] = None
 
 
 class AdaptiveFormat(BaseModel):
@@ -55,7 +55,7 @@ class AdaptiveFormat(BaseModel):
     fps: Optional[int] = None
     audioTrack: Optional[AudioTrack] = None
     audioQuality: Optional[str] = None
-    httpHeaders: Optional[dict] = None
+    httpHeaders: Optional[Dict[str, str]] = None
 
 
 class Caption(BaseModel):
@@ -240,3 +240,8 @@ class PlaylistResponse(BaseModel):
     authorId: Optional[str] = None
     videoCount: int
     videos: List[VideoListItem] = Field(default_factory=list)
+
+
+# Resolve the forward references now, rather than on the first request that builds these models
+VideoResponse.model_rebuild()
+ChannelPlaylistsResponse.model_rebuild()
@@ -1,4 +1,9 @@
-"""Admin web UI and API endpoints."""
+"""Admin web UI and API endpoints.
+
+Endpoints that query the database or hash passwords are plain `def`, so FastAPI runs them in its
+threadpool instead of blocking the event loop; `async def` is kept for the ones that await or only
+touch in-memory state.
+"""
 
 from fastapi import APIRouter
 
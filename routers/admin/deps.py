@@ -1,11 +1,11 @@
 """Shared dependencies for admin endpoints."""
 
-import os
+from pathlib import Path
 
 from fastapi import HTTPException, Request
 
 # Static files directory
-STATIC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "static")
+STATIC_DIR = Path(__file__).resolve().parents[2] / "static"
 
 
 async def get_current_admin(request: Request) -> dict:
@@ -1,6 +1,5 @@
 """Page routes and setup/login API."""
 
-import os
 from typing import Optional
 
 from fastapi import APIRouter, HTTPException, Request
@@ -15,6 +14,12 @@ from .deps import STATIC_DIR
 
 router = APIRouter()
 
+# HTML pages, resolved once at import
+_INDEX_HTML = STATIC_DIR / "index.html"
+_SETUP_HTML = STATIC_DIR / "setup.html"
+_LOGIN_HTML = STATIC_DIR / "login.html"
+_WATCH_HTML = STATIC_DIR / "watch.html"
+
 
 # =============================================================================
 # Pydantic Models
@@ -62,7 +67,7 @@ async def admin_page(request: Request):
     if not basic_auth_user.get("is_admin"):
         return RedirectResponse(url="/", status_code=302)
 
-    return FileResponse(os.path.join(STATIC_DIR, "index.html"))
+    return FileResponse(_INDEX_HTML)
 
 
 @router.get("/setup", response_class=HTMLResponse)
@@ -70,7 +75,7 @@ async def setup_page(request: Request):
     """First-run setup page."""
     if database.has_any_admin():
         return RedirectResponse(url="/login", status_code=302)
-    return FileResponse(os.path.join(STATIC_DIR, "setup.html"))
+    return FileResponse(_SETUP_HTML)
 
 
 @router.get("/login", response_class=HTMLResponse)
@@ -84,7 +89,7 @@ async def login_page(request: Request):
     if basic_auth_user:
         return RedirectResponse(url="/", status_code=302)
 
-    return FileResponse(os.path.join(STATIC_DIR, "login.html"))
+    return FileResponse(_LOGIN_HTML)
 
 
 @router.get("/watch", response_class=HTMLResponse)
@@ -98,7 +103,7 @@ async def watch_page(request: Request):
     if not basic_auth_user:
         return RedirectResponse(url="/login", status_code=302)
 
-    return FileResponse(os.path.join(STATIC_DIR, "watch.html"))
+    return FileResponse(_WATCH_HTML)
 
 
 # =============================================================================
@@ -113,7 +118,7 @@ async def setup_status():
 
 
 @router.post("/api/setup")
-async def do_setup(data: SetupRequest):
+def do_setup(data: SetupRequest):
     """Create the first admin account during initial setup."""
     if database.has_any_admin():
         raise HTTPException(status_code=400, detail="Setup already complete")
@@ -134,7 +139,7 @@ async def do_setup(data: SetupRequest):
 
 
 @router.post("/api/login")
-async def do_login(data: LoginRequest):
+def do_login(data: LoginRequest):
     """Verify credentials (for setup page compatibility)."""
     admin = database.get_admin_by_username(data.username)
     if not admin or not auth.verify_password(data.password, admin["password_hash"]):
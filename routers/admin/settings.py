@@ -1,19 +1,31 @@
 """Settings and watched channels endpoints."""
 
-from typing import List, Optional
+import asyncio
+import logging
+from typing import List, Optional, Tuple
 
 from fastapi import APIRouter, Depends, HTTPException, Request
-from pydantic import BaseModel
+from fastapi.responses import Response
+from pydantic import BaseModel, ValidationError
 
 import avatar_cache
 import database
 import settings as settings_module
+from feed_fetcher import fetch_all_channels
 from utils import get_base_url
+from ytdlp_wrapper import reset_caches
 
 from .deps import get_current_admin
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
+# Settings whose change invalidates the yt-dlp result caches
+_CACHE_KEYS = frozenset(
+    {"cache_video_ttl", "cache_search_ttl", "cache_channel_ttl", "cache_avatar_ttl", "cache_extract_ttl"}
+)
+
 
 # =============================================================================
 # Pydantic Models
@@ -49,6 +61,12 @@ class SettingsResponse(BaseModel):
     invidious_timeout: int
     invidious_max_retries: int
     invidious_retry_delay: float
+    invidious_max_connections: int
+    invidious_max_keepalive: int
+    invidious_keepalive_expiry: float
+    invidious_requests_per_second: float
+    invidious_breaker_threshold: int
+    invidious_breaker_cooldown: float
     invidious_author_thumbnails: bool
     invidious_proxy_channels: bool
     invidious_proxy_channel_tabs: bool
@@ -58,6 +76,7 @@ class SettingsResponse(BaseModel):
     invidious_proxy_thumbnails: bool
     feed_fetch_interval: int
     feed_channel_delay: int
+    feed_max_concurrent_channels: int
     feed_max_videos: int
     feed_video_max_age: int
     feed_ytdlp_use_flat_playlist: bool
@@ -87,6 +106,12 @@ class SettingsUpdate(BaseModel):
     invidious_timeout: Optional[int] = None
     invidious_max_retries: Optional[int] = None
     invidious_retry_delay: Optional[float] = None
+    invidious_max_connections: Optional[int] = None
+    invidious_max_keepalive: Optional[int] = None
+    invidious_keepalive_expiry: Optional[float] = None
+    invidious_requests_per_second: Optional[float] = None
+    invidious_breaker_threshold: Optional[int] = None
+    invidious_breaker_cooldown: Optional[float] = None
     invidious_author_thumbnails: Optional[bool] = None
     invidious_proxy_channels: Optional[bool] = None
     invidious_proxy_channel_tabs: Optional[bool] = None
@@ -96,6 +121,7 @@ class SettingsUpdate(BaseModel):
     invidious_proxy_thumbnails: Optional[bool] = None
     feed_fetch_interval: Optional[int] = None
     feed_channel_delay: Optional[int] = None
+    feed_max_concurrent_channels: Optional[int] = None
     feed_max_videos: Optional[int] = None
     feed_video_max_age: Optional[int] = None
     feed_ytdlp_use_flat_playlist: Optional[bool] = None
@@ -115,23 +141,40 @@ class SettingsUpdate(BaseModel):
 # =============================================================================
 
 
+# JSON for the Settings object last served. settings_module hands out a new object whenever
+# settings are saved or reloaded, so an identity check is enough to tell when it is stale.
+# update_settings is a sync handler, so this is also written from threadpool threads. No lock
+# is needed: each write rebinds the whole (settings, bytes) tuple in one step, so readers
+# always see a matching pair, and losing a race only means the next request re-encodes.
+_settings_json: Tuple[Optional[settings_module.Settings], bytes] = (None, b"")
+
+
+def _settings_response(settings: settings_module.Settings) -> Response:
+    """Serialize settings as a SettingsResponse, reusing the bytes while the object is unchanged."""
+    global _settings_json
+    cached_for, content = _settings_json
+    if cached_for is not settings:
+        # Settings is already validated and all-scalar, so dict() stands in for model_dump();
+        # model_construct keeps only the fields SettingsResponse declares
+        content = SettingsResponse.model_construct(**dict(settings)).model_dump_json().encode()
+        _settings_json = (settings, content)
+    return Response(content=content, media_type="application/json")
+
+
 @router.get("/api/settings", response_model=SettingsResponse)
 async def get_settings(admin: dict = Depends(get_current_admin)):
     """Get current server settings."""
-    settings = settings_module.get_settings()
-    return SettingsResponse(**settings.model_dump())
+    return _settings_response(settings_module.get_settings())
 
 
 @router.put("/api/settings", response_model=SettingsResponse)
-async def update_settings(data: SettingsUpdate, admin: dict = Depends(get_current_admin)):
+def update_settings(data: SettingsUpdate, admin: dict = Depends(get_current_admin)):
     """Update server settings."""
-    from pydantic import ValidationError
-
     current = settings_module.get_settings()
-    update_data = data.model_dump(exclude_unset=True)
+    update_data = {name: getattr(data, name) for name in data.model_fields_set}
 
-    # Merge with current settings
-    merged = {**current.model_dump(), **update_data}
+    # Merge with current settings; dict() reads the field values without a model_dump pass
+    merged = {**dict(current), **update_data}
 
     try:
         new_settings = settings_module.Settings(**merged)
@@ -141,18 +184,10 @@ async def update_settings(data: SettingsUpdate, admin: dict = Depends(get_curren
     settings_module.save_settings(new_settings)
 
     # Reset caches if cache settings changed
-    cache_keys = [
-        "cache_video_ttl", "cache_search_ttl", "cache_channel_ttl", "cache_avatar_ttl", "cache_extract_ttl",
-    ]
-    if any(k in update_data for k in cache_keys):
-        try:
-            from ytdlp_wrapper import reset_caches
+    if not _CACHE_KEYS.isdisjoint(update_data):
+        reset_caches()
 
-            reset_caches()
-        except ImportError:
-            pass  # reset_caches not yet implemented
-
-    return SettingsResponse(**new_settings.model_dump())
+    return _settings_response(new_settings)
 
 
 # =============================================================================
@@ -161,7 +196,7 @@ async def update_settings(data: SettingsUpdate, admin: dict = Depends(get_curren
 
 
 @router.get("/api/watched-channels", response_model=List[WatchedChannelResponse])
-async def list_watched_channels(request: Request, admin: dict = Depends(get_current_admin)):
+def list_watched_channels(request: Request, admin: dict = Depends(get_current_admin)):
     """Get all watched channels with feed fetch status and video stats.
 
     Watched channels are channels that clients have requested in feed requests.
@@ -169,39 +204,42 @@ async def list_watched_channels(request: Request, admin: dict = Depends(get_curr
     """
     channels = database.get_watched_channels_with_status()
 
-    # Get base URL for generating avatar proxy URLs
+    # Prefix for generated avatar proxy URLs, built once for the whole list
     base_url = get_base_url(request)
-
-    return [
-        WatchedChannelResponse(
-            channel_id=ch["channel_id"],
-            site=ch["site"],
-            channel_name=ch["channel_name"],
-            # For YouTube channels without channel_url, generate from channel_id
-            channel_url=ch["channel_url"]
-            or (
-                f"https://www.youtube.com/{ch['channel_id']}"
-                if ch["channel_id"].startswith("@")
-                else f"https://www.youtube.com/channel/{ch['channel_id']}"
+    avatar_prefix = f"{base_url}/api/v1/channels/" if base_url else None
+
+    items = []
+    for ch in channels:
+        channel_id = ch["channel_id"]
+        channel_url = ch["channel_url"]
+        avatar_url = ch["avatar_url"] or None
+        # For YouTube channels without channel_url/avatar_url, generate them from channel_id
+        if ch["site"].lower() == "youtube":
+            if not channel_url:
+                if channel_id.startswith("@"):
+                    channel_url = f"https://www.youtube.com/{channel_id}"
+                else:
+                    channel_url = f"https://www.youtube.com/channel/{channel_id}"
+            if not avatar_url and avatar_prefix:
+                avatar_url = f"{avatar_prefix}{channel_id}/avatar/176.jpg"
+
+        # Rows come straight from our own database, so the response models skip validation
+        items.append(
+            WatchedChannelResponse.model_construct(
+                channel_id=channel_id,
+                site=ch["site"],
+                channel_name=ch["channel_name"],
+                channel_url=channel_url,
+                avatar_url=avatar_url,
+                last_requested=ch["last_requested"] or "",
+                last_fetch=ch["last_fetch"],
+                fetch_error=ch["fetch_error"],
+                video_count=ch.get("video_count", 0),
+                last_video_published=ch.get("last_video_published"),
+                last_video_title=ch.get("last_video_title"),
             )
-            if ch.get("site", "").lower() == "youtube"
-            else ch["channel_url"],
-            # For YouTube channels without avatar_url, generate proxy URL
-            avatar_url=ch["avatar_url"]
-            or (
-                f"{base_url}/api/v1/channels/{ch['channel_id']}/avatar/176.jpg"
-                if ch.get("site", "").lower() == "youtube" and base_url
-                else None
-            ),
-            last_requested=ch["last_requested"] or "",
-            last_fetch=ch["last_fetch"],
-            fetch_error=ch["fetch_error"],
-            video_count=ch.get("video_count", 0),
-            last_video_published=ch.get("last_video_published"),
-            last_video_title=ch.get("last_video_title"),
         )
-        for ch in channels
-    ]
+    return items
 
 
 @router.post("/api/watched-channels/refresh-all")
@@ -211,22 +249,12 @@ async def refresh_all_watched_channels(admin: dict = Depends(get_current_admin))
     Starts a background task to fetch all watched channels.
     Returns immediately while the fetch happens in the background.
     """
-    import asyncio
-    import logging
-
-    from feed_fetcher import fetch_all_channels
-
-    logger = logging.getLogger(__name__)
-
-    # Schedule avatar caching for all YouTube watched channels
-    cache = avatar_cache.get_cache()
+    # Schedule avatar caching for all YouTube watched channels (site and channel_id are NOT NULL columns)
     channels = database.get_all_watched_channels()
-    youtube_channels = [ch for ch in channels if ch.get("site", "").lower() == "youtube" and ch.get("channel_id")]
-
-    if youtube_channels:
-        logger.debug(f"Scheduling avatar cache refresh for {len(youtube_channels)} YouTube watched channels")
-        for ch in youtube_channels:
-            cache.schedule_background_fetch(ch["channel_id"])
+    scheduled = avatar_cache.get_cache().schedule_background_fetch_many(
+        ch["channel_id"] for ch in channels if ch["channel_id"] and ch["site"].lower() == "youtube"
+    )
+    logger.debug(f"Scheduled avatar cache refresh for {scheduled} YouTube watched channels")
 
     # Trigger background fetch (non-blocking)
     asyncio.create_task(fetch_all_channels())
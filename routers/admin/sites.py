@@ -1,12 +1,16 @@
 """Sites and credentials management endpoints."""
 
+from types import MappingProxyType
 from typing import List, Optional
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import Response
 from pydantic import BaseModel, Field
 
 import database
 import encryption
+from ytdlp_wrapper import YtDlpError, extract_url, is_safe_url, is_valid_url
 
 from .deps import get_current_admin
 
@@ -80,11 +84,12 @@ class TestResponse(BaseModel):
 
 
 @router.get("/api/sites", response_model=List[SiteResponse])
-async def list_sites(admin: dict = Depends(get_current_admin)):
+def list_sites(admin: dict = Depends(get_current_admin)):
     """List all configured sites."""
     sites = database.get_all_sites()
+    # Rows come straight from our own database, so the response models skip validation
     return [
-        SiteResponse(
+        SiteResponse.model_construct(
             id=s["id"],
             name=s["name"],
             extractor_pattern=s["extractor_pattern"],
@@ -99,30 +104,30 @@ async def list_sites(admin: dict = Depends(get_current_admin)):
 
 
 @router.post("/api/sites", response_model=SiteResponse)
-async def create_site(data: SiteCreate, admin: dict = Depends(get_current_admin)):
+def create_site(data: SiteCreate, admin: dict = Depends(get_current_admin)):
     """Create a new site configuration."""
+    credentials = []
+    for cred in data.credentials:
+        is_encrypted = encryption.should_encrypt(cred.credential_type)
+        value = encryption.encrypt(cred.value) if is_encrypted else cred.value
+        credentials.append((cred.credential_type, cred.key, value, is_encrypted))
+
+    # The site and its credentials are written in a single transaction
     site_id = database.create_site(
         name=data.name,
         extractor_pattern=data.extractor_pattern,
         enabled=data.enabled,
         priority=data.priority,
         proxy_streaming=data.proxy_streaming,
+        credentials=credentials,
     )
 
-    # Add credentials
-    for cred in data.credentials:
-        is_encrypted = encryption.should_encrypt(cred.credential_type)
-        value = encryption.encrypt(cred.value) if is_encrypted else cred.value
-        database.add_credential(
-            site_id=site_id, credential_type=cred.credential_type, key=cred.key, value=value, is_encrypted=is_encrypted
-        )
-
     site = database.get_site(site_id)
     return _site_to_response(site)
 
 
 @router.get("/api/sites/{site_id}", response_model=SiteResponse)
-async def get_site(site_id: int, admin: dict = Depends(get_current_admin)):
+def get_site(site_id: int, admin: dict = Depends(get_current_admin)):
     """Get a site with its credentials."""
     site = database.get_site(site_id)
     if not site:
@@ -131,11 +136,8 @@ async def get_site(site_id: int, admin: dict = Depends(get_current_admin)):
 
 
 @router.put("/api/sites/{site_id}", response_model=SiteResponse)
-async def update_site(site_id: int, data: SiteUpdate, admin: dict = Depends(get_current_admin)):
+def update_site(site_id: int, data: SiteUpdate, admin: dict = Depends(get_current_admin)):
     """Update a site's configuration."""
-    if not database.get_site(site_id):
-        raise HTTPException(status_code=404, detail="Site not found")
-
     database.update_site(
         site_id,
         name=data.name,
@@ -145,12 +147,15 @@ async def update_site(site_id: int, data: SiteUpdate, admin: dict = Depends(get_
         proxy_streaming=data.proxy_streaming,
     )
 
+    # Updating a missing site changes nothing, so reading it back doubles as the existence check
     site = database.get_site(site_id)
+    if not site:
+        raise HTTPException(status_code=404, detail="Site not found")
     return _site_to_response(site)
 
 
 @router.delete("/api/sites/{site_id}")
-async def delete_site(site_id: int, admin: dict = Depends(get_current_admin)):
+def delete_site(site_id: int, admin: dict = Depends(get_current_admin)):
     """Delete a site and its credentials."""
     if not database.delete_site(site_id):
         raise HTTPException(status_code=404, detail="Site not found")
@@ -158,45 +163,39 @@ async def delete_site(site_id: int, admin: dict = Depends(get_current_admin)):
 
 
 @router.post("/api/sites/{site_id}/credentials", response_model=CredentialResponse)
-async def add_credential(site_id: int, data: CredentialCreate, admin: dict = Depends(get_current_admin)):
+def add_credential(site_id: int, data: CredentialCreate, admin: dict = Depends(get_current_admin)):
     """Add a credential to a site."""
-    if not database.get_site(site_id):
-        raise HTTPException(status_code=404, detail="Site not found")
-
     is_encrypted = encryption.should_encrypt(data.credential_type)
     value = encryption.encrypt(data.value) if is_encrypted else data.value
 
     cred_id = database.add_credential(
         site_id=site_id, credential_type=data.credential_type, key=data.key, value=value, is_encrypted=is_encrypted
     )
+    if cred_id is None:
+        raise HTTPException(status_code=404, detail="Site not found")
 
     cred = database.get_credential(cred_id)
-    return CredentialResponse(
+    return CredentialResponse.model_construct(
         id=cred["id"],
         credential_type=cred["credential_type"],
         key=cred["key"],
         has_value=True,
-        is_encrypted=cred["is_encrypted"],
+        is_encrypted=bool(cred["is_encrypted"]),
         created_at=cred["created_at"] or "",
     )
 
 
 @router.delete("/api/sites/{site_id}/credentials/{credential_id}")
-async def delete_credential(site_id: int, credential_id: int, admin: dict = Depends(get_current_admin)):
+def delete_credential(site_id: int, credential_id: int, admin: dict = Depends(get_current_admin)):
     """Delete a credential from a site."""
-    cred = database.get_credential(credential_id)
-    if not cred or cred["site_id"] != site_id:
+    if not database.delete_credential(credential_id, site_id=site_id):
         raise HTTPException(status_code=404, detail="Credential not found")
-
-    database.delete_credential(credential_id)
     return {"success": True}
 
 
 @router.post("/api/sites/{site_id}/test", response_model=TestResponse)
 async def test_site_credentials(site_id: int, data: TestRequest, admin: dict = Depends(get_current_admin)):
     """Test site credentials by extracting a URL."""
-    from ytdlp_wrapper import YtDlpError, extract_url, is_safe_url, is_valid_url
-
     site = database.get_site(site_id)
     if not site:
         raise HTTPException(status_code=404, detail="Site not found")
@@ -223,7 +222,7 @@ async def test_site_credentials(site_id: int, data: TestRequest, admin: dict = D
 
 
 # Popular sites that commonly need credentials
-POPULAR_SITES = [
+_POPULAR_SITES_RAW = [
     {
         "id": "youtube",
         "name": "YouTube",
@@ -418,11 +417,17 @@ POPULAR_SITES = [
     },
 ]
 
+# Read-only view of the popular sites, so the encoded copy below cannot drift from it
+POPULAR_SITES = tuple(MappingProxyType(site) for site in _POPULAR_SITES_RAW)
+
+# POPULAR_SITES never changes, so it is encoded once rather than on every request
+_POPULAR_SITES_JSON = orjson.dumps(_POPULAR_SITES_RAW)
+
 
 @router.get("/api/extractors")
 async def list_extractors(admin: dict = Depends(get_current_admin)):
     """List popular sites for the site selector dropdown."""
-    return POPULAR_SITES
+    return Response(content=_POPULAR_SITES_JSON, media_type="application/json")
 
 
 # =============================================================================
@@ -435,7 +440,7 @@ def _site_to_response(site: dict) -> SiteResponse:
     credentials = None
     if "credentials" in site:
         credentials = [
-            CredentialResponse(
+            CredentialResponse.model_construct(
                 id=c["id"],
                 credential_type=c["credential_type"],
                 key=c["key"],
@@ -446,7 +451,7 @@ def _site_to_response(site: dict) -> SiteResponse:
             for c in site["credentials"]
         ]
 
-    return SiteResponse(
+    return SiteResponse.model_construct(
         id=site["id"],
         name=site["name"],
         extractor_pattern=site["extractor_pattern"],
@@ -59,17 +59,20 @@ class UserResponse(BaseModel):
 
 
 @router.get("/api/admins", response_model=List[AdminResponse])
-async def list_admins(admin: dict = Depends(get_current_admin)):
+def list_admins(admin: dict = Depends(get_current_admin)):
     """List all admin users."""
     admins = database.get_all_admins()
+    # Rows come straight from our own database, so the response models skip validation
     return [
-        AdminResponse(id=a["id"], username=a["username"], created_at=a["created_at"] or "", last_login=a["last_login"])
+        AdminResponse.model_construct(
+            id=a["id"], username=a["username"], created_at=a["created_at"] or "", last_login=a["last_login"]
+        )
         for a in admins
     ]
 
 
 @router.post("/api/admins", response_model=AdminResponse)
-async def create_admin(data: AdminCreate, admin: dict = Depends(get_current_admin)):
+def create_admin(data: AdminCreate, admin: dict = Depends(get_current_admin)):
     """Create a new admin user."""
     # Check if username exists
     existing = database.get_admin_by_username(data.username)
@@ -77,10 +80,9 @@ async def create_admin(data: AdminCreate, admin: dict = Depends(get_current_admi
         raise HTTPException(status_code=400, detail="Username already exists")
 
     password_hash = auth.hash_password(data.password)
-    admin_id = database.create_admin(data.username, password_hash)
+    new_admin = database.create_user_row(data.username, password_hash, is_admin=True)
 
-    new_admin = database.get_admin_by_id(admin_id)
-    return AdminResponse(
+    return AdminResponse.model_construct(
         id=new_admin["id"],
         username=new_admin["username"],
         created_at=new_admin["created_at"] or "",
@@ -89,12 +91,12 @@ async def create_admin(data: AdminCreate, admin: dict = Depends(get_current_admi
 
 
 @router.delete("/api/admins/{admin_id}")
-async def delete_admin(admin_id: int, admin: dict = Depends(get_current_admin)):
+def delete_admin(admin_id: int, admin: dict = Depends(get_current_admin)):
     """Delete an admin user."""
     if admin_id == admin["id"]:
         raise HTTPException(status_code=400, detail="Cannot delete yourself")
 
-    if database.count_admins() <= 1:
+    if not database.has_multiple_admins():
         raise HTTPException(status_code=400, detail="Cannot delete the last admin")
 
     if not database.delete_admin(admin_id):
@@ -104,7 +106,7 @@ async def delete_admin(admin_id: int, admin: dict = Depends(get_current_admin)):
 
 
 @router.put("/api/admins/{admin_id}/password")
-async def change_password(admin_id: int, data: PasswordChange, admin: dict = Depends(get_current_admin)):
+def change_password(admin_id: int, data: PasswordChange, admin: dict = Depends(get_current_admin)):
     """Change an admin's password."""
     target_admin = database.get_admin_by_id(admin_id)
     if not target_admin:
@@ -117,7 +119,7 @@ async def change_password(admin_id: int, data: PasswordChange, admin: dict = Dep
 
 
 @router.get("/api/user/me")
-async def get_current_user(request: Request):
+def get_current_user(request: Request):
     """Get current authenticated user info (any user, not just admin)."""
     basic_auth_user = getattr(request.state, "user", None)
     if not basic_auth_user:
@@ -147,11 +149,11 @@ async def get_current_user(request: Request):
 
 
 @router.get("/api/users", response_model=List[UserResponse])
-async def list_users(admin: dict = Depends(get_current_admin)):
+def list_users(admin: dict = Depends(get_current_admin)):
     """List all users."""
     users = database.get_all_users()
     return [
-        UserResponse(
+        UserResponse.model_construct(
             id=u["id"],
             username=u["username"],
             is_admin=bool(u["is_admin"]),
@@ -163,7 +165,7 @@ async def list_users(admin: dict = Depends(get_current_admin)):
 
 
 @router.post("/api/users", response_model=UserResponse)
-async def create_user(data: UserCreate, admin: dict = Depends(get_current_admin)):
+def create_user(data: UserCreate, admin: dict = Depends(get_current_admin)):
     """Create a new user."""
     # Check if username exists
     existing = database.get_user_by_username(data.username)
@@ -171,10 +173,9 @@ async def create_user(data: UserCreate, admin: dict = Depends(get_current_admin)
         raise HTTPException(status_code=400, detail="Username already exists")
 
     password_hash = auth.hash_password(data.password)
-    user_id = database.create_user(data.username, password_hash, is_admin=data.is_admin)
+    new_user = database.create_user_row(data.username, password_hash, is_admin=data.is_admin)
 
-    new_user = database.get_user_by_id(user_id)
-    return UserResponse(
+    return UserResponse.model_construct(
         id=new_user["id"],
         username=new_user["username"],
         is_admin=bool(new_user["is_admin"]),
@@ -184,13 +185,13 @@ async def create_user(data: UserCreate, admin: dict = Depends(get_current_admin)
 
 
 @router.get("/api/users/{user_id}", response_model=UserResponse)
-async def get_user(user_id: int, admin: dict = Depends(get_current_admin)):
+def get_user(user_id: int, admin: dict = Depends(get_current_admin)):
     """Get a user by ID."""
     user = database.get_user_by_id(user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
-    return UserResponse(
+    return UserResponse.model_construct(
         id=user["id"],
         username=user["username"],
         is_admin=bool(user["is_admin"]),
@@ -200,7 +201,7 @@ async def get_user(user_id: int, admin: dict = Depends(get_current_admin)):
 
 
 @router.put("/api/users/{user_id}", response_model=UserResponse)
-async def update_user(user_id: int, data: UserUpdate, admin: dict = Depends(get_current_admin)):
+def update_user(user_id: int, data: UserUpdate, admin: dict = Depends(get_current_admin)):
     """Update a user's properties."""
     user = database.get_user_by_id(user_id)
     if not user:
@@ -212,24 +213,27 @@ async def update_user(user_id: int, data: UserUpdate, admin: dict = Depends(get_
 
     # Prevent removing the last admin
     if data.is_admin is False and user["is_admin"]:
-        if database.count_admin_users() <= 1:
+        if not database.has_multiple_admins():
             raise HTTPException(status_code=400, detail="Cannot remove the last admin")
 
+    # is_admin is the only field this endpoint changes, so the response comes from the row already loaded
+    is_admin = user["is_admin"]
     if data.is_admin is not None:
-        database.update_user(user_id, is_admin=data.is_admin)
-
-    updated_user = database.get_user_by_id(user_id)
-    return UserResponse(
-        id=updated_user["id"],
-        username=updated_user["username"],
-        is_admin=bool(updated_user["is_admin"]),
-        created_at=updated_user["created_at"] or "",
-        last_login=updated_user["last_login"],
+        if not database.update_user(user_id, is_admin=data.is_admin):
+            raise HTTPException(status_code=404, detail="User not found")
+        is_admin = data.is_admin
+
+    return UserResponse.model_construct(
+        id=user["id"],
+        username=user["username"],
+        is_admin=bool(is_admin),
+        created_at=user["created_at"] or "",
+        last_login=user["last_login"],
     )
 
 
 @router.delete("/api/users/{user_id}")
-async def delete_user(user_id: int, admin: dict = Depends(get_current_admin)):
+def delete_user(user_id: int, admin: dict = Depends(get_current_admin)):
     """Delete a user."""
     if user_id == admin["id"]:
         raise HTTPException(status_code=400, detail="Cannot delete yourself")
@@ -239,7 +243,7 @@ async def delete_user(user_id: int, admin: dict = Depends(get_current_admin)):
         raise HTTPException(status_code=404, detail="User not found")
 
     # Prevent deleting the last admin
-    if user["is_admin"] and database.count_admin_users() <= 1:
+    if user["is_admin"] and not database.has_multiple_admins():
         raise HTTPException(status_code=400, detail="Cannot delete the last admin")
 
     if not database.delete_user(user_id):
@@ -249,7 +253,7 @@ async def delete_user(user_id: int, admin: dict = Depends(get_current_admin)):
 
 
 @router.put("/api/users/{user_id}/password")
-async def change_user_password(user_id: int, data: PasswordChange, admin: dict = Depends(get_current_admin)):
+def change_user_password(user_id: int, data: PasswordChange, admin: dict = Depends(get_current_admin)):
     """Change a user's password."""
     user = database.get_user_by_id(user_id)
     if not user:
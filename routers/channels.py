@@ -5,6 +5,7 @@ import re
 from typing import Optional
 
 import httpx
+import orjson
 from fastapi import APIRouter, HTTPException, Query
 from fastapi.responses import Response
 
@@ -75,8 +76,9 @@ async def get_channels_metadata(data: ChannelMetadataRequest):
     if not data.channel_ids:
         return {"channels": []}
 
+    # Rows are plain scalars from the database, so encode them directly instead of via jsonable_encoder
     metadata = database.get_channels_metadata(data.channel_ids)
-    return {"channels": metadata}
+    return Response(content=orjson.dumps({"channels": metadata}), media_type="application/json")
 
 
 @router.get("/channels/{channel_id}", response_model=ChannelResponse)
@@ -91,16 +93,7 @@ async def get_channel(channel_id: str):
                 data = await invidious_proxy.get_channel(channel_id)
                 if data:
                     invidious_base = invidious_proxy.get_base_url()
-                    thumbnails = []
-                    for thumb in data.get("authorThumbnails", []):
-                        thumbnails.append(
-                            Thumbnail(
-                                quality=thumb.get("quality", "default"),
-                                url=resolve_invidious_url(thumb.get("url", ""), invidious_base),
-                                width=thumb.get("width"),
-                                height=thumb.get("height"),
-                            )
-                        )
+                    thumbnails = await invidious_proxy.get_channel_thumbnails(channel_id, channel_data=data)
                     banners = []
                     for banner in data.get("authorBanners", []):
                         banners.append(
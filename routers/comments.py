@@ -3,7 +3,9 @@
 import logging
 from typing import Any, List, Optional
 
+import orjson
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import Response
 
 import invidious_proxy
 from converters import resolve_invidious_url
@@ -31,9 +33,10 @@ def _resolve_comment_thumbnails(comments: List[Any], invidious_base: str) -> Lis
         # Recursively resolve replies if present
         if "replies" in resolved_comment and resolved_comment["replies"]:
             if "comments" in resolved_comment["replies"]:
-                resolved_comment["replies"]["comments"] = _resolve_comment_thumbnails(
-                    resolved_comment["replies"]["comments"], invidious_base
-                )
+                resolved_comment["replies"] = {
+                    **resolved_comment["replies"],
+                    "comments": _resolve_comment_thumbnails(resolved_comment["replies"]["comments"], invidious_base),
+                }
 
         resolved_comments.append(resolved_comment)
 
@@ -63,9 +66,11 @@ async def get_comments(
         # Resolve relative URLs in comment author thumbnails
         if "comments" in data:
             invidious_base = invidious_proxy.get_base_url()
-            data["comments"] = _resolve_comment_thumbnails(data["comments"], invidious_base)
+            # Copy rather than mutate: the response may be shared with concurrent callers
+            data = {**data, "comments": _resolve_comment_thumbnails(data["comments"], invidious_base)}
 
-        return data
+        # Raw Invidious JSON has no response model for pydantic to serialize with, so encode it directly
+        return Response(content=orjson.dumps(data), media_type="application/json")
     except invidious_proxy.InvidiousProxyError as e:
         raise HTTPException(status_code=502, detail=f"Invidious proxy error: {e}")
     except (KeyError, TypeError) as e:
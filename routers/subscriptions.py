@@ -5,6 +5,7 @@ import json
 import logging
 from typing import List, Optional
 
+import orjson
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
 
@@ -157,8 +158,7 @@ async def post_feed(data: StatelessFeedRequest):
     youtube_channels = [ch for ch in data.channels if ch.site.lower() == "youtube"]
     if youtube_channels:
         logger.debug(f"Scheduling avatar cache for {len(youtube_channels)} YouTube channels")
-        for ch in youtube_channels:
-            cache.schedule_background_fetch(ch.channel_id)
+        cache.schedule_background_fetch_many(ch.channel_id for ch in youtube_channels)
 
     # 2. Check which channels have cached videos
     cached_channels = database.get_cached_channel_ids(channels_dict)
@@ -199,8 +199,8 @@ async def post_feed(data: StatelessFeedRequest):
         thumbnails = []
         if v.get("thumbnail_data"):
             try:
-                thumbnails = json.loads(v["thumbnail_data"])
-            except (json.JSONDecodeError, TypeError):
+                thumbnails = orjson.loads(v["thumbnail_data"])
+            except (json.JSONDecodeError, TypeError):  # orjson.JSONDecodeError subclasses json's
                 # Fallback to legacy single thumbnail if JSON parsing fails
                 if v.get("thumbnail_url"):
                     thumbnails = [{"quality": "default", "url": v["thumbnail_url"], "width": 320, "height": 180}]
@@ -6,6 +6,7 @@ This module provides security functions for:
 - Header injection prevention
 """
 
+import functools
 import ipaddress
 import logging
 import re
@@ -71,6 +72,9 @@ BLOCKED_HOSTNAMES = frozenset({
     "169.254.169.254",  # AWS/cloud metadata
 })
 
+# Hostname suffixes for internal-only names
+BLOCKED_HOSTNAME_SUFFIXES = (".internal", ".local", ".localhost")
+
 
 def _resolve_hostname(hostname: str) -> List[str]:
     """Resolve hostname to list of IP addresses.
@@ -113,9 +117,13 @@ _SSRF_ALLOWED_RANGES = (
 )
 
 
+@functools.lru_cache(maxsize=DNS_CACHE_MAX_SIZE)
 def _is_ip_safe(ip_str: str) -> Tuple[bool, Optional[str]]:
     """Check if an IP address is safe (not private/reserved/etc).
 
+    The verdict only depends on the address, so it is memoized alongside the
+    DNS cache; cached hostnames then skip re-classifying their resolved IPs.
+
     Args:
         ip_str: IP address as string
 
@@ -183,8 +191,7 @@ def is_safe_url_strict(url: str, resolve_dns: bool = True) -> Tuple[bool, Option
             return False, f"metadata-like hostname: {hostname}"
 
         # Check if hostname ends with blocked patterns
-        blocked_suffixes = [".internal", ".local", ".localhost"]
-        for suffix in blocked_suffixes:
+        for suffix in BLOCKED_HOSTNAME_SUFFIXES:
             if hostname_lower.endswith(suffix):
                 return False, f"blocked hostname suffix: {suffix}"
 
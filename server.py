@@ -35,6 +35,9 @@ async def lifespan(app: FastAPI):
     database.init_db()
     # Startup: Auto-provision admin user and settings from env vars
     env_provisioning.apply_env_provisioning()
+    # Startup: Load settings and the user check every page hits, so the first request finds them cached
+    get_settings()
+    database.has_any_user()
     # Startup: Clean up old download files then start periodic cleanup task
     proxy.cleanup_old_files_sync()
     proxy.start_cleanup_task()
@@ -42,11 +45,17 @@ async def lifespan(app: FastAPI):
     feed_fetcher.start_feed_fetcher()
     # Startup: Start avatar cache cleanup task
     avatar_cache.start_avatar_cleanup_task()
+    # Startup: Create the Invidious client and connect before the first request needs it
+    await invidious_proxy.warm_up_client()
     yield
     # Shutdown: Stop avatar cache cleanup task
     avatar_cache.stop_avatar_cleanup_task()
     # Shutdown: Stop feed fetcher
     feed_fetcher.stop_feed_fetcher()
+    # Shutdown: Close the Invidious client
+    await invidious_proxy.close_client()
+    # Shutdown: Refresh query planner statistics
+    database.optimize_db()
 
 
 app = FastAPI(
@@ -34,6 +34,12 @@ class Settings(BaseModel):
     invidious_timeout: int = Field(default=10, ge=5, le=60)
     invidious_max_retries: int = Field(default=3, ge=1, le=10)
     invidious_retry_delay: float = Field(default=1.0, ge=0.5, le=30.0)
+    invidious_max_connections: int = Field(default=200, ge=10, le=1000)
+    invidious_max_keepalive: int = Field(default=100, ge=1, le=1000)
+    invidious_keepalive_expiry: float = Field(default=30.0, ge=1.0, le=300.0)
+    invidious_requests_per_second: float = Field(default=50.0, ge=1.0, le=1000.0)
+    invidious_breaker_threshold: int = Field(default=10, ge=1, le=100)
+    invidious_breaker_cooldown: float = Field(default=30.0, ge=1.0, le=600.0)
     invidious_author_thumbnails: bool = False
     invidious_proxy_channels: bool = True
     invidious_proxy_channel_tabs: bool = True
@@ -45,6 +51,7 @@ class Settings(BaseModel):
     # Feed
     feed_fetch_interval: int = Field(default=1800, ge=300, le=86400)
     feed_channel_delay: int = Field(default=2, ge=1, le=30)
+    feed_max_concurrent_channels: int = Field(default=4, ge=1, le=16)
     feed_max_videos: int = Field(default=30, ge=10, le=100)
     feed_video_max_age: int = Field(default=30, ge=1, le=365)
     feed_ytdlp_use_flat_playlist: bool = Field(
@@ -107,7 +114,8 @@ def load_settings() -> Settings:
 def save_settings(settings: Settings) -> None:
     """Save settings to database and update cache."""
     global _cached_settings
-    database.update_settings(settings.model_dump())
+    # All fields are scalars, so dict() gives the same values as model_dump() without the serializer pass
+    database.update_settings(dict(settings))
     _cached_settings = settings
     logger.info("Settings updated and cache refreshed")
 
@@ -16,6 +16,12 @@ document.addEventListener('alpine:init', () => {
         invidious_timeout: 10,
         invidious_max_retries: 3,
         invidious_retry_delay: 1.0,
+        invidious_max_connections: 200,
+        invidious_max_keepalive: 100,
+        invidious_keepalive_expiry: 30.0,
+        invidious_requests_per_second: 50.0,
+        invidious_breaker_threshold: 10,
+        invidious_breaker_cooldown: 30.0,
         invidious_proxy_videos: true,
         invidious_proxy_channels: true,
         invidious_proxy_channel_tabs: true,
@@ -27,6 +33,7 @@ document.addEventListener('alpine:init', () => {
         feed_fetch_interval: 1800,
         feed_fetch_interval_minutes: 30,
         feed_channel_delay: 2,
+        feed_max_concurrent_channels: 4,
         feed_max_videos: 30,
         feed_video_max_age: 30,
         feed_ytdlp_use_flat_playlist: false,
@@ -69,6 +76,12 @@ document.addEventListener('alpine:init', () => {
                 this.invidious_timeout = settings.invidious_timeout || 10;
                 this.invidious_max_retries = settings.invidious_max_retries || 3;
                 this.invidious_retry_delay = settings.invidious_retry_delay || 1.0;
+                this.invidious_max_connections = settings.invidious_max_connections || 200;
+                this.invidious_max_keepalive = settings.invidious_max_keepalive || 100;
+                this.invidious_keepalive_expiry = settings.invidious_keepalive_expiry || 30.0;
+                this.invidious_requests_per_second = settings.invidious_requests_per_second || 50.0;
+                this.invidious_breaker_threshold = settings.invidious_breaker_threshold || 10;
+                this.invidious_breaker_cooldown = settings.invidious_breaker_cooldown || 30.0;
                 this.invidious_proxy_videos = settings.invidious_proxy_videos || false;
                 this.invidious_proxy_channels = settings.invidious_proxy_channels !== false;
                 this.invidious_proxy_channel_tabs = settings.invidious_proxy_channel_tabs !== false;
@@ -79,6 +92,7 @@ document.addEventListener('alpine:init', () => {
                 this.feed_fetch_interval = settings.feed_fetch_interval || 1800;
                 this.feed_fetch_interval_minutes = Math.round(this.feed_fetch_interval / 60);
                 this.feed_channel_delay = settings.feed_channel_delay || 2;
+                this.feed_max_concurrent_channels = settings.feed_max_concurrent_channels || 4;
                 this.feed_max_videos = settings.feed_max_videos || 30;
                 this.feed_video_max_age = settings.feed_video_max_age || 30;
                 this.feed_ytdlp_use_flat_playlist = settings.feed_ytdlp_use_flat_playlist || false;
@@ -117,6 +131,12 @@ document.addEventListener('alpine:init', () => {
                     invidious_timeout: parseInt(this.invidious_timeout) || 10,
                     invidious_max_retries: parseInt(this.invidious_max_retries) || 3,
                     invidious_retry_delay: parseFloat(this.invidious_retry_delay) || 1.0,
+                    invidious_max_connections: parseInt(this.invidious_max_connections) || 200,
+                    invidious_max_keepalive: parseInt(this.invidious_max_keepalive) || 100,
+                    invidious_keepalive_expiry: parseFloat(this.invidious_keepalive_expiry) || 30.0,
+                    invidious_requests_per_second: parseFloat(this.invidious_requests_per_second) || 50.0,
+                    invidious_breaker_threshold: parseInt(this.invidious_breaker_threshold) || 10,
+                    invidious_breaker_cooldown: parseFloat(this.invidious_breaker_cooldown) || 30.0,
                     invidious_proxy_videos: this.invidious_proxy_videos,
                     invidious_proxy_channels: this.invidious_proxy_channels,
                     invidious_proxy_channel_tabs: this.invidious_proxy_channel_tabs,
@@ -126,6 +146,7 @@ document.addEventListener('alpine:init', () => {
                     invidious_author_thumbnails: this.invidious_author_thumbnails,
                     feed_fetch_interval: (parseInt(this.feed_fetch_interval_minutes) || 30) * 60,
                     feed_channel_delay: parseInt(this.feed_channel_delay) || 2,
+                    feed_max_concurrent_channels: parseInt(this.feed_max_concurrent_channels) || 4,
                     feed_max_videos: parseInt(this.feed_max_videos) || 30,
                     feed_video_max_age: parseInt(this.feed_video_max_age) || 30,
                     feed_ytdlp_use_flat_playlist: this.feed_ytdlp_use_flat_playlist,
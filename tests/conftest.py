@@ -396,6 +396,7 @@ def mock_httpx(mock_invidious_video, mock_invidious_channel):
         else:
             response.json.return_value = {}
             response.text = "{}"
+        response.content = response.text.encode()
 
         response.raise_for_status = MagicMock()
         return response
@@ -547,6 +548,18 @@ def admin_client(app_no_lifespan, test_db_with_user):
 # =============================================================================
 
 
+@pytest.fixture(autouse=True)
+def clear_invidious_caches():
+    """Keep cached Invidious responses from leaking between tests."""
+    import invidious_proxy
+
+    invidious_proxy.clear_response_caches()
+    invidious_proxy.reset_request_guards()
+    yield
+    invidious_proxy.clear_response_caches()
+    invidious_proxy.reset_request_guards()
+
+
 @pytest.fixture
 def reset_caches():
     """Reset all yt-dlp caches before test."""
@@ -599,10 +612,12 @@ def mock_dns_public():
     """
     import socket
 
+    from feed_fetcher import clear_channel_url_cache
     from security import clear_dns_cache
 
     # Clear DNS cache before and after test
     clear_dns_cache()
+    clear_channel_url_cache()
 
     # Mock DNS resolution to return public IP (8.8.8.8 - Google's DNS)
     def mock_getaddrinfo(hostname, port, family=0, type=0, proto=0, flags=0):
@@ -615,6 +630,7 @@ def mock_dns_public():
     yield
     socket.getaddrinfo = original_getaddrinfo
     clear_dns_cache()
+    clear_channel_url_cache()
 
 
 # Configure pytest-asyncio
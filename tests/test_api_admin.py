@@ -0,0 +1,305 @@
+"""Tests for routers/admin - Admin API endpoints."""
+
+import os
+import sys
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+
+# =============================================================================
+# Tests for /api/sites
+# =============================================================================
+
+
+class TestSitesApi:
+    """Tests for the site management endpoints."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, admin_client):
+        """Setup test fixtures."""
+        self.client = admin_client
+
+    def test_site_responses_use_json_types(self):
+        """Test site and credential responses carry booleans, not SQLite integers."""
+        response = self.client.post(
+            "/api/sites",
+            json={
+                "name": "Example",
+                "extractor_pattern": "example",
+                "credentials": [{"credential_type": "cookies", "value": "secret"}],
+            },
+        )
+        assert response.status_code == 200
+        site = response.json()
+        assert site["enabled"] is True
+        assert site["proxy_streaming"] is True
+        assert site["credentials"][0]["has_value"] is True
+        assert isinstance(site["credentials"][0]["is_encrypted"], bool)
+
+        credential = self.client.post(
+            f"/api/sites/{site['id']}/credentials", json={"credential_type": "password", "value": "pw"}
+        ).json()
+        assert isinstance(credential["is_encrypted"], bool)
+
+        sites = {s["id"]: s for s in self.client.get("/api/sites").json()}
+        assert sites[site["id"]] == {
+            "id": site["id"],
+            "name": "Example",
+            "extractor_pattern": "example",
+            "enabled": True,
+            "priority": 0,
+            "proxy_streaming": True,
+            "credential_count": 2,
+            "credentials": None,
+            "created_at": site["created_at"],
+            "updated_at": site["updated_at"],
+        }
+
+    def test_create_site_stores_credentials(self):
+        """Test credentials posted with a new site are stored, encrypting only sensitive types."""
+        import database
+        import encryption
+
+        site = self.client.post(
+            "/api/sites",
+            json={
+                "name": "Example",
+                "extractor_pattern": "example",
+                "credentials": [
+                    {"credential_type": "password", "value": "pw"},
+                    {"credential_type": "username", "key": "user", "value": "me"},
+                ],
+            },
+        ).json()
+
+        stored = {c["credential_type"]: c for c in database.get_site(site["id"])["credentials"]}
+        assert stored["password"]["is_encrypted"]
+        assert encryption.decrypt(stored["password"]["value"]) == "pw"
+        assert not stored["username"]["is_encrypted"]
+        assert (stored["username"]["key"], stored["username"]["value"]) == ("user", "me")
+
+    def test_list_extractors(self):
+        """Test the popular sites list is returned as JSON."""
+        from routers.admin.sites import POPULAR_SITES
+
+        response = self.client.get("/api/extractors")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == [dict(site) for site in POPULAR_SITES]
+
+    def test_popular_sites_are_read_only(self):
+        """Test the shared popular sites list cannot be modified in place."""
+        from routers.admin.sites import POPULAR_SITES
+
+        with pytest.raises(TypeError):
+            POPULAR_SITES[0]["name"] = "Changed"
+        with pytest.raises(TypeError):
+            POPULAR_SITES[0] = {}
+
+    def test_missing_site_returns_404(self):
+        """Test updating a missing site or adding a credential to it returns 404."""
+        assert self.client.put("/api/sites/9999", json={"name": "Nope"}).status_code == 404
+        response = self.client.post("/api/sites/9999/credentials", json={"credential_type": "cookies", "value": "v"})
+        assert response.status_code == 404
+
+    def test_delete_credential_checks_site(self):
+        """Test a credential can only be deleted through the site it belongs to."""
+        import database
+
+        site_id = database.create_site("Example", "example")
+        other_site_id = database.create_site("Other", "other")
+        cred_id = database.add_credential(site_id, "cookies", "value")
+
+        assert self.client.delete(f"/api/sites/{other_site_id}/credentials/{cred_id}").status_code == 404
+        assert database.get_credential(cred_id) is not None
+
+        assert self.client.delete(f"/api/sites/{site_id}/credentials/{cred_id}").status_code == 200
+        assert database.get_credential(cred_id) is None
+
+
+# =============================================================================
+# Tests for /api/users
+# =============================================================================
+
+
+class TestUsersApi:
+    """Tests for the user management endpoints."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, admin_client):
+        """Setup test fixtures."""
+        self.client = admin_client
+
+    def test_list_users(self):
+        """Test users are listed with boolean admin flags and no password hashes."""
+        users = self.client.get("/api/users").json()
+
+        assert {u["username"]: u["is_admin"] for u in users} == {"testuser": False, "adminuser": True}
+        assert all(set(u) == {"id", "username", "is_admin", "created_at", "last_login"} for u in users)
+
+    def test_create_user_returns_stored_row(self):
+        """Test creating a user responds with the stored row, including database defaults."""
+        import database
+
+        created = self.client.post("/api/users", json={"username": "newuser", "password": "password123"}).json()
+
+        stored = database.get_user_by_id(created["id"])
+        assert created == {
+            "id": stored["id"],
+            "username": "newuser",
+            "is_admin": False,
+            "created_at": stored["created_at"],
+            "last_login": None,
+        }
+        assert created["created_at"]
+
+    def test_update_user_reflects_new_admin_flag(self):
+        """Test updating a user responds with the applied admin flag."""
+        import database
+
+        user_id = database.create_user("other", "hash")
+
+        response = self.client.put(f"/api/users/{user_id}", json={"is_admin": True})
+
+        assert response.status_code == 200
+        assert response.json()["is_admin"] is True
+        assert response.json()["username"] == "other"
+        assert database.get_user_by_id(user_id)["is_admin"]
+
+
+# =============================================================================
+# Tests for /api/watched-channels
+# =============================================================================
+
+
+class TestWatchedChannelsApi:
+    """Tests for the watched channels endpoint."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, admin_client):
+        """Setup test fixtures."""
+        self.client = admin_client
+
+    def test_youtube_urls_are_generated(self):
+        """Test YouTube channels without stored URLs get channel and avatar URLs generated."""
+        import database
+
+        database.upsert_watched_channels(
+            [
+                {"channel_id": "UCabc", "site": "youtube"},
+                {"channel_id": "@handle", "site": "YouTube"},
+                {"channel_id": "123", "site": "vimeo", "channel_url": "https://vimeo.com/123"},
+                {"channel_id": "UCset", "site": "youtube", "channel_url": "https://yt/x", "avatar_url": "https://a/x"},
+            ]
+        )
+
+        channels = {c["channel_id"]: c for c in self.client.get("/api/watched-channels").json()}
+
+        assert channels["UCabc"]["channel_url"] == "https://www.youtube.com/channel/UCabc"
+        assert channels["UCabc"]["avatar_url"] == "http://testserver/api/v1/channels/UCabc/avatar/176.jpg"
+        assert channels["@handle"]["channel_url"] == "https://www.youtube.com/@handle"
+        assert channels["123"]["channel_url"] == "https://vimeo.com/123"
+        assert channels["123"]["avatar_url"] is None
+        assert channels["UCset"]["channel_url"] == "https://yt/x"
+        assert channels["UCset"]["avatar_url"] == "https://a/x"
+
+    def test_lists_many_channels(self):
+        """Test every watched channel is returned with its default video stats."""
+        import database
+
+        database.upsert_watched_channels([{"channel_id": f"UC{i}", "site": "youtube"} for i in range(5)])
+
+        response = self.client.get("/api/watched-channels")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        channels = response.json()
+        assert sorted(c["channel_id"] for c in channels) == [f"UC{i}" for i in range(5)]
+        assert all(c["video_count"] == 0 and c["last_video_title"] is None for c in channels)
+
+    def test_empty_list(self):
+        """Test no watched channels returns an empty array."""
+        assert self.client.get("/api/watched-channels").json() == []
+
+    def test_refresh_all_schedules_youtube_avatars(self):
+        """Test refresh-all schedules avatar fetches for YouTube channels only, whatever the site casing."""
+        from unittest.mock import AsyncMock, MagicMock, patch
+
+        import database
+
+        database.upsert_watched_channels(
+            [
+                {"channel_id": "UCabc", "site": "youtube"},
+                {"channel_id": "UCdef", "site": "YouTube"},
+                {"channel_id": "123", "site": "vimeo"},
+            ]
+        )
+        scheduled = []
+        cache = MagicMock()
+        cache.schedule_background_fetch_many.side_effect = lambda ids: scheduled.extend(ids) or len(scheduled)
+
+        with (
+            patch("routers.admin.settings.avatar_cache.get_cache", return_value=cache),
+            patch("routers.admin.settings.fetch_all_channels", new_callable=AsyncMock) as mock_fetch,
+        ):
+            response = self.client.post("/api/watched-channels/refresh-all")
+
+        assert response.json()["success"] is True
+        assert sorted(scheduled) == ["UCabc", "UCdef"]
+        mock_fetch.assert_called_once()
+
+
+# =============================================================================
+# Tests for /api/settings
+# =============================================================================
+
+
+class TestSettingsApi:
+    """Tests for the settings endpoints."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, admin_client):
+        """Setup test fixtures."""
+        self.client = admin_client
+
+    def test_get_follows_the_current_settings_object(self, test_settings):
+        """Test GET serves the current settings object, re-encoding only when it is replaced."""
+        from unittest.mock import patch
+
+        before = self.client.get("/api/settings").json()
+        assert before["ytdlp_timeout"] == test_settings.ytdlp_timeout
+        assert self.client.get("/api/settings").json() == before
+
+        replaced = test_settings.model_copy(update={"ytdlp_timeout": 99})
+        with patch("settings.get_settings", return_value=replaced):
+            assert self.client.get("/api/settings").json() == {**before, "ytdlp_timeout": 99}
+
+    def test_put_returns_updated_settings(self, test_settings):
+        """Test PUT responds with the merged new settings."""
+        response = self.client.put("/api/settings", json={"ytdlp_timeout": 45})
+
+        assert response.status_code == 200
+        assert response.json()["ytdlp_timeout"] == 45
+        assert response.json()["ytdlp_path"] == test_settings.ytdlp_path
+
+    def test_put_rejects_out_of_range_values(self, test_settings):
+        """Test PUT still validates the merged settings."""
+        response = self.client.put("/api/settings", json={"cache_video_ttl": 1})
+
+        assert response.status_code == 400
+        assert "cache_video_ttl" in response.json()["detail"]
+
+    def test_put_resets_caches_only_for_cache_settings(self, test_settings):
+        """Test changing a cache TTL resets the yt-dlp caches and other settings do not."""
+        from unittest.mock import patch
+
+        with patch("routers.admin.settings.reset_caches") as mock_reset:
+            self.client.put("/api/settings", json={"ytdlp_timeout": 45})
+            mock_reset.assert_not_called()
+
+            self.client.put("/api/settings", json={"cache_video_ttl": 600})
+            mock_reset.assert_called_once()
@@ -145,9 +145,15 @@ class TestChannelsMetadata:
         )
 
         assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
         data = response.json()
         assert "channels" in data
         assert len(data["channels"]) == 2
+        channels = {c["channel_id"]: c for c in data["channels"]}
+        assert channels["UCchannel1"]["subscriber_count"] == 1000000
+        assert channels["UCchannel1"]["is_verified"] == 1
+        assert channels["UCchannel2"]["is_verified"] == 0
+        assert channels["UCchannel1"]["metadata_updated_at"]
 
     def test_metadata_empty_request(self):
         """Test metadata with empty channel_ids."""
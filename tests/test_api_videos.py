@@ -523,3 +523,37 @@ class TestValidateExtractorAllowed:
             validate_extractor_allowed("unknown_site")
 
         assert exc_info.value.status_code == 403
+
+
+# =============================================================================
+# Tests for GET /api/v1/comments/{video_id}
+# =============================================================================
+
+
+class TestComments:
+    """Tests for GET /api/v1/comments/{video_id} endpoint."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, test_db, test_client):
+        """Setup test fixtures."""
+        self.db_path = test_db
+        self.client = test_client
+
+    def test_comments_resolves_thumbnails_and_returns_json(self):
+        """Test comments are returned as JSON with relative author thumbnails resolved."""
+        comments = {
+            "commentCount": 1,
+            "comments": [{"author": "Someone", "authorThumbnails": [{"url": "/ggpht/a.jpg", "width": 48}]}],
+            "continuation": "next",
+        }
+        with patch("routers.comments.invidious_proxy.is_enabled", return_value=True):
+            with patch("routers.comments.invidious_proxy.get_comments", new_callable=AsyncMock) as mock_comments:
+                mock_comments.return_value = comments
+                with patch("routers.comments.invidious_proxy.get_base_url", return_value="https://inv.example.com"):
+                    response = self.client.get("/api/v1/comments/abc123xyz00")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        data = response.json()
+        assert data["continuation"] == "next"
+        assert data["comments"][0]["authorThumbnails"][0]["url"] == "https://inv.example.com/ggpht/a.jpg"
@@ -223,6 +223,33 @@ class TestAvatarCacheScheduleBackgroundFetch:
             # Close the unawaited coroutine to avoid RuntimeWarning
             mock_task.call_args[0][0].close()
 
+    def test_many_schedules_only_missing_channels(self):
+        """Test batch scheduling skips cached, pending and repeated channels."""
+        cache = AvatarCache()
+        cache._cache["UCcached"] = CachedAvatar(channel_id="UCcached", thumbnails=[], cached_at=time.time())
+        cache._pending.add("UCpending")
+        with (
+            patch("avatar_cache.invidious_proxy.is_enabled", return_value=True) as mock_enabled,
+            patch("asyncio.create_task") as mock_task,
+        ):
+            scheduled = cache.schedule_background_fetch_many(["UCnew", "UCcached", "UCpending", "UCnew", "UCother"])
+
+        assert scheduled == 2
+        assert mock_enabled.call_count == 1
+        assert mock_task.call_count == 2
+        for call in mock_task.call_args_list:
+            call[0][0].close()
+
+    def test_many_skips_when_invidious_disabled(self):
+        """Test batch scheduling does nothing when Invidious is disabled."""
+        cache = AvatarCache()
+        with (
+            patch("avatar_cache.invidious_proxy.is_enabled", return_value=False),
+            patch("asyncio.create_task") as mock_task,
+        ):
+            assert cache.schedule_background_fetch_many(["UC123"]) == 0
+            mock_task.assert_not_called()
+
 
 class TestAvatarCacheEviction:
     """Tests for AvatarCache eviction and cleanup."""
@@ -0,0 +1,54 @@
+"""Tests for database/connection.py - connection setup."""
+
+import os
+import sys
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+
+# =============================================================================
+# Tests for connection pragmas
+# =============================================================================
+
+
+class TestConnectionPragmas:
+    """Tests for the pragmas applied to each connection."""
+
+    @pytest.fixture(autouse=True)
+    def setup_test_db(self, test_db):
+        """Setup test database for each test."""
+        self.db_path = test_db
+
+    def test_pragmas_applied(self):
+        """Test connections use WAL, relaxed sync, in-memory temp storage and foreign keys."""
+        import database
+
+        with database.get_connection() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+            assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+            assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+
+    def test_deleting_site_cascades_to_credentials(self):
+        """Test ON DELETE CASCADE removes a deleted site's credentials."""
+        import database
+
+        site_id = database.create_site("Example", "example")
+        database.add_credential(site_id, "cookies", "value")
+
+        assert database.delete_site(site_id) is True
+        with database.get_connection() as conn:
+            count = conn.execute("SELECT COUNT(*) FROM credentials WHERE site_id = ?", (site_id,)).fetchone()[0]
+        assert count == 0
+
+    def test_optimize_db(self):
+        """Test optimize_db runs on a populated database and leaves it usable."""
+        import database
+
+        database.create_user("user", "hash")
+        database.optimize_db()
+
+        assert database.count_users() == 1
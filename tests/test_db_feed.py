@@ -0,0 +1,126 @@
+"""Tests for database/repositories/feed.py - Feed repository functions."""
+
+import json
+import os
+import sys
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+
+# =============================================================================
+# Tests for feed writes on a shared transaction
+# =============================================================================
+
+
+class TestFeedTransaction:
+    """Tests for feed repository writes inside database.transaction()."""
+
+    @pytest.fixture(autouse=True)
+    def setup_test_db(self, test_db):
+        """Setup test database for each test."""
+        self.db_path = test_db
+
+    def _videos(self, *video_ids):
+        return [{"video_id": vid, "title": vid, "thumbnails": [{"url": "t.jpg"}]} for vid in video_ids]
+
+    def test_upsert_cached_videos_replaces_and_dedupes(self):
+        """Test upsert replaces old videos and skips duplicate IDs."""
+        import database
+
+        database.upsert_cached_videos("UC1", "youtube", self._videos("a", "b"))
+        database.upsert_cached_videos("UC1", "youtube", self._videos("c", "c", "d"))
+
+        feed = database.get_feed_for_channels([{"channel_id": "UC1", "site": "youtube"}])
+        assert sorted(v["video_id"] for v in feed) == ["c", "d"]
+
+    def test_upsert_cached_videos_accepts_dataclass(self):
+        """Test CachedVideo instances are stored with their thumbnails serialized."""
+        import database
+
+        video = database.CachedVideo(video_id="a", title="A", thumbnails=[{"url": "t.jpg", "quality": "high"}])
+        database.upsert_cached_videos("UC1", "youtube", [video])
+
+        with database.get_connection() as conn:
+            row = conn.execute("SELECT title, thumbnail_data FROM cached_videos WHERE video_id = 'a'").fetchone()
+        assert row["title"] == "A"
+        assert json.loads(row["thumbnail_data"]) == [{"url": "t.jpg", "quality": "high"}]
+
+    def test_transaction_commits_shared_writes(self):
+        """Test writes passed a shared connection are committed together."""
+        import database
+
+        with database.transaction() as conn:
+            database.upsert_cached_videos("UC1", "youtube", self._videos("a"), conn=conn)
+            database.update_fetch_status("UC1", "youtube", success=True, max_videos_fetched=1, conn=conn)
+
+        assert database.get_cached_channel_ids([{"channel_id": "UC1", "site": "youtube"}]) == {("UC1", "youtube")}
+        with database.get_connection() as conn:
+            row = conn.execute("SELECT max_videos_fetched FROM feed_fetch_status WHERE channel_id = 'UC1'").fetchone()
+        assert row[0] == 1
+
+    def test_transaction_rolls_back_on_error(self):
+        """Test an exception inside the block discards every write."""
+        import database
+
+        with pytest.raises(RuntimeError):
+            with database.transaction() as conn:
+                database.upsert_cached_videos("UC1", "youtube", self._videos("a"), conn=conn)
+                database.update_fetch_status("UC1", "youtube", success=True, conn=conn)
+                raise RuntimeError("boom")
+
+        with database.get_connection() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM cached_videos").fetchone()[0] == 0
+            assert conn.execute("SELECT COUNT(*) FROM feed_fetch_status").fetchone()[0] == 0
+
+    def test_transaction_reuses_given_connection(self):
+        """Test a passed connection is used for the transaction and left open."""
+        import database
+
+        with database.get_connection() as conn:
+            with database.transaction(conn) as tx_conn:
+                assert tx_conn is conn
+                database.update_fetch_status("UC1", "youtube", success=True, conn=conn)
+            # Still usable after the transaction commits
+            assert conn.execute("SELECT COUNT(*) FROM feed_fetch_status").fetchone()[0] == 1
+
+
+# =============================================================================
+# Tests for watched channel status
+# =============================================================================
+
+
+class TestWatchedChannelsWithStatus:
+    """Tests for get_watched_channels_with_status."""
+
+    @pytest.fixture(autouse=True)
+    def setup_test_db(self, test_db):
+        """Setup test database for each test."""
+        self.db_path = test_db
+
+    def test_video_stats_per_channel(self):
+        """Test each channel gets its video count, latest publish time and latest title."""
+        import database
+
+        database.upsert_watched_channels(
+            [{"channel_id": "UC1", "site": "youtube"}, {"channel_id": "UC2", "site": "youtube"}]
+        )
+        database.upsert_cached_videos(
+            "UC1",
+            "youtube",
+            [
+                {"video_id": "a", "title": "Old", "published": 100},
+                {"video_id": "b", "title": "Newest", "published": 300},
+                {"video_id": "c", "title": "Middle", "published": 200},
+            ],
+        )
+
+        channels = {c["channel_id"]: c for c in database.get_watched_channels_with_status()}
+
+        assert channels["UC1"]["video_count"] == 3
+        assert channels["UC1"]["last_video_published"] == 300
+        assert channels["UC1"]["last_video_title"] == "Newest"
+        assert channels["UC2"]["video_count"] == 0
+        assert channels["UC2"]["last_video_title"] is None
@@ -0,0 +1,82 @@
+"""Tests for database/schema.py - Alembic-based schema initialization."""
+
+import os
+import sys
+from unittest.mock import patch
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+
+# =============================================================================
+# Tests for init_db
+# =============================================================================
+
+
+class TestInitDb:
+    """Tests for init_db migration handling."""
+
+    def test_init_db_skips_upgrade_at_head(self, test_db):
+        """Test init_db does not run alembic upgrade when already at head."""
+        import database.schema
+
+        with patch("database.schema.command.upgrade") as mock_upgrade:
+            database.schema.init_db()
+
+        mock_upgrade.assert_not_called()
+
+    def test_init_db_upgrades_when_behind_head(self, test_db):
+        """Test init_db runs alembic upgrade when revision is behind head."""
+        import database.schema
+
+        with patch("database.schema._get_head_revision", return_value="999"):
+            with patch("database.schema.command.upgrade") as mock_upgrade:
+                database.schema.init_db()
+
+        mock_upgrade.assert_called_once()
+        assert mock_upgrade.call_args[0][1] == "head"
+
+    def test_init_db_shares_its_connection_with_alembic(self, test_db):
+        """Test the upgrade runs on init_db's connection, which is released afterwards."""
+        import database.schema
+
+        seen = []
+
+        def fake_upgrade(cfg, revision):
+            seen.append(cfg.attributes.get("connection"))
+
+        with patch("database.schema._get_head_revision", return_value="999"):
+            with patch("database.schema.command.upgrade", side_effect=fake_upgrade):
+                database.schema.init_db()
+
+        assert seen and seen[0] is not None
+        assert "connection" not in database.schema._get_alembic_config().attributes
+
+    def test_init_db_analyzes_after_migrating(self, test_db, tmp_path):
+        """Test a fresh database has planner statistics once its migrations have run."""
+        import sqlite3
+
+        conn = sqlite3.connect(tmp_path / "yattee.db")
+        try:
+            row = conn.execute("SELECT name FROM sqlite_master WHERE name = 'sqlite_stat1'").fetchone()
+        finally:
+            conn.close()
+
+        assert row is not None
+
+    def test_migration_engine_runs_ddl_in_transactions(self, tmp_path):
+        """Test DDL on a migration connection is rolled back with its transaction."""
+        from sqlalchemy import text
+
+        from database.schema import create_migration_engine
+
+        engine = create_migration_engine(f"sqlite:///{tmp_path / 'tx.db'}")
+        with engine.connect() as conn:
+            conn.execute(text("CREATE TABLE t (x INTEGER)"))
+            conn.rollback()
+        with engine.connect() as conn:
+            count = conn.execute(text("SELECT COUNT(*) FROM sqlite_master WHERE name = 't'")).scalar()
+            journal_mode = conn.execute(text("PRAGMA journal_mode")).scalar()
+
+        assert count == 0
+        assert journal_mode == "wal"
@@ -131,7 +131,7 @@ class TestUserRepository:
         users = database.get_all_users()
         assert len(users) == 2
         # Should not include password hash
-        assert "password_hash" not in users[0]
+        assert "password_hash" not in users[0].keys()
 
     def test_get_all_users_empty(self):
         """Test getting all users when none exist."""
@@ -199,6 +199,17 @@ class TestUserRepository:
         user = database.get_user_by_id(user_id)
         assert user["is_admin"] == 1
 
+    def test_update_user_password_and_admin(self):
+        """Test update_user sets password hash and admin status in one call."""
+        import database
+
+        user_id = database.create_user("user", "oldhash", is_admin=False)
+        result = database.update_user(user_id, is_admin=True, password_hash="newhash")
+        assert result is True
+        user = database.get_user_by_id(user_id)
+        assert user["is_admin"] == 1
+        assert user["password_hash"] == "newhash"
+
     def test_update_user_no_changes(self):
         """Test update_user with no changes returns False."""
         import database
@@ -217,6 +228,21 @@ class TestUserRepository:
         user = database.get_user_by_id(user_id)
         assert user is None
 
+    def test_has_any_user_remembers_users_until_deletion(self):
+        """Test has_any_user stops querying once users exist and rechecks after a deletion."""
+        from unittest.mock import patch
+
+        import database
+        from database.repositories import users
+
+        user_id = database.create_user("only", "hash")
+        assert database.has_any_user() is True
+        with patch.object(users, "get_connection", side_effect=AssertionError("queried")):
+            assert database.has_any_user() is True
+
+        database.delete_user(user_id)
+        assert database.has_any_user() is False
+
     def test_delete_user_not_found(self):
         """Test deleting non-existent user returns False."""
         import database
@@ -259,6 +285,18 @@ class TestUserRepository:
         database.create_user("admin", "hash", is_admin=True)
         assert database.count_admins() == 1
 
+    def test_has_multiple_admins(self):
+        """Test has_multiple_admins only reports true from the second admin on."""
+        import database
+
+        database.create_user("user", "hash", is_admin=False)
+        assert database.has_multiple_admins() is False
+        database.create_user("admin1", "hash", is_admin=True)
+        assert database.has_multiple_admins() is False
+        database.create_user("admin2", "hash", is_admin=True)
+        database.create_user("admin3", "hash", is_admin=True)
+        assert database.has_multiple_admins() is True
+
     def test_user_created_at_timestamp(self):
         """Test that created_at timestamp is set on user creation."""
         import database
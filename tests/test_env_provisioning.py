@@ -0,0 +1,122 @@
+"""Tests for env_provisioning.py - startup auto-provisioning from env vars."""
+
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+
+# =============================================================================
+# Tests for apply_env_provisioning
+# =============================================================================
+
+
+class TestApplyEnvProvisioning:
+    """Tests for apply_env_provisioning."""
+
+    @pytest.fixture(autouse=True)
+    def setup_env(self, test_db, monkeypatch):
+        """Configure provisioning env vars on a fresh database."""
+        import config
+
+        monkeypatch.setattr(config, "ADMIN_USERNAME", "provadmin")
+        monkeypatch.setattr(config, "ADMIN_PASSWORD", "provpass")
+        monkeypatch.setattr(config, "INVIDIOUS_INSTANCE_URL", None)
+
+    def test_creates_admin_and_stores_fingerprint(self):
+        """Test first run creates the admin user and records a fingerprint."""
+        import database
+        import env_provisioning
+
+        env_provisioning.apply_env_provisioning()
+
+        user = database.get_user_by_username("provadmin")
+        assert user is not None
+        assert user["is_admin"] == 1
+        assert database.get_provisioning_fingerprint()
+
+    def test_fingerprint_does_not_contain_password(self):
+        """Test the stored fingerprint does not expose the plain password."""
+        import database
+        import env_provisioning
+
+        env_provisioning.apply_env_provisioning()
+
+        assert "provpass" not in database.get_provisioning_fingerprint()
+
+    def test_skips_when_unchanged(self):
+        """Test a second run with identical env vars does no provisioning work."""
+        import env_provisioning
+
+        env_provisioning.apply_env_provisioning()
+
+        with patch("env_provisioning._provision_admin_user") as mock_admin:
+            env_provisioning.apply_env_provisioning()
+
+        mock_admin.assert_not_called()
+
+    def test_reapplies_when_changed(self, monkeypatch):
+        """Test a changed password triggers provisioning again."""
+        import auth
+        import config
+        import database
+        import env_provisioning
+
+        env_provisioning.apply_env_provisioning()
+        monkeypatch.setattr(config, "ADMIN_PASSWORD", "newpass")
+        env_provisioning.apply_env_provisioning()
+
+        user = database.get_user_by_username("provadmin")
+        assert auth.verify_password("newpass", user["password_hash"])
+
+    def test_noop_without_env_vars(self, monkeypatch):
+        """Test nothing is written when no provisioning env vars are set."""
+        import config
+        import database
+        import env_provisioning
+
+        monkeypatch.setattr(config, "ADMIN_USERNAME", None)
+        monkeypatch.setattr(config, "ADMIN_PASSWORD", None)
+        env_provisioning.apply_env_provisioning()
+
+        assert database.get_provisioning_fingerprint() is None
+
+    def test_fingerprint_is_keyed_with_server_secret(self, monkeypatch):
+        """Test the fingerprint changes with the signing key, so it can't be recomputed from the password alone."""
+        import database
+        import env_provisioning
+        import tokens
+
+        env_provisioning.apply_env_provisioning()
+        stored = database.get_provisioning_fingerprint()
+
+        monkeypatch.setattr(tokens, "_signing_secret", "another-secret")
+        assert not env_provisioning._fingerprint_matches(stored, ("provadmin", "provpass", ""))
+
+    def test_reapplies_when_admin_removed(self):
+        """Test an unchanged fingerprint still re-provisions once the admin user is gone."""
+        import database
+        import env_provisioning
+
+        env_provisioning.apply_env_provisioning()
+        database.delete_user(database.get_user_by_username("provadmin")["id"])
+        env_provisioning.apply_env_provisioning()
+
+        user = database.get_user_by_username("provadmin")
+        assert user is not None
+        assert user["is_admin"] == 1
+
+    def test_reapplies_when_admin_demoted(self):
+        """Test an unchanged fingerprint still re-provisions once the user is no longer an admin."""
+        import database
+        import env_provisioning
+
+        env_provisioning.apply_env_provisioning()
+        database.update_user(database.get_user_by_username("provadmin")["id"], is_admin=False)
+        env_provisioning.apply_env_provisioning()
+
+        assert database.get_user_by_username("provadmin")["is_admin"] == 1
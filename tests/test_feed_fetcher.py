@@ -1,5 +1,6 @@
 """Tests for feed_fetcher module."""
 
+import asyncio
 import os
 import sys
 from unittest.mock import AsyncMock, patch
@@ -20,6 +21,9 @@ from feed_fetcher import (
     _parse_timestamp,
     _process_invidious_video,
     _process_ytdlp_video,
+    _store_channel_results,
+    feed_fetch_loop,
+    fetch_all_channels,
     fetch_channel_feed,
 )
 
@@ -37,6 +41,16 @@ class TestBuildChannelUrl:
         url = _build_channel_url("UCabcdef123", "youtube", "https://youtube.com/channel/UCabcdef123")
         assert url == "https://www.youtube.com/channel/UCabcdef123/videos"
 
+    def test_youtube_site_is_case_insensitive(self):
+        """Test the YouTube builder is selected regardless of site casing."""
+        url = _build_channel_url("@username", "YouTube", "")
+        assert url == "https://www.youtube.com/@username/videos"
+
+    def test_non_youtube_requires_channel_url(self):
+        """Test other sites without a channel_url are rejected."""
+        with pytest.raises(ValueError, match="channel_url is required"):
+            _build_channel_url("@username", "dailymotion", "")
+
     def test_youtube_other_id(self, mock_dns_public):
         """Test URL building for other YouTube IDs falls back to channel_url."""
         url = _build_channel_url("custom123", "youtube", "https://youtube.com/c/custom123")
@@ -47,6 +61,23 @@ class TestBuildChannelUrl:
         url = _build_channel_url("channel123", "dailymotion", "https://dailymotion.com/channel123")
         assert url == "https://dailymotion.com/channel123"
 
+    def test_safety_check_is_cached_per_url(self, mock_dns_public):
+        """Test the SSRF check runs once per channel URL while cached."""
+        with patch("feed_fetcher.is_safe_url_strict", return_value=(True, None)) as mock_check:
+            _build_channel_url("channel123", "dailymotion", "https://dailymotion.com/cached")
+            _build_channel_url("channel123", "dailymotion", "https://dailymotion.com/cached")
+
+        mock_check.assert_called_once()
+
+    def test_failed_safety_check_is_not_cached(self):
+        """Test a blocked verdict (e.g. a transient DNS failure) is re-checked on the next call."""
+        with patch("feed_fetcher.is_safe_url_strict", return_value=(False, "DNS resolution failed")) as mock_check:
+            for _ in range(2):
+                with pytest.raises(ValueError, match="DNS resolution failed"):
+                    _build_channel_url("channel123", "dailymotion", "https://dailymotion.com/flaky")
+
+        assert mock_check.call_count == 2
+
 
 class TestProcessInvidiousVideo:
     """Tests for _process_invidious_video function."""
@@ -69,14 +100,14 @@ class TestProcessInvidiousVideo:
 
         result = _process_invidious_video(video_data, "UC123", "https://inv.example.com")
 
-        assert result["video_id"] == "abc123"
-        assert result["title"] == "Test Video"
-        assert result["author"] == "Test Channel"
-        assert result["author_id"] == "UC123"
-        assert result["length_seconds"] == 300
-        assert result["view_count"] == 1000
-        assert result["published"] == 1640000000
-        assert result["video_url"] == "https://www.youtube.com/watch?v=abc123"
+        assert result.video_id == "abc123"
+        assert result.title == "Test Video"
+        assert result.author == "Test Channel"
+        assert result.author_id == "UC123"
+        assert result.length_seconds == 300
+        assert result.view_count == 1000
+        assert result.published == 1640000000
+        assert result.video_url == "https://www.youtube.com/watch?v=abc123"
 
     def test_resolves_thumbnail_urls(self):
         """Test that relative thumbnail URLs are resolved."""
@@ -90,7 +121,7 @@ class TestProcessInvidiousVideo:
 
         result = _process_invidious_video(video_data, "UC123", "https://inv.example.com")
 
-        assert result["thumbnail_url"].startswith("https://inv.example.com")
+        assert result.thumbnail_url.startswith("https://inv.example.com")
 
     def test_handles_missing_fields(self):
         """Test handling of missing fields."""
@@ -98,10 +129,10 @@ class TestProcessInvidiousVideo:
 
         result = _process_invidious_video(video_data, "UC123", "https://inv.example.com")
 
-        assert result["video_id"] == "abc123"
-        assert result["title"] == ""
-        assert result["author"] == ""
-        assert result["length_seconds"] == 0
+        assert result.video_id == "abc123"
+        assert result.title == ""
+        assert result.author == ""
+        assert result.length_seconds == 0
 
 
 class TestProcessYtdlpVideo:
@@ -126,13 +157,13 @@ class TestProcessYtdlpVideo:
 
         result = _process_ytdlp_video(video_data, "UC123")
 
-        assert result["video_id"] == "abc123"
-        assert result["title"] == "Test Video"
-        assert result["author"] == "Test Channel"
-        assert result["author_id"] == "UC123"
-        assert result["length_seconds"] == 300
-        assert result["view_count"] == 1000
-        assert result["published"] == 1640000000
+        assert result.video_id == "abc123"
+        assert result.title == "Test Video"
+        assert result.author == "Test Channel"
+        assert result.author_id == "UC123"
+        assert result.length_seconds == 300
+        assert result.view_count == 1000
+        assert result.published == 1640000000
 
     def test_handles_missing_channel(self):
         """Test handling of missing channel field."""
@@ -145,8 +176,8 @@ class TestProcessYtdlpVideo:
 
         result = _process_ytdlp_video(video_data, "channel123")
 
-        assert result["author"] == "Uploader Name"
-        assert result["author_id"] == "uploader123"
+        assert result.author == "Uploader Name"
+        assert result.author_id == "uploader123"
 
 
 class TestGetAllThumbnails:
@@ -165,12 +196,29 @@ class TestGetAllThumbnails:
         assert best_url == "https://example.com/maxres.jpg"
         assert len(all_thumbs) == 3
 
+    def test_keeps_first_on_quality_tie(self):
+        """Test the first thumbnail wins when several share the best quality."""
+        thumbnails = [
+            {"url": "https://example.com/a.jpg", "quality": "medium"},
+            {"url": "https://example.com/b.jpg", "quality": "maxresdefault"},
+            {"url": "https://example.com/c.jpg", "quality": "maxres"},
+        ]
+
+        best_url, all_thumbs = _get_all_thumbnails(thumbnails)
+
+        assert best_url == "https://example.com/b.jpg"
+        assert all_thumbs is thumbnails
+
     def test_returns_empty_for_empty_list(self):
         """Test returns empty for empty thumbnail list."""
         best_url, all_thumbs = _get_all_thumbnails([])
         assert best_url == ""
         assert all_thumbs == []
 
+    def test_returns_empty_for_none(self):
+        """Test a null thumbnail list from Invidious is treated as empty."""
+        assert _get_all_thumbnails(None) == ("", [])
+
 
 class TestGetAllYtdlpThumbnails:
     """Tests for _get_all_ytdlp_thumbnails function."""
@@ -191,6 +239,27 @@ class TestGetAllYtdlpThumbnails:
         qualities = {t["quality"] for t in all_thumbs}
         assert "maxres" in qualities or "sddefault" in qualities
 
+    def test_quality_boundaries(self):
+        """Test each width threshold maps to the next quality up."""
+        widths = [None, 319, 320, 479, 480, 639, 640, 1279, 1280]
+        info = {"thumbnails": [{"url": f"https://example.com/{w}.jpg", "width": w} for w in widths]}
+
+        best_url, all_thumbs = _get_all_ytdlp_thumbnails(info)
+
+        assert [t["quality"] for t in all_thumbs] == [
+            "default",
+            "default",
+            "medium",
+            "medium",
+            "high",
+            "high",
+            "sddefault",
+            "sddefault",
+            "maxres",
+        ]
+        assert all_thumbs[0]["width"] is None
+        assert best_url == "https://example.com/1280.jpg"
+
     def test_fallback_to_thumbnail_field(self):
         """Test fallback to single thumbnail field."""
         info = {"thumbnail": "https://example.com/thumb.jpg"}
@@ -223,6 +292,15 @@ class TestParseTimestamp:
         assert result is not None
         assert isinstance(result, int)
 
+    def test_yyyymmdd_is_utc_midnight(self):
+        """Test YYYYMMDD dates resolve to midnight UTC."""
+        assert _parse_timestamp("20211220") == 1639958400
+
+    def test_returns_none_for_invalid_yyyymmdd(self):
+        """Test out-of-range month or day is rejected."""
+        assert _parse_timestamp("20211320") is None
+        assert _parse_timestamp("20210230") is None
+
     def test_parses_iso_format(self):
         """Test parsing ISO format date string."""
         result = _parse_timestamp("2021-12-20T12:00:00Z")
@@ -237,6 +315,17 @@ class TestParseTimestamp:
         """Test returns None for invalid input."""
         assert _parse_timestamp("invalid") is None
 
+    def test_caches_string_parses(self):
+        """Test repeated date strings are served from the cache."""
+        from feed_fetcher import _parse_timestamp_str
+
+        _parse_timestamp_str.cache_clear()
+        first = _parse_timestamp("20211221")
+        second = _parse_timestamp("20211221")
+
+        assert first == second
+        assert _parse_timestamp_str.cache_info().hits == 1
+
 
 class TestFetchChannelMetadataInvidious:
     """Tests for _fetch_channel_metadata_invidious function."""
@@ -260,6 +349,16 @@ class TestFetchChannelMetadataInvidious:
             result = await _fetch_channel_metadata_invidious("UC123")
             assert result is None
 
+    @pytest.mark.asyncio
+    async def test_returns_none_on_proxy_error(self):
+        """Test returns None when the Invidious request itself fails."""
+        from invidious_proxy import InvidiousProxyError
+
+        with patch("feed_fetcher.invidious_proxy.get_channel", new_callable=AsyncMock) as mock_get:
+            mock_get.side_effect = InvidiousProxyError("HTTP 500")
+            result = await _fetch_channel_metadata_invidious("UC123")
+            assert result is None
+
 
 class TestFetchChannelMetadataYtdlp:
     """Tests for _fetch_channel_metadata_ytdlp function."""
@@ -409,6 +508,16 @@ class TestFetchFromInvidious:
             assert fallback_reason == "invidious_error_connection"
 
 
+def _ytdlp_stream(output: str):
+    """Build a run_ytdlp_stream replacement yielding output line by line as bytes."""
+
+    async def fake_stream(*args, **kwargs):
+        for line in output.splitlines(keepends=True):
+            yield line.encode()
+
+    return fake_stream
+
+
 class TestFetchFromYtdlp:
     """Tests for _fetch_from_ytdlp function."""
 
@@ -417,25 +526,52 @@ class TestFetchFromYtdlp:
         """Test returns videos from yt-dlp output."""
         ytdlp_output = '{"id": "abc123", "title": "Test", "channel": "Test Channel", "duration": 300}\n'
 
-        with patch("feed_fetcher.run_ytdlp", new_callable=AsyncMock) as mock_run:
-            mock_run.return_value = ytdlp_output
-
+        with patch("feed_fetcher.run_ytdlp_stream", side_effect=_ytdlp_stream(ytdlp_output)):
             videos, metadata = await _fetch_from_ytdlp("UC123", "youtube", "https://youtube.com/@test", 30, False)
 
             assert len(videos) == 1
-            assert videos[0]["video_id"] == "abc123"
+            assert videos[0].video_id == "abc123"
 
     @pytest.mark.asyncio
     async def test_uses_flat_playlist_when_enabled(self):
         """Test uses --flat-playlist flag when enabled."""
-        with patch("feed_fetcher.run_ytdlp", new_callable=AsyncMock) as mock_run:
-            mock_run.return_value = ""
-
+        with patch("feed_fetcher.run_ytdlp_stream", side_effect=_ytdlp_stream("")) as mock_run:
             await _fetch_from_ytdlp("UC123", "youtube", "https://youtube.com/@test", 30, True)
 
             call_args = mock_run.call_args[0]
             assert "--flat-playlist" in call_args
 
+    @pytest.mark.asyncio
+    async def test_takes_metadata_from_first_line(self):
+        """Test parses each JSON line and takes metadata from the first."""
+        ytdlp_output = (
+            '{"id": "a", "channel_follower_count": 10, "channel_is_verified": true}\n'
+            '{"id": "b", "channel_follower_count": 99}\n'
+        )
+
+        with patch("feed_fetcher.run_ytdlp_stream", side_effect=_ytdlp_stream(ytdlp_output)):
+            videos, metadata = await _fetch_from_ytdlp("UC123", "youtube", "https://youtube.com/@test", 30, True)
+
+        assert [v.video_id for v in videos] == ["a", "b"]
+        assert metadata == {"subscriber_count": 10, "is_verified": True}
+
+    @pytest.mark.asyncio
+    async def test_skips_invalid_lines(self):
+        """Test skips blank and malformed lines."""
+        with patch("feed_fetcher.run_ytdlp_stream", side_effect=_ytdlp_stream('not json\n\n{"id": "a"}\n')):
+            videos, metadata = await _fetch_from_ytdlp("UC123", "youtube", "https://youtube.com/@test", 30, True)
+
+        assert len(videos) == 1
+        assert videos[0].video_id == "a"
+
+    @pytest.mark.asyncio
+    async def test_empty_output(self):
+        """Test empty output returns no videos and no metadata."""
+        with patch("feed_fetcher.run_ytdlp_stream", side_effect=_ytdlp_stream("")):
+            result = await _fetch_from_ytdlp("UC123", "youtube", "https://youtube.com/@test", 30, True)
+
+        assert result == ([], None)
+
 
 class TestFetchChannelFeed:
     """Tests for fetch_channel_feed function."""
@@ -466,16 +602,53 @@ class TestFetchChannelFeed:
             patch("feed_fetcher.get_settings") as mock_settings,
             patch("feed_fetcher.invidious_proxy.is_enabled", return_value=True),
             patch("feed_fetcher._fetch_from_invidious", new_callable=AsyncMock) as mock_invidious,
+            patch("feed_fetcher._fetch_channel_metadata_invidious", new_callable=AsyncMock) as mock_meta,
             patch("feed_fetcher._fetch_from_ytdlp", new_callable=AsyncMock) as mock_ytdlp,
         ):
             mock_settings.return_value.feed_max_videos = 30
             mock_settings.return_value.feed_ytdlp_use_flat_playlist = True
             mock_invidious.return_value = (None, None, True, "invidious_error_500")  # Should fallback
-            mock_ytdlp.return_value = ([{"video_id": "abc123"}], None)
+            mock_meta.return_value = {"subscriber_count": 1000, "is_verified": True}
+            mock_ytdlp.return_value = ([{"video_id": "abc123"}], {"subscriber_count": None, "is_verified": False})
 
             videos, pagination_info, metadata = await fetch_channel_feed("UC123", "youtube", "https://youtube.com/@test")
 
             mock_ytdlp.assert_called_once()
+            # Invidious metadata fetched alongside the videos is kept after falling back
+            assert metadata == {"subscriber_count": 1000, "is_verified": True}
+
+    @pytest.mark.asyncio
+    async def test_fetches_invidious_metadata_concurrently(self):
+        """Test Invidious videos and channel metadata requests overlap."""
+        both_started = asyncio.Event()
+        started = 0
+
+        async def mark_started():
+            nonlocal started
+            started += 1
+            if started == 2:
+                both_started.set()
+            await asyncio.wait_for(both_started.wait(), timeout=1)
+
+        async def fake_videos(channel_id, max_videos):
+            await mark_started()
+            return [{"video_id": "abc123"}], {"total_fetched": 1}, False, None
+
+        async def fake_meta(channel_id):
+            await mark_started()
+            return {"subscriber_count": 5}
+
+        with (
+            patch("feed_fetcher.get_settings") as mock_settings,
+            patch("feed_fetcher.invidious_proxy.is_enabled", return_value=True),
+            patch("feed_fetcher._fetch_from_invidious", side_effect=fake_videos),
+            patch("feed_fetcher._fetch_channel_metadata_invidious", side_effect=fake_meta),
+        ):
+            mock_settings.return_value.feed_max_videos = 30
+
+            videos, pagination_info, metadata = await fetch_channel_feed("UC123", "youtube", "")
+
+        assert metadata == {"subscriber_count": 5}
 
     @pytest.mark.asyncio
     async def test_uses_ytdlp_for_non_youtube(self):
@@ -492,3 +665,239 @@ class TestFetchChannelFeed:
             videos, pagination_info, metadata = await fetch_channel_feed("channel123", "dailymotion", "https://dailymotion.com/channel123")
 
             mock_ytdlp.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_site_dispatch_is_case_insensitive(self):
+        """Test a mixed-case YouTube site still goes through the Invidious fetcher."""
+        with (
+            patch("feed_fetcher.get_settings") as mock_settings,
+            patch("feed_fetcher.invidious_proxy.is_enabled", return_value=True),
+            patch("feed_fetcher._fetch_from_invidious", new_callable=AsyncMock) as mock_invidious,
+            patch("feed_fetcher._fetch_channel_metadata_invidious", new_callable=AsyncMock, return_value=None),
+            patch("feed_fetcher._fetch_from_ytdlp", new_callable=AsyncMock) as mock_ytdlp,
+        ):
+            mock_settings.return_value.feed_max_videos = 30
+            mock_invidious.return_value = ([{"video_id": "abc123"}], None, False, None)
+
+            videos, _, _ = await fetch_channel_feed("UCtest", "YouTube", None)
+
+        assert videos == [{"video_id": "abc123"}]
+        mock_ytdlp.assert_not_called()
+
+
+class TestStoreChannelResults:
+    """Tests for _store_channel_results function."""
+
+    def test_failed_batch_is_retried_per_channel(self, test_db):
+        """Test one channel failing to store only fails that channel and records its error."""
+        import sqlite3
+
+        import database
+
+        database.upsert_watched_channels([{"channel_id": f"chan{i}", "site": "dailymotion"} for i in range(3)])
+        results = [({"channel_id": f"chan{i}", "site": "dailymotion"}, ["video"], None, None, None) for i in range(3)]
+
+        def fake_commit(channel_id, site, videos, pagination_info, channel_metadata, conn):
+            if channel_id == "chan1":
+                raise sqlite3.OperationalError("disk I/O error")
+            database.update_fetch_status(channel_id, site, success=True, conn=conn)
+
+        with patch("feed_fetcher._commit_channel_results", side_effect=fake_commit):
+            outcomes = _store_channel_results(results, set())
+
+        assert [succeeded for succeeded, _, _ in outcomes] == [True, False, True]
+        statuses = {r["channel_id"]: r for r in database.get_watched_channels_with_status()}
+        assert statuses["chan0"]["last_fetch"] is not None
+        assert statuses["chan0"]["fetch_error"] is None
+        assert statuses["chan1"]["fetch_error"] == "Failed to store results: disk I/O error"
+        assert statuses["chan2"]["fetch_error"] is None
+
+    def test_non_sqlite_error_only_fails_its_channel(self, test_db):
+        """Test a malformed result raising a non-sqlite error fails only that channel."""
+        import database
+
+        database.upsert_watched_channels([{"channel_id": f"chan{i}", "site": "dailymotion"} for i in range(3)])
+        results = [({"channel_id": f"chan{i}", "site": "dailymotion"}, ["video"], None, None, None) for i in range(3)]
+
+        def fake_commit(channel_id, site, videos, pagination_info, channel_metadata, conn):
+            if channel_id == "chan1":
+                raise TypeError("'NoneType' object is not subscriptable")
+            database.update_fetch_status(channel_id, site, success=True, conn=conn)
+
+        with patch("feed_fetcher._commit_channel_results", side_effect=fake_commit):
+            outcomes = _store_channel_results(results, set())
+
+        assert [succeeded for succeeded, _, _ in outcomes] == [True, False, True]
+        statuses = {r["channel_id"]: r for r in database.get_watched_channels_with_status()}
+        assert statuses["chan0"]["fetch_error"] is None
+        assert statuses["chan1"]["fetch_error"].startswith("Failed to store results: ")
+        assert statuses["chan2"]["fetch_error"] is None
+
+
+class TestFetchAllChannels:
+    """Tests for fetch_all_channels function."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, test_db):
+        """Register a few watched channels."""
+        import database
+
+        database.upsert_watched_channels(
+            [{"channel_id": f"chan{i}", "site": "dailymotion", "channel_url": f"https://dm.com/{i}"} for i in range(6)]
+        )
+
+    @pytest.mark.asyncio
+    async def test_fetches_concurrently_within_limit(self):
+        """Test channels are fetched in parallel but never beyond the configured limit."""
+        import database
+
+        in_flight = 0
+        peak = 0
+
+        async def fake_fetch(channel_id, site, channel_url):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if channel_id == "chan3":
+                raise ValueError("boom")
+            return [{"video_id": f"{channel_id}-v", "title": "t"}], None, None
+
+        with (
+            patch("feed_fetcher.get_settings") as mock_settings,
+            patch("feed_fetcher.fetch_channel_feed", side_effect=fake_fetch),
+        ):
+            mock_settings.return_value.feed_max_concurrent_channels = 2
+            mock_settings.return_value.feed_channel_delay = 0
+            mock_settings.return_value.feed_fallback_ytdlp_on_414 = False
+
+            await fetch_all_channels()
+
+        assert peak == 2
+        statuses = {r["channel_id"]: r for r in database.get_watched_channels_with_status()}
+        assert statuses["chan3"]["fetch_error"] == "boom"
+        assert statuses["chan0"]["fetch_error"] is None
+
+    @pytest.mark.asyncio
+    async def test_counts_ytdlp_fallback_after_previous_414(self, caplog):
+        """Test a YouTube channel whose last fetch hit a 414 is reported as using the yt-dlp fallback."""
+        import logging
+
+        import database
+
+        database.upsert_watched_channels([{"channel_id": "UCyt", "site": "youtube", "channel_url": None}])
+        database.update_fetch_status("UCyt", "youtube", pagination_limited=True, pagination_limit_reason="414_error")
+
+        async def fake_fetch(channel_id, site, channel_url):
+            return [{"video_id": f"{channel_id}-v"}], None, None
+
+        with (
+            patch("feed_fetcher.get_settings") as mock_settings,
+            patch("feed_fetcher.fetch_channel_feed", side_effect=fake_fetch),
+            patch("feed_fetcher.avatar_cache.get_cache"),
+            caplog.at_level(logging.INFO, logger="feed_fetcher"),
+        ):
+            mock_settings.return_value.feed_max_concurrent_channels = 4
+            mock_settings.return_value.feed_channel_delay = 0
+            mock_settings.return_value.feed_fallback_ytdlp_on_414 = True
+
+            await fetch_all_channels()
+
+        assert "7 succeeded, 0 failed" in caplog.text
+        assert "(0 total with 414 errors), 1 used yt-dlp fallback" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_schedules_avatars_and_writes_every_batch(self):
+        """Test avatars are scheduled for fetched YouTube channels and all batches are written before returning."""
+        import database
+
+        database.upsert_watched_channels(
+            [
+                {"channel_id": "UCok", "site": "youtube", "channel_url": None},
+                {"channel_id": "UCempty", "site": "youtube", "channel_url": None},
+            ]
+        )
+
+        async def fake_fetch(channel_id, site, channel_url):
+            if channel_id == "UCempty":
+                return [], None, None
+            return [{"video_id": f"{channel_id}-v", "title": "t"}], None, None
+
+        with (
+            patch("feed_fetcher.get_settings") as mock_settings,
+            patch("feed_fetcher.fetch_channel_feed", side_effect=fake_fetch),
+            patch("feed_fetcher.avatar_cache.get_cache") as mock_cache,
+            patch("feed_fetcher._FEED_WRITE_BATCH_SIZE", 3),
+        ):
+            mock_settings.return_value.feed_max_concurrent_channels = 4
+            mock_settings.return_value.feed_channel_delay = 0
+            mock_settings.return_value.feed_fallback_ytdlp_on_414 = False
+
+            await fetch_all_channels()
+
+        mock_cache.return_value.schedule_background_fetch.assert_called_once_with("UCok")
+        statuses = database.get_watched_channels_with_status()
+        assert len(statuses) == 8
+        assert all(r["last_fetch"] is not None for r in statuses)
+
+    @pytest.mark.asyncio
+    async def test_cancelling_stops_remaining_fetches(self):
+        """Test cancelling the cycle cancels channel fetches that are queued or still running."""
+        started = []
+        finished = []
+
+        async def fake_fetch(channel_id, site, channel_url):
+            started.append(channel_id)
+            await asyncio.sleep(10)
+            finished.append(channel_id)
+            return [], None, None
+
+        with (
+            patch("feed_fetcher.get_settings") as mock_settings,
+            patch("feed_fetcher.fetch_channel_feed", side_effect=fake_fetch),
+        ):
+            mock_settings.return_value.feed_max_concurrent_channels = 2
+            mock_settings.return_value.feed_channel_delay = 0
+            mock_settings.return_value.feed_fallback_ytdlp_on_414 = False
+
+            cycle = asyncio.create_task(fetch_all_channels())
+            while len(started) < 2:
+                await asyncio.sleep(0)
+            cycle.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await cycle
+
+            await asyncio.sleep(0.05)
+
+        assert len(started) == 2
+        assert finished == []
+        assert all(t.done() for t in asyncio.all_tasks() if t is not asyncio.current_task())
+
+
+class TestFeedFetchLoop:
+    """Tests for feed_fetch_loop function."""
+
+    @pytest.mark.asyncio
+    async def test_sleeps_for_interval_changed_during_cycle(self):
+        """Test the wait after a cycle uses the interval as it is when the cycle ends."""
+        from unittest.mock import MagicMock
+
+        before = MagicMock(feed_fetch_interval=1800, feed_video_max_age=30)
+        after = MagicMock(feed_fetch_interval=600, feed_video_max_age=30)
+        sleeps = []
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+            raise asyncio.CancelledError
+
+        with (
+            patch("feed_fetcher.get_settings", side_effect=[before, after]),
+            patch("feed_fetcher.fetch_all_channels", new_callable=AsyncMock),
+            patch("feed_fetcher.database"),
+            patch("feed_fetcher.asyncio.sleep", side_effect=fake_sleep),
+        ):
+            with pytest.raises(asyncio.CancelledError):
+                await feed_fetch_loop()
+
+        assert sleeps == [600]
@@ -18,6 +18,7 @@ from invidious_proxy import (
     get_channel_thumbnails,
     get_channel_videos,
     get_channel_videos_multi_page,
+    get_client,
     get_search_suggestions,
     get_trending,
     is_enabled,
@@ -74,6 +75,135 @@ class TestGetBaseUrl:
             mock_settings.return_value.invidious_instance = None
             assert get_base_url() == ""
 
+    def test_follows_instance_change(self):
+        """Test get_base_url reflects a changed instance despite caching."""
+        with patch("invidious_proxy.get_settings") as mock_settings:
+            mock_settings.return_value.invidious_instance = "https://one.example.com/"
+            assert get_base_url() == "https://one.example.com"
+            mock_settings.return_value.invidious_instance = "https://two.example.com/"
+            assert get_base_url() == "https://two.example.com"
+
+
+class TestQuoteId:
+    """Tests for _quote_id function."""
+
+    @pytest.mark.parametrize("value", ["dQw4w9WgXcQ", "UC_x5XG1OV2P6uZZ5FSM9Ttw", "@handle", "a b/c", "caf\u00e9", ""])
+    def test_matches_urllib_quote(self, value):
+        """Test the fast path gives the same result as urllib.parse.quote."""
+        import urllib.parse
+
+        from invidious_proxy import _quote_id
+
+        assert _quote_id(value) == urllib.parse.quote(value)
+
+
+class TestGetClient:
+    """Tests for get_client function."""
+
+    @pytest.fixture(autouse=True)
+    def reset_client(self):
+        """Start and end each test without a shared client."""
+        import invidious_proxy
+
+        invidious_proxy._client = None
+        invidious_proxy._client_config = None
+        yield
+        invidious_proxy._client = None
+        invidious_proxy._client_config = None
+
+    def _settings(self, mock_settings, max_connections=200):
+        mock_settings.return_value.invidious_timeout = 10
+        mock_settings.return_value.invidious_max_connections = max_connections
+        mock_settings.return_value.invidious_max_keepalive = 100
+        mock_settings.return_value.invidious_keepalive_expiry = 30.0
+
+    @pytest.mark.asyncio
+    async def test_reuses_client_and_applies_pool_limits(self):
+        """Test the client is shared and built with the configured pool limits."""
+        with patch("invidious_proxy.get_settings") as mock_settings, patch("httpx.AsyncClient") as mock_client_cls:
+            self._settings(mock_settings)
+            mock_client_cls.return_value.is_closed = False
+
+            first = await get_client()
+            second = await get_client()
+
+        assert first is second
+        mock_client_cls.assert_called_once()
+        limits = mock_client_cls.call_args.kwargs["limits"]
+        assert limits.max_connections == 200
+        assert limits.max_keepalive_connections == 100
+        assert limits.keepalive_expiry == 30.0
+
+    @pytest.mark.asyncio
+    async def test_http2_follows_h2_availability(self):
+        """Test HTTP/2 is only requested when the h2 package is installed."""
+        import invidious_proxy
+
+        for available in (True, False):
+            invidious_proxy._client = None
+            with (
+                patch("invidious_proxy.get_settings") as mock_settings,
+                patch("httpx.AsyncClient") as mock_client_cls,
+                patch("invidious_proxy._HTTP2_AVAILABLE", available),
+            ):
+                self._settings(mock_settings)
+                await get_client()
+
+            assert mock_client_cls.call_args.kwargs["http2"] is available
+
+    @pytest.mark.asyncio
+    async def test_recreates_client_when_pool_settings_change(self):
+        """Test changing a pool limit closes the old client and builds a new one."""
+        with patch("invidious_proxy.get_settings") as mock_settings, patch("httpx.AsyncClient") as mock_client_cls:
+            self._settings(mock_settings)
+            old_client = MagicMock(is_closed=False, aclose=AsyncMock())
+            new_client = MagicMock(is_closed=False)
+            mock_client_cls.side_effect = [old_client, new_client]
+
+            await get_client()
+            self._settings(mock_settings, max_connections=500)
+            client = await get_client()
+
+        assert client is new_client
+        old_client.aclose.assert_awaited_once()
+        assert mock_client_cls.call_args.kwargs["limits"].max_connections == 500
+
+    @pytest.mark.asyncio
+    async def test_concurrent_first_calls_create_one_client(self):
+        """Test concurrent first requests share a single client."""
+        import asyncio
+
+        with patch("invidious_proxy.get_settings") as mock_settings, patch("httpx.AsyncClient") as mock_client_cls:
+            self._settings(mock_settings)
+            mock_client_cls.return_value.is_closed = False
+
+            clients = await asyncio.gather(*(get_client() for _ in range(5)))
+
+        assert all(c is clients[0] for c in clients)
+        mock_client_cls.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_warm_up_and_close(self):
+        """Test warm-up connects to the instance, tolerates failures, and close_client closes the client."""
+        from invidious_proxy import close_client, warm_up_client
+
+        with (
+            patch("invidious_proxy.get_settings") as mock_settings,
+            patch("httpx.AsyncClient") as mock_client_cls,
+            patch("invidious_proxy.is_enabled", return_value=True),
+            patch("invidious_proxy.get_base_url", return_value="https://inv.example.com"),
+        ):
+            self._settings(mock_settings)
+            client = MagicMock(is_closed=False, aclose=AsyncMock())
+            client.head = AsyncMock(side_effect=httpx.ConnectError("down"))
+            mock_client_cls.return_value = client
+
+            await warm_up_client()
+            await close_client()
+
+        client.head.assert_awaited_once_with("https://inv.example.com", timeout=2.0)
+        client.aclose.assert_awaited_once()
+
 
 class TestFetchJson:
     """Tests for fetch_json function."""
@@ -89,7 +219,7 @@ class TestFetchJson:
     async def test_returns_json_on_success(self):
         """Test fetch_json returns parsed JSON on success."""
         mock_response = MagicMock()
-        mock_response.json.return_value = {"test": "data"}
+        mock_response.content = b'{"test": "data"}'
         mock_response.status_code = 200
         mock_response.raise_for_status = MagicMock()
 
@@ -105,6 +235,92 @@ class TestFetchJson:
             assert result == {"test": "data"}
             mock_client.get.assert_called_once_with("https://inv.example.com/api/v1/test")
 
+    @pytest.mark.asyncio
+    async def test_coalesces_concurrent_requests_for_same_endpoint(self):
+        """Test concurrent calls for one endpoint share a single upstream request."""
+        import asyncio
+
+        calls = []
+
+        async def fake_fetch(endpoint):
+            calls.append(endpoint)
+            await asyncio.sleep(0.01)
+            return {"endpoint": endpoint}
+
+        with (
+            patch("invidious_proxy.is_enabled", return_value=True),
+            patch("invidious_proxy.get_base_url", return_value="https://inv.example.com"),
+            patch("invidious_proxy._fetch_json", side_effect=fake_fetch),
+        ):
+            first, second, other = await asyncio.gather(
+                fetch_json("/api/v1/a"), fetch_json("/api/v1/a"), fetch_json("/api/v1/b")
+            )
+            # Once finished, the next call goes upstream again
+            await fetch_json("/api/v1/a")
+
+        assert first == second == {"endpoint": "/api/v1/a"}
+        assert other == {"endpoint": "/api/v1/b"}
+        assert calls == ["/api/v1/a", "/api/v1/b", "/api/v1/a"]
+
+    @pytest.mark.asyncio
+    async def test_does_not_coalesce_across_instances(self):
+        """Test a call after the instance URL changes doesn't join a request to the old instance."""
+        import asyncio
+
+        base = "https://old.example.com"
+        calls = []
+
+        async def fake_fetch(endpoint):
+            calls.append(base)
+            await asyncio.sleep(0.01)
+            return {"base": base}
+
+        with (
+            patch("invidious_proxy.is_enabled", return_value=True),
+            patch("invidious_proxy.get_base_url", side_effect=lambda: base),
+            patch("invidious_proxy._fetch_json", side_effect=fake_fetch),
+        ):
+            old_call = asyncio.ensure_future(fetch_json("/api/v1/search?q=x"))
+            while not calls:
+                await asyncio.sleep(0)
+            base = "https://new.example.com"
+            new_result = await fetch_json("/api/v1/search?q=x")
+            await old_call
+
+        assert calls == ["https://old.example.com", "https://new.example.com"]
+        assert new_result == {"base": "https://new.example.com"}
+
+    @pytest.mark.asyncio
+    async def test_caches_cacheable_endpoints_only(self):
+        """Test cacheable endpoints are served from cache while search is always fetched."""
+        mock_response = MagicMock()
+        mock_response.content = b'{"test": "data"}'
+        mock_response.status_code = 200
+        mock_response.raise_for_status = MagicMock()
+
+        mock_client = AsyncMock()
+        mock_client.get = AsyncMock(return_value=mock_response)
+
+        with (
+            patch("invidious_proxy.is_enabled", return_value=True),
+            patch("invidious_proxy.get_client", return_value=mock_client),
+            patch("invidious_proxy.get_base_url", return_value="https://inv.example.com"),
+            patch("invidious_proxy.get_settings") as mock_settings,
+        ):
+            mock_settings.return_value.invidious_max_retries = 0
+            mock_settings.return_value.invidious_retry_delay = 0
+            mock_settings.return_value.invidious_requests_per_second = 1000.0
+            await fetch_json("/api/v1/channels/UC123")
+            assert await fetch_json("/api/v1/channels/UC123") == {"test": "data"}
+            await fetch_json("/api/v1/search?q=a")
+            await fetch_json("/api/v1/search?q=a")
+
+        assert [c.args[0] for c in mock_client.get.call_args_list] == [
+            "https://inv.example.com/api/v1/channels/UC123",
+            "https://inv.example.com/api/v1/search?q=a",
+            "https://inv.example.com/api/v1/search?q=a",
+        ]
+
     @pytest.mark.asyncio
     async def test_raises_error_on_non_retryable_http_error(self):
         """Test fetch_json raises InvidiousProxyError immediately on non-retryable HTTP error."""
@@ -144,6 +360,9 @@ class TestFetchJson:
         mock_settings = MagicMock()
         mock_settings.invidious_max_retries = 2
         mock_settings.invidious_retry_delay = 0.01  # Fast for testing
+        mock_settings.invidious_requests_per_second = 1000.0
+        mock_settings.invidious_breaker_threshold = 10
+        mock_settings.invidious_breaker_cooldown = 30.0
 
         with (
             patch("invidious_proxy.is_enabled", return_value=True),
@@ -166,7 +385,7 @@ class TestFetchJson:
         mock_response_error.text = "Internal Server Error"
 
         mock_response_success = MagicMock()
-        mock_response_success.json.return_value = {"test": "data"}
+        mock_response_success.content = b'{"test": "data"}'
         mock_response_success.status_code = 200
         mock_response_success.raise_for_status = MagicMock()
 
@@ -184,6 +403,9 @@ class TestFetchJson:
         mock_settings = MagicMock()
         mock_settings.invidious_max_retries = 3
         mock_settings.invidious_retry_delay = 0.01
+        mock_settings.invidious_requests_per_second = 1000.0
+        mock_settings.invidious_breaker_threshold = 10
+        mock_settings.invidious_breaker_cooldown = 30.0
 
         with (
             patch("invidious_proxy.is_enabled", return_value=True),
@@ -195,6 +417,33 @@ class TestFetchJson:
             assert result == {"test": "data"}
             assert call_count == 2  # Failed once, succeeded on retry
 
+    @pytest.mark.asyncio
+    async def test_retry_delays_are_jittered_and_capped(self):
+        """Test each retry sleeps a random delay up to the capped exponential backoff."""
+        mock_client = AsyncMock()
+        mock_client.get = AsyncMock(side_effect=httpx.RequestError("Connection failed"))
+
+        mock_settings = MagicMock()
+        mock_settings.invidious_max_retries = 4
+        mock_settings.invidious_retry_delay = 20.0
+        mock_settings.invidious_requests_per_second = 1000.0
+        mock_settings.invidious_breaker_threshold = 10
+        mock_settings.invidious_breaker_cooldown = 30.0
+
+        with (
+            patch("invidious_proxy.is_enabled", return_value=True),
+            patch("invidious_proxy.get_client", return_value=mock_client),
+            patch("invidious_proxy.get_base_url", return_value="https://inv.example.com"),
+            patch("invidious_proxy.get_settings", return_value=mock_settings),
+            patch("invidious_proxy.random.uniform", side_effect=lambda low, high: high) as mock_uniform,
+            patch("invidious_proxy.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        ):
+            with pytest.raises(InvidiousProxyError):
+                await fetch_json("/api/v1/test")
+
+        assert [c.args for c in mock_uniform.call_args_list] == [(0, 20.0), (0, 30.0), (0, 30.0), (0, 30.0)]
+        assert mock_sleep.await_count == 4
+
     @pytest.mark.asyncio
     async def test_raises_error_on_request_error(self):
         """Test fetch_json raises InvidiousProxyError on request error after retries."""
@@ -204,6 +453,9 @@ class TestFetchJson:
         mock_settings = MagicMock()
         mock_settings.invidious_max_retries = 2
         mock_settings.invidious_retry_delay = 0.01
+        mock_settings.invidious_requests_per_second = 1000.0
+        mock_settings.invidious_breaker_threshold = 10
+        mock_settings.invidious_breaker_cooldown = 30.0
 
         with (
             patch("invidious_proxy.is_enabled", return_value=True),
@@ -219,6 +471,124 @@ class TestFetchJson:
             assert mock_client.get.call_count == 3
 
 
+class TestRequestGuards:
+    """Tests for the fetch_json rate limiter and circuit breaker."""
+
+    def _settings(self, threshold=3, rps=1000.0):
+        mock_settings = MagicMock()
+        mock_settings.invidious_max_retries = 1
+        mock_settings.invidious_retry_delay = 0.01
+        mock_settings.invidious_requests_per_second = rps
+        mock_settings.invidious_breaker_threshold = threshold
+        mock_settings.invidious_breaker_cooldown = 30.0
+        return mock_settings
+
+    @pytest.mark.asyncio
+    async def test_breaker_opens_and_fails_fast(self):
+        """Test repeated transient failures stop further upstream requests."""
+        mock_client = AsyncMock()
+        mock_client.get = AsyncMock(side_effect=httpx.ConnectError("down"))
+
+        with (
+            patch("invidious_proxy.is_enabled", return_value=True),
+            patch("invidious_proxy.get_client", return_value=mock_client),
+            patch("invidious_proxy.get_base_url", return_value="https://inv.example.com"),
+            patch("invidious_proxy.get_settings", return_value=self._settings(threshold=3)),
+        ):
+            with pytest.raises(InvidiousProxyError):
+                await fetch_json("/api/v1/a")
+            with pytest.raises(InvidiousProxyError) as exc_info:
+                await fetch_json("/api/v1/b")
+
+        # Two attempts for /a, then the third failure on /b opens the breaker before its retry
+        assert mock_client.get.call_count == 3
+        assert exc_info.value.status_code == 503
+        assert "circuit breaker" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_success_resets_failure_count(self):
+        """Test a successful response clears earlier failures."""
+        ok = MagicMock(content=b"{}", status_code=200, raise_for_status=MagicMock())
+        mock_client = AsyncMock()
+        mock_client.get = AsyncMock(side_effect=[httpx.ConnectError("down"), ok, httpx.ConnectError("down"), ok])
+
+        with (
+            patch("invidious_proxy.is_enabled", return_value=True),
+            patch("invidious_proxy.get_client", return_value=mock_client),
+            patch("invidious_proxy.get_base_url", return_value="https://inv.example.com"),
+            patch("invidious_proxy.get_settings", return_value=self._settings(threshold=2)),
+        ):
+            assert await fetch_json("/api/v1/search?q=a") == {}
+            assert await fetch_json("/api/v1/search?q=b") == {}
+
+        assert mock_client.get.call_count == 4
+
+    @pytest.mark.asyncio
+    async def test_rate_limiter_waits_when_bucket_is_empty(self):
+        """Test requests beyond the per-second budget are delayed."""
+        from invidious_proxy import _RateLimiter
+
+        limiter = _RateLimiter()
+        with (
+            patch("invidious_proxy.time.monotonic", return_value=100.0),
+            patch("invidious_proxy.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        ):
+            for _ in range(4):
+                await limiter.acquire(2.0)
+
+        assert [c.args[0] for c in mock_sleep.await_args_list] == [0.5, 1.0]
+
+
+class TestStreamMediaResponse:
+    """Tests for streaming and caching proxied thumbnails/storyboards."""
+
+    BASE = "https://inv.example.com"
+
+    def _client(self, status_code=200, cache_control=None):
+        self.requests = []
+
+        def handler(request):
+            self.requests.append(str(request.url))
+            headers = {"content-type": "image/jpeg"}
+            if cache_control:
+                headers["cache-control"] = cache_control
+            return httpx.Response(status_code, content=b"jpeg-bytes", headers=headers)
+
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def _read(self, response):
+        return b"".join([chunk async for chunk in response.body_iterator])
+
+    @pytest.mark.asyncio
+    async def test_streams_body_and_caches_it(self):
+        """Test the body is streamed with upstream headers and cached once fully sent."""
+        from invidious_proxy import _cached_media_response, _stream_media_response
+
+        async with self._client() as client:
+            response = await _stream_media_response(client, self.BASE, "/vi/abc/hq.jpg", ("content-type",))
+            assert _cached_media_response("https://inv.example.com", "/vi/abc/hq.jpg") is None
+            assert await self._read(response) == b"jpeg-bytes"
+
+        assert response.headers["content-type"] == "image/jpeg"
+        assert response.headers["content-length"] == "10"
+        cached = _cached_media_response("https://inv.example.com", "/vi/abc/hq.jpg")
+        assert cached.body == b"jpeg-bytes"
+        assert _cached_media_response("https://other.example.com", "/vi/abc/hq.jpg") is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status_code,cache_control", [(404, None), (200, "no-store")])
+    async def test_skips_caching_errors_and_no_store(self, status_code, cache_control):
+        """Test error responses and no-store responses are streamed but not cached."""
+        from invidious_proxy import _cached_media_response, _stream_media_response
+
+        async with self._client(status_code, cache_control) as client:
+            response = await _stream_media_response(client, self.BASE, "/vi/a/hq.jpg", ("content-type",))
+            await self._read(response)
+
+        assert response.status_code == status_code
+        assert _cached_media_response("https://inv.example.com", "/vi/a/hq.jpg") is None
+
+
 class TestGetTrending:
     """Tests for get_trending function."""
 
@@ -295,6 +665,18 @@ class TestSearch:
             call_args = mock_fetch.call_args[0][0]
             assert "page=3" in call_args
 
+    @pytest.mark.asyncio
+    async def test_unlisted_type_and_region_are_quoted(self):
+        """Test values outside the endpoint tables can't inject extra query parameters."""
+        with patch("invidious_proxy.fetch_json", new_callable=AsyncMock, return_value=[]) as mock_fetch:
+            await search("a b", type="movie&x=1")
+            await get_trending(region="US&x=1")
+
+        assert [c.args[0] for c in mock_fetch.call_args_list] == [
+            "/api/v1/search?type=movie%26x%3D1&q=a%20b&page=1",
+            "/api/v1/trending?region=US%26x%3D1",
+        ]
+
 
 class TestGetChannel:
     """Tests for get_channel function."""
@@ -359,6 +741,40 @@ class TestGetChannelThumbnails:
             result = await get_channel_thumbnails("UC123")
             assert result == []
 
+    @pytest.mark.asyncio
+    async def test_uses_provided_channel_data(self):
+        """Test channel data passed by the caller is used without another request."""
+        channel_data = {"authorThumbnails": [{"url": "https://yt3.example.com/a.jpg", "quality": "default"}]}
+        with (
+            patch("invidious_proxy.is_enabled", return_value=True),
+            patch("invidious_proxy.get_channel", new_callable=AsyncMock) as mock_get,
+            patch("invidious_proxy.get_base_url", return_value="https://inv.example.com"),
+        ):
+            result = await get_channel_thumbnails("UC123", channel_data=channel_data)
+
+        mock_get.assert_not_called()
+        assert [t.url for t in result] == ["https://yt3.example.com/a.jpg"]
+
+    @pytest.mark.asyncio
+    async def test_resolves_relative_and_protocol_relative_urls(self):
+        """Test URLs resolve like resolve_invidious_url and serialize like validated models."""
+        channel_data = {
+            "authorThumbnails": [
+                {"url": "//yt3.ggpht.com/a.jpg", "width": 32, "height": 32, "quality": "default"},
+                {"url": "/ggpht/b.jpg", "width": 48, "height": 48},
+            ]
+        }
+        with (
+            patch("invidious_proxy.is_enabled", return_value=True),
+            patch("invidious_proxy.get_base_url", return_value="https://inv.example.com"),
+        ):
+            result = await get_channel_thumbnails("UC123", channel_data=channel_data)
+
+        assert [t.model_dump() for t in result] == [
+            {"quality": "default", "url": "https://yt3.ggpht.com/a.jpg", "width": 32, "height": 32},
+            {"quality": "default", "url": "https://inv.example.com/ggpht/b.jpg", "width": 48, "height": 48},
+        ]
+
 
 class TestGetChannelVideos:
     """Tests for get_channel_videos function."""
@@ -435,9 +851,9 @@ class TestGetChannelVideosMultiPage:
             if call_count == 1:
                 return {
                     "videos": [{"videoId": f"v{i}"} for i in range(30)],
-                    "continuation": "a" * 10000,  # Very long token
+                    "continuation": "a" * 5000,  # Long token
                 }
-            raise InvidiousProxyError("HTTP 414: URI Too Large")
+            raise InvidiousProxyError.from_http_status(414, "HTTP 414: URI Too Large")
 
         with patch("invidious_proxy.get_channel_videos", side_effect=mock_get_videos):
             result = await get_channel_videos_multi_page("UC123", max_videos=100)
@@ -445,6 +861,21 @@ class TestGetChannelVideosMultiPage:
             assert result["limit_reason"] == "414_error"
             assert len(result["videos"]) == 30
 
+    @pytest.mark.asyncio
+    async def test_stops_before_request_on_oversized_continuation(self):
+        """Test a continuation token too long for a request URI stops pagination without requesting it."""
+        with patch("invidious_proxy.get_channel_videos", new_callable=AsyncMock) as mock_get:
+            mock_get.return_value = {
+                "videos": [{"videoId": f"v{i}"} for i in range(30)],
+                "continuation": "a" * 10000,
+            }
+            result = await get_channel_videos_multi_page("UC123", max_videos=100)
+
+        mock_get.assert_called_once()
+        assert result["pagination_limited"] is True
+        assert result["limit_reason"] == "414_error"
+        assert result["pages_fetched"] == 1
+
     @pytest.mark.asyncio
     async def test_returns_empty_on_no_data(self):
         """Test returns empty when no data returned."""
@@ -499,3 +930,32 @@ class TestInvidiousProxyError:
         error = InvidiousProxyError.from_connection_error("Connection refused")
         assert error.status_code is None
         assert error.is_retryable is True
+
+
+class TestGetCaptions:
+    """Tests for the yt-dlp branch of get_captions."""
+
+    @pytest.mark.asyncio
+    async def test_serialized_captions_are_cached_per_user_and_base_url(self):
+        """Test repeat requests reuse the serialized body without another extraction."""
+        import json
+
+        from invidious_proxy import get_captions
+
+        info = {"subtitles": {"en": [{"ext": "vtt", "url": "https://example.com/en.vtt"}]}}
+        mock_settings = MagicMock(invidious_proxy_captions=False)
+
+        with (
+            patch("invidious_proxy._validate_resource_token", return_value=None),
+            patch("invidious_proxy.get_settings", return_value=mock_settings),
+            patch("ytdlp_wrapper.get_video_info", new_callable=AsyncMock, return_value=info) as mock_info,
+            patch("utils.get_base_url", side_effect=["http://a", "http://a", "http://b"]),
+        ):
+            first = await get_captions("dQw4w9WgXcQ", MagicMock())
+            second = await get_captions("dQw4w9WgXcQ", MagicMock())
+            other_host = await get_captions("dQw4w9WgXcQ", MagicMock())
+
+        assert first.body == second.body
+        assert json.loads(first.body)["captions"][0]["languageCode"] == "en"
+        assert json.loads(other_host.body)["captions"][0]["url"].startswith("http://b")
+        assert mock_info.await_count == 2
@@ -477,6 +477,15 @@ class TestIsIpSafeAllowedRanges:
         assert is_safe is False
         assert "loopback" in reason
 
+    def test_verdicts_are_memoized(self):
+        """Test repeated checks of the same IP reuse the cached verdict."""
+        from security import _is_ip_safe
+
+        _is_ip_safe.cache_clear()
+        first = _is_ip_safe("8.8.8.8")
+        assert _is_ip_safe("8.8.8.8") == first == (True, None)
+        assert _is_ip_safe.cache_info().hits == 1
+
 
 class TestIsSafeUrlStrict:
     """Tests for is_safe_url_strict function (strict SSRF prevention with DNS resolution)."""
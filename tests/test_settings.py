@@ -30,8 +30,15 @@ class TestSettingsModel:
         assert s.max_search_results == 50
         assert s.invidious_instance is None
         assert s.invidious_timeout == 10
+        assert s.invidious_max_connections == 200
+        assert s.invidious_max_keepalive == 100
+        assert s.invidious_keepalive_expiry == 30.0
+        assert s.invidious_requests_per_second == 50.0
+        assert s.invidious_breaker_threshold == 10
+        assert s.invidious_breaker_cooldown == 30.0
         assert s.feed_fetch_interval == 1800
         assert s.feed_channel_delay == 2
+        assert s.feed_max_concurrent_channels == 4
         assert s.feed_max_videos == 30
         assert s.feed_video_max_age == 30
         assert s.feed_ytdlp_use_flat_playlist is True
@@ -103,6 +110,12 @@ class TestSettingsModel:
         with pytest.raises(ValidationError):
             Settings(feed_channel_delay=0)
 
+        # feed_max_concurrent_channels: 1-16
+        assert Settings(feed_max_concurrent_channels=1).feed_max_concurrent_channels == 1
+        assert Settings(feed_max_concurrent_channels=16).feed_max_concurrent_channels == 16
+        with pytest.raises(ValidationError):
+            Settings(feed_max_concurrent_channels=17)
+
         # feed_max_videos: 10-100
         assert Settings(feed_max_videos=10).feed_max_videos == 10
         assert Settings(feed_max_videos=100).feed_max_videos == 100
@@ -164,6 +177,11 @@ class TestSettingsModel:
         assert data["ytdlp_timeout"] == 180
         assert "cache_video_ttl" in data
 
+    def test_dict_matches_model_dump(self):
+        """Test dict() gives the same values as model_dump(), which save_settings relies on."""
+        s = Settings(ytdlp_timeout=180, invidious_instance="https://invidious.example.com")
+        assert dict(s) == s.model_dump()
+
 
 class TestGetSettings:
     """Tests for get_settings function."""
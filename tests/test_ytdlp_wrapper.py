@@ -2,6 +2,7 @@
 
 import os
 import sys
+from unittest.mock import patch
 
 import pytest
 
@@ -12,6 +13,7 @@ from ytdlp_wrapper import (
     YtDlpError,
     build_search_sp,
     is_valid_url,
+    run_ytdlp_stream,
     sanitize_channel_id,
     sanitize_playlist_id,
     sanitize_video_id,
@@ -380,3 +382,41 @@ class TestYtDlpError:
         with pytest.raises(YtDlpError) as exc_info:
             raise YtDlpError("Test error")
         assert "Test error" in str(exc_info.value)
+
+
+# =============================================================================
+# Tests for run_ytdlp_stream
+# =============================================================================
+
+
+class TestRunYtdlpStream:
+    """Tests for run_ytdlp_stream, using the Python interpreter as a stand-in for yt-dlp."""
+
+    @pytest.fixture(autouse=True)
+    def fake_ytdlp(self):
+        """Point ytdlp_path at the current interpreter."""
+        with patch("ytdlp_wrapper._core.get_settings") as mock_settings:
+            mock_settings.return_value.ytdlp_path = sys.executable
+            mock_settings.return_value.ytdlp_timeout = 10
+            yield
+
+    async def _collect(self, *args, **kwargs):
+        return [line async for line in run_ytdlp_stream(*args, **kwargs)]
+
+    @pytest.mark.asyncio
+    async def test_yields_lines(self):
+        """Test each stdout line is yielded as bytes."""
+        lines = await self._collect("-c", "print('first'); print('second')")
+        assert lines == [b"first\n", b"second\n"]
+
+    @pytest.mark.asyncio
+    async def test_nonzero_exit_raises(self):
+        """Test a failing process raises YtDlpError with its stderr."""
+        with pytest.raises(YtDlpError, match="bad channel"):
+            await self._collect("-c", "import sys; print('x'); sys.stderr.write('bad channel'); sys.exit(1)")
+
+    @pytest.mark.asyncio
+    async def test_timeout_raises(self):
+        """Test a process exceeding the timeout is killed and raises YtDlpError."""
+        with pytest.raises(YtDlpError, match="timed out"):
+            await self._collect("-c", "import time; time.sleep(5)", timeout=0.2)
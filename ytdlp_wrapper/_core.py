@@ -2,13 +2,16 @@
 
 import asyncio
 import logging
-from typing import List, Optional, Tuple
+from typing import AsyncIterator, List, Optional, Tuple
 
 from settings import get_settings
 from ytdlp_wrapper._sanitize import YtDlpError, is_valid_url
 
 logger = logging.getLogger(__name__)
 
+# Per-line buffer limit for streamed output; full -j extraction lines can exceed asyncio's 64 KiB default
+_STREAM_LINE_LIMIT = 16 * 1024 * 1024
+
 
 def _separate_flags_and_urls(args: tuple) -> Tuple[List[str], List[str]]:
     """Separate yt-dlp arguments into flags and URLs.
@@ -26,23 +29,12 @@ def _separate_flags_and_urls(args: tuple) -> Tuple[List[str], List[str]]:
     return flags, urls
 
 
-async def run_ytdlp(*args: str, timeout: Optional[int] = None, url: Optional[str] = None) -> str:
-    """Run yt-dlp with given arguments and return stdout.
-
-    Security: URLs are automatically separated from flags and placed after '--'
-    to prevent command injection via URLs starting with '-'.
-
-    Args:
-        *args: yt-dlp arguments
-        timeout: Optional timeout in seconds
-        url: Optional URL hint for credential lookup (auto-detected from args if not provided)
+async def _build_command(args: tuple, url: Optional[str]) -> Tuple[List[str], List[str], Optional[str]]:
+    """Validate arguments and prepend credentials for a yt-dlp invocation.
 
     Returns:
-        stdout from yt-dlp
+        Tuple of (all_args, temp_files, url)
     """
-    s = get_settings()
-    timeout = timeout or s.ytdlp_timeout
-
     # Separate flags and URLs to prevent command injection
     flags, urls = _separate_flags_and_urls(args)
 
@@ -77,6 +69,36 @@ async def run_ytdlp(*args: str, timeout: Optional[int] = None, url: Optional[str
         all_args.append("--")
         all_args.extend(urls)
 
+    return all_args, temp_files, url
+
+
+def _cleanup_temp_files(temp_files: List[str]) -> None:
+    """Remove credential temp files created for a yt-dlp invocation."""
+    if temp_files:
+        import credentials
+
+        credentials.cleanup_temp_files(temp_files)
+
+
+async def run_ytdlp(*args: str, timeout: Optional[int] = None, url: Optional[str] = None) -> str:
+    """Run yt-dlp with given arguments and return stdout.
+
+    Security: URLs are automatically separated from flags and placed after '--'
+    to prevent command injection via URLs starting with '-'.
+
+    Args:
+        *args: yt-dlp arguments
+        timeout: Optional timeout in seconds
+        url: Optional URL hint for credential lookup (auto-detected from args if not provided)
+
+    Returns:
+        stdout from yt-dlp
+    """
+    s = get_settings()
+    timeout = timeout or s.ytdlp_timeout
+
+    all_args, temp_files, url = await _build_command(args, url)
+
     proc = await asyncio.create_subprocess_exec(
         s.ytdlp_path, *all_args, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
     )
@@ -86,18 +108,10 @@ async def run_ytdlp(*args: str, timeout: Optional[int] = None, url: Optional[str
     except asyncio.TimeoutError:
         proc.kill()
         await proc.wait()
-        # Clean up temp files
-        if temp_files:
-            import credentials
-
-            credentials.cleanup_temp_files(temp_files)
+        _cleanup_temp_files(temp_files)
         raise YtDlpError(f"yt-dlp timed out after {timeout} seconds")
 
-    # Clean up temp files
-    if temp_files:
-        import credentials
-
-        credentials.cleanup_temp_files(temp_files)
+    _cleanup_temp_files(temp_files)
 
     if proc.returncode != 0:
         error_msg = stderr.decode().strip() if stderr else "Unknown error"
@@ -108,3 +122,59 @@ async def run_ytdlp(*args: str, timeout: Optional[int] = None, url: Optional[str
     logger.debug(f"yt-dlp succeeded for URL: {url}")
 
     return stdout.decode()
+
+
+async def run_ytdlp_stream(
+    *args: str, timeout: Optional[int] = None, url: Optional[str] = None
+) -> AsyncIterator[bytes]:
+    """Run yt-dlp and yield stdout lines as they are produced.
+
+    Takes the same arguments and applies the same URL/credential handling as
+    run_ytdlp. The timeout covers the whole run. A timeout or non-zero exit
+    raises YtDlpError after any lines already yielded; closing the iterator
+    early kills the process.
+
+    Yields:
+        Raw stdout lines, including the trailing newline
+    """
+    s = get_settings()
+    timeout = timeout or s.ytdlp_timeout
+
+    all_args, temp_files, url = await _build_command(args, url)
+
+    proc = await asyncio.create_subprocess_exec(
+        s.ytdlp_path,
+        *all_args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        limit=_STREAM_LINE_LIMIT,
+    )
+    # Drain stderr concurrently so a full stderr pipe can't stall the process
+    stderr_task = asyncio.create_task(proc.stderr.read())
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    try:
+        while True:
+            line = await asyncio.wait_for(proc.stdout.readline(), timeout=max(deadline - loop.time(), 0))
+            if not line:
+                break
+            yield line
+        await asyncio.wait_for(proc.wait(), timeout=max(deadline - loop.time(), 0))
+        stderr = await stderr_task
+    except asyncio.TimeoutError:
+        raise YtDlpError(f"yt-dlp timed out after {timeout} seconds")
+    finally:
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+        stderr_task.cancel()
+        _cleanup_temp_files(temp_files)
+
+    if proc.returncode != 0:
+        error_msg = stderr.decode().strip() if stderr else "Unknown error"
+        logger.error(f"yt-dlp failed (exit code {proc.returncode}) for URL: {url}")
+        logger.error(f"yt-dlp stderr: {error_msg}")
+        raise YtDlpError(f"yt-dlp failed: {error_msg}")
+
+    logger.debug(f"yt-dlp succeeded for URL: {url}")
@@ -131,7 +131,7 @@ async def extract_channel_url(url: str, page: int = 1, per_page: int = 30, use_c
     entries = []
     channel_info = {}
 
-    for line in stdout.strip().split("\n"):
+    for line in stdout.splitlines():
         if line:
             try:
                 data = json.loads(line)
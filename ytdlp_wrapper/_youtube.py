@@ -124,7 +124,7 @@ async def search_videos(
         stdout = await run_ytdlp("-j", "--flat-playlist", "--no-warnings", f"ytsearch{count}:{query}")
 
     results = []
-    for line in stdout.strip().split("\n"):
+    for line in stdout.splitlines():
         if line:
             try:
                 results.append(json.loads(line))
@@ -201,7 +201,7 @@ async def get_channel_videos(channel_id: str, page: int = 1, per_page: int = 30)
     stdout = await run_ytdlp("-j", "--flat-playlist", "--no-warnings", "--playlist-items", f"{start}:{end}", url)
 
     results = []
-    for line in stdout.strip().split("\n"):
+    for line in stdout.splitlines():
         if line:
             try:
                 results.append(json.loads(line))
@@ -253,7 +253,7 @@ async def get_channel_tab(channel_id: str, tab: str, page: int = 1, per_page: in
     stdout = await run_ytdlp("-j", "--flat-playlist", "--no-warnings", "--playlist-items", f"{start}:{end}", url)
 
     results = []
-    for line in stdout.strip().split("\n"):
+    for line in stdout.splitlines():
         if line:
             try:
                 results.append(json.loads(line))
@@ -303,7 +303,7 @@ async def search_channel(channel_id: str, query: str, page: int = 1, per_page: i
     stdout = await run_ytdlp("-j", "--flat-playlist", "--no-warnings", "--playlist-items", f"{start}:{end}", url)
 
     results = []
-    for line in stdout.strip().split("\n"):
+    for line in stdout.splitlines():
         if line:
             try:
                 data = json.loads(line)